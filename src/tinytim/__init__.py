@@ -1,15 +1,22 @@
 __version__ = '1.12.0'
 
 
+import tinytim.arrays
+import tinytim.binary
+import tinytim.categorical
 import tinytim.columns
 import tinytim.copy
+import tinytim.csv
 import tinytim.data
 import tinytim.edit
 import tinytim.filter
 import tinytim.group
 import tinytim.insert
 import tinytim.join
+import tinytim.lazy
 import tinytim.na
 import tinytim.rows
+import tinytim.stream
 import tinytim.utils
 import tinytim.validate
+import tinytim.views
@@ -0,0 +1,170 @@
+"""
+Functions for storing numeric columns in compact array.array buffers.
+
+array columns hold machine values instead of boxed Python objects:
+typecode 'q' for int and 'd' for float columns.
+bool columns are left as lists: an array('b') reads back 1 and 0, not True and False.
+array columns can only store values of their type, so storing other values
+(such as None) in an array column raises TypeError; expand the column first.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from tinytim.categorical import Categorical
+from tinytim.custom_types import Column
+from tinytim.interfaces import SequenceItems
+
+INT_TYPECODE = 'q'
+FLOAT_TYPECODE = 'd'
+BOOL_TYPECODE = 'b'
+
+_INT_MIN = -2 ** 63
+_INT_MAX = 2 ** 63 - 1
+
+
+def is_array(values: Any) -> bool:
+    """Return if values is an array.array column."""
+    return isinstance(values, array)
+
+
+def column_typecode(values: Sequence[Any]) -> Optional[str]:
+    """
+    Return the array typecode that can store values, None if there is none.
+
+    Parameters
+    ----------
+    values : Sequence
+        column values
+
+    Returns
+    -------
+    str | None
+        'b' if all values are bool, 'q' if all are int within 64 bits,
+        'd' if all are float, None otherwise or if values is empty.
+
+    Examples
+    --------
+    >>> column_typecode([1, 2, 3])
+    'q'
+    >>> column_typecode([1.5, 2.0])
+    'd'
+    >>> column_typecode([1, None])
+    """
+    if is_array(values):
+        return values.typecode  # type: ignore[attr-defined, no-any-return]
+    if len(values) == 0:
+        return None
+    kinds = set(map(type, values))
+    if len(kinds) != 1:
+        return None
+    kind = kinds.pop()
+    if kind is bool:
+        return BOOL_TYPECODE
+    if kind is int:
+        if min(values) >= _INT_MIN and max(values) <= _INT_MAX:
+            return INT_TYPECODE
+        return None
+    if kind is float:
+        return FLOAT_TYPECODE
+    return None
+
+
+def compact_column(values: Sequence[Any]) -> Column:
+    """
+    Return a copy of values stored in an array if they all fit
+    the int or float typecode, otherwise a list copy of values.
+
+    Example
+    -------
+    >>> compact_column([1, 2, 3])
+    array('q', [1, 2, 3])
+    >>> compact_column([True, False])
+    [True, False]
+    """
+    typecode = column_typecode(values)
+    if typecode is None or typecode == BOOL_TYPECODE:
+        return list(values)
+    return array(typecode, values)
+
+
+def expand_column(values: Sequence[Any]) -> List[Any]:
+    """
+    Return a list copy of values, converting array columns back to Python objects.
+
+    Example
+    -------
+    >>> expand_column(array('b', [1, 0]))
+    [True, False]
+    """
+    if is_array(values):
+        if values.typecode == BOOL_TYPECODE:  # type: ignore[attr-defined]
+            return [bool(value) for value in values]
+        return values.tolist()  # type: ignore[attr-defined, no-any-return]
+    return list(values)
+
+
+def like_column(values: Sequence[Any], new_values: Iterable[Any]) -> Column:
+    """
+    Return new_values stored the same way as values:
+    an array with the same typecode if values is an array,
+    a Categorical with the same categories if values is a Categorical,
+    otherwise a list.
+
+    Example
+    -------
+    >>> like_column(array('q', [1, 2, 3]), [3, 2])
+    array('q', [3, 2])
+    >>> like_column([1, 2, 3], (3, 2))
+    [3, 2]
+    """
+    if is_array(values):
+        return array(values.typecode, new_values)  # type: ignore[attr-defined]
+    if isinstance(values, Categorical):
+        return values.like(new_values)
+    return list(new_values)
+
+
+def compact(data: SequenceItems) -> Dict[str, Column]:
+    """
+    Return a copy of data with numeric and bool columns stored in arrays.
+    Columns that do not fit one typecode are copied into lists.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+
+    Returns
+    -------
+    dict[str, list | array]
+
+    Example
+    -------
+    >>> data = {'x': [1, 2, 3], 'y': [1.5, 2.5, 3.5], 'z': ['a', 'b', 'c']}
+    >>> compact(data)
+    {'x': array('q', [1, 2, 3]), 'y': array('d', [1.5, 2.5, 3.5]), 'z': ['a', 'b', 'c']}
+    """
+    return {str(col): compact_column(values) for col, values in data.items()}
+
+
+def expand(data: SequenceItems) -> Dict[str, List[Any]]:
+    """
+    Return a copy of data with every column stored in a list.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+
+    Returns
+    -------
+    dict[str, list]
+
+    Example
+    -------
+    >>> data = {'x': array('q', [1, 2, 3]), 'z': ['a', 'b', 'c']}
+    >>> expand(data)
+    {'x': [1, 2, 3], 'z': ['a', 'b', 'c']}
+    """
+    return {str(col): expand_column(values) for col, values in data.items()}
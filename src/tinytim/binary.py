@@ -0,0 +1,433 @@
+"""
+Module used for storing data format in a binary columnar file.
+
+Each column is written as contiguous blocks, aligned to 8 bytes:
+
+- int, float and bool columns: little-endian int64, float64 or one byte per value
+- str columns: int64 offsets (one more than the rows) and the UTF-8 bytes
+- other columns: like str columns, with each value encoded as json;
+  only values json reads back unchanged (str, int, float, bool, None,
+  lists of them and dicts with str keys) can be stored
+- columns with None values: a validity bitmap, bit i set if row i is not None
+
+The schema (column names, types and block offsets) is a json footer
+at the end of the file, so columns are written one at a time.
+open_binary memory maps the file and reads only the footer;
+each column is decoded from the mapped blocks when it is read.
+
+Example
+-------
+>>> import os, tempfile
+>>> path = os.path.join(tempfile.mkdtemp(), 'data.tim')
+>>> write_binary({'x': [1, 2, None], 'y': ['a', 'b', 'c']}, path)
+>>> with open_binary(path) as table:
+...     table['x'][1], table['y'].tolist()
+(2, ['a', 'b', 'c'])
+>>> read_binary(path, columns=['x'])
+{'x': [1, 2, None]}
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence as SequenceABC
+from itertools import accumulate, compress, repeat
+from operator import is_not
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import tinytim.arrays as arrays_functions
+import tinytim.data as data_functions
+from tinytim.custom_types import DataDict, DataMapping
+
+Path = Union[str, 'os.PathLike[str]']
+
+MAGIC = b'TTIM'
+VERSION = 1
+
+# magic and version at the start of the file, 8 bytes to keep blocks aligned
+_HEADER = MAGIC + struct.pack('<I', VERSION)
+# footer length and magic at the end of the file
+_TRAILER = struct.Struct('<Q4s')
+_ALIGNMENT = 8
+
+# type name: (array typecode of stored values, memoryview format)
+_FIXED_TYPES = {
+    'int': (arrays_functions.INT_TYPECODE, 'q'),
+    'float': (arrays_functions.FLOAT_TYPECODE, 'd'),
+    'bool': (arrays_functions.BOOL_TYPECODE, '?'),
+}
+_TYPECODE_TYPES = {typecode: name for name, (typecode, _) in _FIXED_TYPES.items()}
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+_INVERT = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+# types json.loads returns exactly as they were dumped
+_JSON_SCALARS = frozenset([str, int, float, bool, type(None)])
+
+
+def write_binary(data: DataMapping, path: Path) -> None:
+    """
+    Write data to a binary columnar file.
+
+    Columns of int (within 64 bits), float, bool or str values, with or without None,
+    are stored natively; other columns are stored as json text per value.
+    The file is written under a temporary name and renamed to path when complete,
+    so an error never leaves a partial file at path.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    path : str | PathLike
+        file path to write
+
+    Raises
+    ------
+    ValueError
+        if the columns have different lengths, or a column holds values
+        json would not read back unchanged (tuples, dicts with non str keys, dates, ...)
+    """
+    rows = data_functions.row_count(data) if data_functions.column_count(data) else 0
+    columns = []
+    temp_path = f'{os.fspath(path)}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(_HEADER)
+            for col in data_functions.column_names(data):
+                values = data[col]
+                if len(values) != rows:
+                    raise ValueError('columns must all have the same length.')
+                columns.append(_write_column(file, str(col), values))
+            footer = json.dumps({'rows': rows, 'columns': columns}).encode()
+            file.write(footer)
+            file.write(_TRAILER.pack(len(footer), MAGIC))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def open_binary(path: Path) -> 'BinaryTable':
+    """
+    Open a binary columnar file as a read only table of lazily decoded columns.
+    Only the schema is read; column blocks are read from the memory map when used.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        file path written by write_binary
+
+    Returns
+    -------
+    BinaryTable
+        mapping of {column name: BinaryColumn}, close it (or use a with block) when done
+
+    Raises
+    ------
+    ValueError
+        if path is not a tinytim binary file
+    """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size < len(_HEADER) + _TRAILER.size:
+            raise ValueError(f'{path!r} is not a tinytim binary file.')
+        # mmap keeps its own handle, the file can be closed
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        footer_size, magic = _TRAILER.unpack(buffer[-_TRAILER.size:])
+        if buffer[:len(MAGIC)] != MAGIC or magic != MAGIC:
+            raise ValueError(f'{path!r} is not a tinytim binary file.')
+        version, = struct.unpack('<I', buffer[len(MAGIC):len(_HEADER)])
+        if version != VERSION:
+            raise ValueError(f'unsupported tinytim binary version {version}.')
+        end = size - _TRAILER.size
+        schema = json.loads(buffer[end - footer_size:end])
+    except BaseException:
+        buffer.close()
+        raise
+    return BinaryTable(buffer, schema)
+
+
+def read_binary(path: Path, columns: Optional[Sequence[str]] = None) -> DataDict:
+    """
+    Read a binary columnar file into data format, only reading the given columns.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        file path written by write_binary
+    columns : Sequence[str], optional
+        names of columns to read, in this order, all columns if None
+
+    Returns
+    -------
+    dict[str, list]
+    """
+    with open_binary(path) as table:
+        names = table.column_names() if columns is None else list(columns)
+        return {col: table[col].tolist() for col in names}
+
+
+class BinaryColumn(SequenceABC):  # type: ignore[type-arg]
+    """
+    Read only column decoded from the blocks of a binary columnar file.
+
+    Indexing decodes one value; iterating and tolist decode the whole column.
+    Columns can not be read after their table is closed.
+    """
+    def __init__(
+        self,
+        kind: str,
+        length: int,
+        values: memoryview,
+        offsets: Optional[Sequence[int]] = None,
+        validity: Optional[memoryview] = None
+    ) -> None:
+        self.kind = kind
+        self._length = length
+        self._values: Any = values
+        self._offsets = offsets
+        self._validity = validity
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._value(i) for i in range(self._length)[index]]
+        return self._value(range(self._length)[index])
+
+    def _value(self, index: int) -> Any:
+        if self._validity is not None and not self._validity[index >> 3] >> (index & 7) & 1:
+            return None
+        if self._offsets is None:
+            return self._values[index]
+        value = str(self._values[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+        return json.loads(value) if self.kind == 'json' else value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.tolist())
+
+    def tolist(self) -> List[Any]:
+        """Return a list of the decoded values."""
+        if self._offsets is None:
+            values: List[Any] = self._values.tolist()
+        else:
+            values = _decode_strings(bytes(self._values), self._offsets)
+            if self.kind == 'json':
+                values = list(map(json.loads, values))
+        if self._validity is not None:
+            missing = _unpack_bits(self._validity, self._length).translate(_INVERT)
+            for index in compress(range(self._length), missing):
+                values[index] = None
+        return values
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (BinaryColumn, list, tuple, array)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'BinaryColumn({self.kind!r}, length={self._length})'
+
+
+class BinaryTable(Mapping[str, BinaryColumn]):
+    """
+    Read only mapping of {column name: BinaryColumn} over a memory mapped file,
+    returned by open_binary. Columns are created when first read.
+    """
+    def __init__(self, buffer: mmap.mmap, schema: Dict[str, Any]) -> None:
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._views: List[memoryview] = [self._view]
+        self.rows: int = schema['rows']
+        self._schema = {column['name']: column for column in schema['columns']}
+        self._columns: Dict[str, BinaryColumn] = {}
+        self._closed = False
+
+    def column_names(self) -> List[str]:
+        """Return the column names in file order."""
+        return list(self._schema)
+
+    def column_types(self) -> Dict[str, str]:
+        """Return {column name: stored type name}."""
+        return {name: column['type'] for name, column in self._schema.items()}
+
+    def __getitem__(self, key: str) -> BinaryColumn:
+        if key not in self._columns:
+            if self._closed:
+                raise ValueError('read of closed binary table.')
+            self._columns[key] = self._make_column(self._schema[key])
+        return self._columns[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema)
+
+    def __len__(self) -> int:
+        return len(self._schema)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._schema
+
+    def _block(self, start: int, size: int) -> memoryview:
+        view = self._view[start:start + size]
+        self._views.append(view)
+        return view
+
+    def _make_column(self, column: Dict[str, Any]) -> BinaryColumn:
+        kind = column['type']
+        validity = None
+        if column['validity'] is not None:
+            validity = self._block(column['validity'], (self.rows + 7) // 8)
+        if kind in _FIXED_TYPES:
+            typecode, fmt = _FIXED_TYPES[kind]
+            size = self.rows * array(typecode).itemsize
+            values = self._block(column['values'], size)
+            if _LITTLE_ENDIAN:
+                values = values.cast(fmt)  # type: ignore[call-overload]
+                self._views.append(values)
+            else:
+                swapped = array(typecode)
+                swapped.frombytes(values)
+                swapped.byteswap()
+                values = memoryview(swapped).cast('B').cast(fmt)  # type: ignore[call-overload]
+            return BinaryColumn(kind, self.rows, values, None, validity)
+        offsets = self._block(column['offsets'], (self.rows + 1) * 8)
+        if _LITTLE_ENDIAN:
+            offsets = offsets.cast('q')
+            self._views.append(offsets)
+            string_offsets: Sequence[int] = offsets
+        else:
+            string_offsets = array('q')
+            string_offsets.frombytes(offsets)
+            string_offsets.byteswap()
+        values = self._block(column['values'], string_offsets[-1])
+        return BinaryColumn(kind, self.rows, values, string_offsets, validity)
+
+    def close(self) -> None:
+        """Release the column blocks and unmap the file."""
+        for view in reversed(self._views):
+            view.release()
+        self._buffer.close()
+        self._closed = True
+
+    def __enter__(self) -> 'BinaryTable':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'BinaryTable(rows={self.rows}, columns={self.column_names()})'
+
+
+def _write_column(file: IO[bytes], name: str, values: Sequence[Any]) -> Dict[str, Any]:
+    """Write the blocks of one column and return its schema entry."""
+    present: Sequence[Any] = values
+    valid = None
+    if not arrays_functions.is_array(values) and None in values:
+        valid = bytes(map(is_not, values, repeat(None)))
+        present = list(compress(values, valid))
+    kind = _column_kind(present)
+    column: Dict[str, Any] = {'name': name, 'type': kind, 'values': None, 'offsets': None, 'validity': None}
+    if kind in _FIXED_TYPES:
+        typecode = _FIXED_TYPES[kind][0]
+        if valid is None and arrays_functions.is_array(values) and values.typecode == typecode:  # type: ignore[attr-defined]
+            stored = values
+        else:
+            default = (0, 0.0, False)[list(_FIXED_TYPES).index(kind)]
+            stored = array(typecode, values if valid is None else [default if value is None else value for value in values])
+        if not _LITTLE_ENDIAN:
+            stored = array(typecode, stored)
+            stored.byteswap()  # type: ignore[attr-defined]
+        column['values'] = _write_block(file, stored)
+    else:
+        strings = values if valid is None else ['' if value is None else value for value in values]
+        if kind == 'json':
+            lossy = next((value for value in present if not _is_json_exact(value)), None)
+            if lossy is not None:
+                raise ValueError(f'column {name!r} value {lossy!r} would not read back unchanged from json.')
+            strings = list(map(json.dumps, strings))
+        data, offsets = _encode_strings(strings)
+        column['offsets'] = _write_block(file, offsets)
+        column['values'] = _write_block(file, data)
+    if valid is not None:
+        column['validity'] = _write_block(file, _pack_bits(valid))
+    return column
+
+
+def _column_kind(values: Sequence[Any]) -> str:
+    """Return the stored type name of column values that are not None."""
+    typecode = arrays_functions.column_typecode(values)
+    if typecode is not None:
+        return _TYPECODE_TYPES[typecode]
+    if all(type(value) is str for value in values):
+        return 'str'
+    return 'json'
+
+
+def _is_json_exact(value: Any) -> bool:
+    """Return if json.loads(json.dumps(value)) gives back an equal value of the same types."""
+    kind = type(value)
+    if kind in _JSON_SCALARS:
+        return True
+    if kind is list:
+        return all(map(_is_json_exact, value))
+    if kind is dict:
+        return all(type(key) is str and _is_json_exact(item) for key, item in value.items())
+    return False
+
+
+def _write_block(file: IO[bytes], block: Any) -> int:
+    """Write block at the next aligned position and return that position."""
+    position = file.tell()
+    padding = -position % _ALIGNMENT
+    file.write(bytes(padding))
+    file.write(block)
+    return position + padding
+
+
+def _encode_strings(strings: Sequence[str]) -> Tuple[bytes, 'array[int]']:
+    """Return the UTF-8 bytes of strings and the byte offsets of each string."""
+    text = ''.join(strings)
+    data = text.encode()
+    # ascii: byte offsets are character offsets
+    lengths = map(len, strings) if len(data) == len(text) else map(len, map(str.encode, strings))
+    offsets = array('q', accumulate(lengths, initial=0))
+    if not _LITTLE_ENDIAN:
+        offsets.byteswap()
+    return data, offsets
+
+
+def _decode_strings(data: bytes, offsets: Sequence[int]) -> List[str]:
+    """Return the strings of UTF-8 data between offsets."""
+    slices = map(slice, offsets[:-1], offsets[1:])  # type: ignore[index]
+    text = data.decode()
+    if len(text) == len(data):
+        return list(map(text.__getitem__, slices))
+    return list(map(str, map(data.__getitem__, slices), repeat('utf-8')))
+
+
+def _pack_bits(mask: bytes) -> bytes:
+    """Return a bitmap of a mask of 0/1 bytes, bit i of byte i // 8 set for mask[i]."""
+    mask += bytes(-len(mask) % 8)
+    bits = 0
+    for bit in range(8):
+        # bytes of 0/1 shifted by at most 7 never carry into the next byte
+        bits |= int.from_bytes(mask[bit::8], 'little') << bit
+    return bits.to_bytes(len(mask) // 8, 'little')
+
+
+def _unpack_bits(bitmap: Any, length: int) -> bytes:
+    """Return the mask of 0/1 bytes of the first length bits of bitmap."""
+    size = len(bitmap)
+    bits = int.from_bytes(bitmap, 'little')
+    ones = int.from_bytes(b'\x01' * size, 'little')
+    mask = bytearray(size * 8)
+    for bit in range(8):
+        mask[bit::8] = (bits >> bit & ones).to_bytes(size, 'little')
+    return bytes(mask[:length])
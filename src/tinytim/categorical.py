@@ -0,0 +1,283 @@
+"""
+Dictionary encoded columns for values with few distinct values.
+
+A Categorical column stores each row as an int code in an array('i')
+and each distinct value once in its categories list.
+tinytim.filter, tinytim.group and tinytim.join work on the codes:
+comparisons are made once per category and gathered for every row,
+and rows are grouped and joined by code instead of by value.
+
+Values are matched like dict keys, so values that compare equal
+(such as 1 and 1.0) share a category. Values must be hashable.
+
+Example
+-------
+>>> column = Categorical(['UK', 'US', 'UK', 'FR'])
+>>> column.codes, column.categories
+(array('i', [0, 1, 0, 2]), ['UK', 'US', 'FR'])
+>>> column[1], list(column)
+('US', ['UK', 'US', 'UK', 'FR'])
+"""
+
+import sys
+from array import array
+from collections.abc import MutableSequence
+from itertools import compress, repeat
+from operator import add, mul
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+CODE_TYPECODE = 'i'
+
+# masks of columns with at most this many categories are built from the low byte of each code
+_BYTE_CODES = 256
+
+
+class Categorical(MutableSequence):  # type: ignore[type-arg]
+    """
+    Column of values stored as int codes into a list of distinct categories.
+
+    The categories list is never changed in place: adding a category
+    replaces it, so columns sliced or filtered from this one can share it.
+
+    Parameters
+    ----------
+    values : Iterable, optional
+        column values to encode
+    categories : Sequence, optional
+        categories to start with, in code order; new values are added after them
+
+    Example
+    -------
+    >>> column = Categorical(['b', 'a'], categories=['a', 'b', 'c'])
+    >>> column.codes
+    array('i', [1, 0])
+    >>> column.append('d')
+    >>> column.categories
+    ['a', 'b', 'c', 'd']
+    """
+    codes: 'array[int]'
+    categories: List[Any]
+
+    def __init__(self, values: Iterable[Any] = (), categories: Optional[Sequence[Any]] = None) -> None:
+        self.codes = array(CODE_TYPECODE)
+        self.categories = [] if categories is None else list(categories)
+        self._index = {value: code for code, value in enumerate(self.categories)}
+        if len(self._index) != len(self.categories):
+            raise ValueError('categories must be distinct.')
+        self.extend(values)
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[int], categories: Sequence[Any]) -> 'Categorical':
+        """
+        Return a Categorical of existing codes into categories.
+
+        Example
+        -------
+        >>> Categorical.from_codes([1, 1, 0], ['x', 'y'])
+        Categorical(['y', 'y', 'x'])
+        """
+        column = cls(categories=categories)
+        column.codes = array(CODE_TYPECODE, codes)
+        if column.codes and (min(column.codes) < 0 or max(column.codes) >= len(column.categories)):
+            raise ValueError('codes must be indexes of categories.')
+        return column
+
+    def _share(self, codes: 'array[int]') -> 'Categorical':
+        """Return a Categorical of codes sharing this column's categories."""
+        column = Categorical.__new__(Categorical)
+        column.codes = codes
+        column.categories = self.categories
+        column._index = self._index
+        return column
+
+    def _add_categories(self, values: Iterable[Any]) -> None:
+        """Add the values that are not categories yet, in first seen order."""
+        new = [value for value in dict.fromkeys(values) if value not in self._index]
+        if new:
+            start = len(self.categories)
+            self.categories = self.categories + new
+            self._index = {**self._index, **{value: code for code, value in enumerate(new, start)}}
+
+    def _encode(self, values: Iterable[Any]) -> 'array[int]':
+        """Return the codes of values, adding new categories."""
+        if isinstance(values, Categorical):
+            if values.categories is self.categories:
+                return array(CODE_TYPECODE, values.codes)
+            self._add_categories(values.categories)
+            mapping = array(CODE_TYPECODE, map(self._index.__getitem__, values.categories))
+            return array(CODE_TYPECODE, map(mapping.__getitem__, values.codes))
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        if self._index:
+            try:
+                return array(CODE_TYPECODE, map(self._index.__getitem__, values))
+            except KeyError:
+                pass
+        self._add_categories(values)
+        return array(CODE_TYPECODE, map(self._index.__getitem__, values))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.categories.__getitem__, self.codes)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return self._share(self.codes[index])
+        return self.categories[self.codes[index]]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            self.codes[index] = self._encode(value)
+        else:
+            self.codes[index] = self._encode([value])[0]
+
+    def __delitem__(self, index: Any) -> None:
+        del self.codes[index]
+
+    def insert(self, index: int, value: Any) -> None:
+        self.codes.insert(index, self._encode([value])[0])
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append values, encoding them all at once."""
+        self.codes.extend(self._encode(values))
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            code = self._index.get(value)
+        except TypeError:
+            return False
+        return code is not None and code in self.codes
+
+    def tolist(self) -> List[Any]:
+        """Return a list of the decoded values."""
+        return list(self)
+
+    def unique(self) -> List[Any]:
+        """
+        Return the distinct values in the column in first seen order,
+        leaving out categories that no row uses.
+
+        Example
+        -------
+        >>> Categorical(['b', 'a', 'b'])[1:].unique()
+        ['a', 'b']
+        """
+        return list(map(self.categories.__getitem__, dict.fromkeys(self.codes)))
+
+    def mask(self, flags: Sequence[Any]) -> bytes:
+        """
+        Return the mask of rows whose category is flagged,
+        flags has one truthy or falsy item per category.
+
+        Example
+        -------
+        >>> Categorical(['a', 'b', 'a']).mask([True, False])
+        b'\\x01\\x00\\x01'
+        """
+        flags = bytes(map(bool, flags))
+        if len(self.categories) <= _BYTE_CODES:
+            # every code fits its lowest byte: map bytes to flags in one C call
+            itemsize = self.codes.itemsize
+            low_bytes = self.codes.tobytes()[0 if sys.byteorder == 'little' else itemsize - 1::itemsize]
+            return low_bytes.translate(flags.ljust(_BYTE_CODES, b'\x00'))
+        return bytes(map(flags.__getitem__, self.codes))
+
+    def mask_where(self, func: Callable[[Any], Any]) -> bytes:
+        """
+        Return the mask of rows where func(value) is truthy,
+        calling func once for each category.
+        Errors raised by func for categories no row uses are ignored.
+
+        Example
+        -------
+        >>> column = Categorical(['a', 'b', 'a'], categories=['a', 'b', None])
+        >>> column.mask_where(lambda value: value > 'a')
+        b'\\x00\\x01\\x00'
+        """
+        flags = bytearray(len(self.categories))
+        used = None
+        for code, category in enumerate(self.categories):
+            try:
+                flags[code] = bool(func(category))
+            except Exception:
+                if used is None:
+                    used = set(self.codes)
+                if code in used:
+                    raise
+        return self.mask(flags)
+
+    def take(self, indexes: Iterable[int]) -> 'Categorical':
+        """Return the rows at indexes, sharing categories."""
+        return self._share(array(CODE_TYPECODE, map(self.codes.__getitem__, indexes)))
+
+    def compress(self, mask: Iterable[Any]) -> 'Categorical':
+        """Return the rows where mask is True, sharing categories."""
+        return self._share(array(CODE_TYPECODE, compress(self.codes, mask)))
+
+    def recode(self, categories: Sequence[Any]) -> 'Categorical':
+        """
+        Return the column encoded with categories, followed by the column's other categories.
+
+        Example
+        -------
+        >>> Categorical(['b', 'c']).recode(['a', 'b']).codes
+        array('i', [1, 2])
+        """
+        column = Categorical(categories=categories)
+        column.codes = column._encode(self)
+        return column
+
+    def like(self, values: Iterable[Any]) -> 'Categorical':
+        """Return values encoded with this column's categories."""
+        column = self._share(array(CODE_TYPECODE))
+        column.extend(values)
+        return column
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Categorical) and other.categories is self.categories:
+            return self.codes == other.codes
+        if isinstance(other, (Categorical, list, tuple, array)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'Categorical({self.tolist()!r})'
+
+
+def is_categorical(values: Any) -> bool:
+    """Return if values is a Categorical column."""
+    return isinstance(values, Categorical)
+
+
+def categorize(data: Mapping[str, Sequence[Any]], column_names: Sequence[str]) -> Dict[str, Sequence[Any]]:
+    """
+    Return a copy of data with column_names encoded as Categorical columns.
+    Other columns are shared, not copied.
+
+    Example
+    -------
+    >>> data = {'country': ['UK', 'US', 'UK'], 'x': [1, 2, 3]}
+    >>> categorize(data, ['country'])
+    {'country': Categorical(['UK', 'US', 'UK']), 'x': [1, 2, 3]}
+    """
+    return {col: Categorical(values) if col in column_names else values for col, values in data.items()}
+
+
+def combined_codes(columns: Sequence[Categorical]) -> List[int]:
+    """
+    Return one int per row identifying its combination of codes across columns,
+    so rows can be grouped by several categorical columns without building tuples.
+
+    Example
+    -------
+    >>> combined_codes([Categorical(['a', 'b', 'a']), Categorical(['x', 'x', 'y'])])
+    [0, 2, 1]
+    """
+    keys: Iterable[int] = columns[0].codes
+    for column in columns[1:]:
+        keys = map(add, map(mul, keys, repeat(len(column.categories))), column.codes)
+    return list(keys)
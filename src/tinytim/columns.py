@@ -1,9 +1,9 @@
 """Description: Functions for operating on columns of data."""
 
-from typing import Any, Generator, List, Tuple
+from typing import Generator, Tuple
 
 import tinytim.data as data_functions
-from tinytim.custom_types import DataDict
+from tinytim.custom_types import Column, DataDict
 from tinytim.interfaces import GetSequence, KeyNamesGetSequence
 from tinytim.sequences import (
     add_to_sequence,
@@ -53,7 +53,7 @@ def column_mapping(data: GetSequence, col: str) -> DataDict:
     return {col: data_functions.column_values(data, col)}
 
 
-def itercolumns(data: KeyNamesGetSequence) -> Generator[Tuple[str, List[Any]], None, None]:
+def itercolumns(data: KeyNamesGetSequence) -> Generator[Tuple[str, Column], None, None]:
     """
     Return a generator of tuple column name, column values.
 
@@ -1,16 +1,156 @@
 import copy
-from typing import Any, Sequence, TypeVar
+from collections.abc import ItemsView, ValuesView
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
 
-from tinytim.custom_types import DataMapping
+from tinytim.arrays import like_column
+from tinytim.custom_types import Column, DataMapping
+from tinytim.interfaces import GetSequence, SequenceItems
 
 TypeVarDataMapping = TypeVar('TypeVarDataMapping', bound='DataMapping')
 TypeVarSequence = TypeVar('TypeVarSequence', bound='Sequence[Any]')
 
+_MISSING = object()
 
-def copy_table(data: TypeVarDataMapping) -> TypeVarDataMapping:
+
+class CopyOnWriteTable(Dict[str, Column]):
+    """
+    Table dict that shares column buffers with the tables it was copied
+    from or to. A shared column is copied the first time it is looked up,
+    so only the columns that get used are copied and a shared buffer is
+    never handed out.
+
+    Example
+    -------
+    >>> table = CopyOnWriteTable({'x': [1, 2, 3], 'y': [6, 7, 8]})
+    >>> edited = table.copy()
+    >>> edited['x'][0] = 11
+    >>> edited
+    {'x': [11, 2, 3], 'y': [6, 7, 8]}
+    >>> table
+    {'x': [1, 2, 3], 'y': [6, 7, 8]}
+    >>> edited.shared_columns()
+    ['y']
+    """
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # shared column name: whether its values must be deep copied
+        self._shared: Dict[str, bool] = {}
+
+    def __getitem__(self, key: str) -> Column:
+        values = super().__getitem__(key)
+        if key in self._shared:
+            values = _deepcopy_column(values) if self._shared.pop(key) else like_column(values, values)
+            super().__setitem__(key, values)
+        return values
+
+    def __setitem__(self, key: str, values: Column) -> None:
+        super().__setitem__(key, values)
+        self._shared.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._shared.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        # keeps dict(table) and {**table} from reading the buffers directly
+        return super().__iter__()
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self) -> ValuesView[Column]:  # type: ignore[override]
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, Column]:  # type: ignore[override]
+        return ItemsView(self)
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:  # type: ignore[override]
+        if key not in self:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        values = self[key]
+        del self[key]
+        return values
+
+    def popitem(self) -> Tuple[str, Column]:
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: Optional[Column] = None) -> Column:  # type: ignore[override]
+        if key not in self:
+            self[key] = default  # type: ignore[assignment]
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        for key, values in dict(*args, **kwargs).items():
+            self[key] = values
+
+    def clear(self) -> None:
+        super().clear()
+        self._shared.clear()
+
+    def __or__(self, other: Any) -> 'CopyOnWriteTable':  # type: ignore[override]
+        table = self.copy()
+        table.update(other)
+        return table
+
+    def __ior__(self, other: Any) -> 'CopyOnWriteTable':  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def copy(self) -> 'CopyOnWriteTable':  # type: ignore[override]
+        """Return a copy sharing every column buffer with this table."""
+        return CopyOnWriteTable.share(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return CopyOnWriteTable, (dict(self.items()),)
+
+    def __copy__(self) -> 'CopyOnWriteTable':
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'CopyOnWriteTable':
+        return CopyOnWriteTable((col, copy.deepcopy(values, memo)) for col, values in super().items())
+
+    def shared_columns(self) -> List[str]:
+        """Return the names of columns still sharing their buffer with another table."""
+        return [col for col in self.keys() if col in self._shared]
+
+    @classmethod
+    def share(cls, data: SequenceItems, deep: bool = False) -> 'CopyOnWriteTable':
+        """
+        Return a table sharing every column buffer of data,
+        copying a column the first time either table looks it up.
+        If deep is True, the values in each column are deep copied too.
+        """
+        if isinstance(data, CopyOnWriteTable):
+            table = cls(dict.items(data))
+            for col in table:
+                pending = data._shared.setdefault(col, False)
+                table._shared[col] = deep or pending
+            return table
+        table = cls((str(col), values) for col, values in data.items())
+        table._shared = dict.fromkeys(table, deep)
+        return table
+
+
+def _deepcopy_column(values: Sequence[Any]) -> Column:
+    if isinstance(values, list):
+        return copy.deepcopy(values)
+    return like_column(values, copy.deepcopy(list(values)))
+
+
+def copy_table(data: SequenceItems) -> CopyOnWriteTable:
     """
     Copy data and return the copy.
 
+    The copy shares the column buffers of data and deep copies
+    each column the first time it is looked up, so changes made
+    in place to data before then show up in the copy.
+
     Parameters
     ----------
     data : MutableMapping[str, MutableSequence]
@@ -18,7 +158,7 @@ def copy_table(data: TypeVarDataMapping) -> TypeVarDataMapping:
 
     Returns
     -------
-    MutableMapping[str, MutableSequence]
+    CopyOnWriteTable
         copy of data
 
     Example
@@ -27,7 +167,60 @@ def copy_table(data: TypeVarDataMapping) -> TypeVarDataMapping:
     >>> copy_table(data)
     {'x': [1, 2, 3], 'y': [6, 7, 8]}
     """
-    return copy.deepcopy(data)
+    return CopyOnWriteTable.share(data, deep=True)
+
+
+def copy_on_write(data: SequenceItems) -> CopyOnWriteTable:
+    """
+    Return a CopyOnWriteTable of data for functions that return an edited table.
+
+    The table shares the column buffers of data until a column is looked up,
+    so editing one column copies only that column.
+    Column values are not copied.
+
+    Example
+    -------
+    >>> data = {'x': [1, 2, 3], 'y': [6, 7, 8]}
+    >>> table = copy_on_write(data)
+    >>> table['x'].append(4)
+    >>> data
+    {'x': [1, 2, 3], 'y': [6, 7, 8]}
+    >>> table.shared_columns()
+    ['y']
+    """
+    return CopyOnWriteTable.share(data)
+
+
+def read_column(data: GetSequence, column_name: str) -> Sequence[Any]:
+    """
+    Return data's named column without copying a shared CopyOnWriteTable column.
+    The column must only be read, never changed in place.
+
+    Example
+    -------
+    >>> data = {'x': [1, 2, 3]}
+    >>> read_column(copy_on_write(data), 'x') is data['x']
+    True
+    """
+    if isinstance(data, CopyOnWriteTable):
+        return dict.__getitem__(data, column_name)
+    return data[column_name]
+
+
+def read_columns(data: SequenceItems) -> Mapping[str, Sequence[Any]]:
+    """
+    Return a mapping of data's columns without copying shared CopyOnWriteTable columns.
+    The columns must only be read, never changed in place.
+
+    Example
+    -------
+    >>> data = {'x': [1, 2, 3]}
+    >>> read_columns(copy_on_write(data))['x'] is data['x']
+    True
+    """
+    if isinstance(data, CopyOnWriteTable):
+        return dict(dict.items(data))
+    return data  # type: ignore[return-value]
 
 
 def deepcopy_table(data: TypeVarDataMapping) -> TypeVarDataMapping:
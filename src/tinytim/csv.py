@@ -0,0 +1,373 @@
+"""
+Module used for reading csv files into data format and writing data format to csv files.
+
+Rows are parsed straight into columns, chunk by chunk, without building row dicts.
+iter_csv yields data chunks that can be processed with tinytim.stream.
+
+Example
+-------
+>>> import io
+>>> text = 'x,y,z\\n1,a,0.5\\n2,b,\\n'
+>>> read_csv(io.StringIO(text), columns=['x', 'z'], infer_types=True)
+{'x': [1, 2], 'z': [0.5, None]}
+"""
+
+import csv
+import io
+import re
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Pattern, Sequence, Tuple
+
+import tinytim.data as data_functions
+import tinytim.utils as utils_functions
+from tinytim.custom_types import DataDict, DataMapping, PathOrFile
+
+Converter = Callable[[str], Any]
+
+# tried in order by infer_types, str columns are left as parsed
+INFER_TYPES: Tuple[Converter, ...] = (int, float)
+
+# int() and float() also accept '1_000', surrounding whitespace, unicode digits,
+# 'nan' and 'inf'. Inferred columns must only hold the characters of plain numbers,
+# found with one regex search over the newline joined column, so the converter
+# accepts exactly the plain number syntax. Explicit types are not checked.
+_INFER_INVALID: Dict[Converter, Pattern[str]] = {
+    int: re.compile(r'[^0-9+\-\n]'),
+    float: re.compile(r'[^0-9+\-.eE\n]'),
+}
+
+# rows parsed at a time by read_csv, small chunks keep the parsed row lists short lived
+_READ_CHUNK_SIZE = 10_000
+
+
+def convert_column(
+    values: Sequence[str],
+    converter: Converter,
+    na_values: Collection[str] = ('',),
+    missing_value: Any = None
+) -> List[Any]:
+    """
+    Return column strings converted with converter, na_values replaced with missing_value.
+
+    Example
+    -------
+    >>> convert_column(['1', '', '3'], int)
+    [1, None, 3]
+    """
+    na_values = set(na_values)
+    if na_values.isdisjoint(values):
+        return list(map(converter, values))
+    return [missing_value if value in na_values else converter(value) for value in values]
+
+
+def infer_column(
+    values: Sequence[str],
+    na_values: Collection[str] = ('',),
+    missing_value: Any = None,
+    converters: Sequence[Converter] = INFER_TYPES
+) -> Tuple[Optional[Converter], List[Any]]:
+    """
+    Return the first converter that converts every value of the column
+    and the converted values, or None and the strings if none do.
+    int and float only convert values written as plain numbers,
+    not ' 1', '1_000', 'nan' or 'inf'.
+
+    Example
+    -------
+    >>> infer_column(['1', '2.5', ''])
+    (<class 'float'>, [1.0, 2.5, None])
+    >>> infer_column(['1', 'b'])
+    (None, ['1', 'b'])
+    >>> infer_column(['1', 'nan'])
+    (None, ['1', 'nan'])
+    """
+    for converter in converters:
+        try:
+            return converter, _convert_inferred(values, converter, na_values, missing_value)
+        except (TypeError, ValueError):
+            continue
+    return None, list(values)
+
+
+def _convert_inferred(
+    values: Sequence[str],
+    converter: Converter,
+    na_values: Collection[str],
+    missing_value: Any
+) -> List[Any]:
+    """Convert values with an inferred converter, raise ValueError if they are not all plain numbers."""
+    invalid = _INFER_INVALID.get(converter)
+    if invalid is not None:
+        na_values = set(na_values)
+        present = values if na_values.isdisjoint(values) else [value for value in values if value not in na_values]
+        text = '\n'.join(present)
+        # a newline inside a value would hide whitespace that float() strips
+        if present and (invalid.search(text) or text.count('\n') != len(present) - 1):
+            raise ValueError(f'column values are not all plain {getattr(converter, "__name__", converter)} numbers.')
+    return convert_column(values, converter, na_values, missing_value)
+
+
+def iter_csv(
+    path_or_file: PathOrFile,
+    chunk_size: int = 100_000,
+    columns: Optional[Sequence[str]] = None,
+    types: Optional[Mapping[str, Converter]] = None,
+    infer_types: bool = False,
+    na_values: Collection[str] = ('',),
+    missing_value: Any = None,
+    encoding: str = 'utf-8',
+    **fmtparams: Any
+) -> Iterator[DataDict]:
+    """
+    Read a csv file with a header row in chunks of chunk_size rows.
+
+    Parameters
+    ----------
+    path_or_file : str | PathLike | file
+        csv file path or open text file
+    chunk_size : int, default 100_000
+        number of rows in each chunk, the last chunk can be shorter
+    columns : Sequence[str], optional
+        names of columns to keep, in this order, all columns if None.
+        Other columns are not stored or converted.
+    types : Mapping[str, Callable[[str], Any]], optional
+        {column name: converter} for columns to convert, such as int or float
+    infer_types : bool, default False
+        convert columns not in types to the first of int or float that
+        converts every value, leaving other columns as strings.
+        Only plain numbers are inferred: ' 1', '1_000', 'nan' and 'inf' stay strings.
+        Each column keeps the type inferred from earlier chunks
+        until a chunk does not convert, then it is widened (int to float to str).
+    na_values : Collection[str], default ('',)
+        strings that are missing values in converted columns
+    missing_value : Any, default None
+        value stored for na_values in converted columns
+    encoding : str, default 'utf-8'
+        encoding used to open path_or_file paths
+    **fmtparams
+        csv.reader format parameters, such as delimiter
+
+    Returns
+    -------
+    Iterator[dict[str, list]]
+
+    Raises
+    ------
+    ValueError
+        if a column is not in the header or a row has more fields than the header
+
+    Example
+    -------
+    >>> import io
+    >>> chunks = iter_csv(io.StringIO('x,y\\n1,a\\n2,b\\n3,c\\n'), 2, types={'x': int})
+    >>> list(chunks)
+    [{'x': [1, 2], 'y': ['a', 'b']}, {'x': [3], 'y': ['c']}]
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    with utils_functions.open_file(path_or_file, 'r', encoding) as file:
+        # skip blank lines like csv.DictReader
+        reader = filter(None, csv.reader(file, **fmtparams))
+        header = next(reader, None)
+        if header is None:
+            return
+        names = list(header) if columns is None else list(columns)
+        missing = [col for col in names if col not in header]
+        if missing:
+            raise ValueError(f'columns {missing} are not in the csv header.')
+        getter = _row_getter(header, names)
+        inferred: Dict[str, Optional[Converter]] = {}
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            strings = _transpose(rows, len(header), getter, len(names))
+            chunk: DataDict = {}
+            for col, values in zip(names, strings):
+                chunk[col] = _convert_chunk_column(col, values, types or {}, inferred, infer_types, na_values, missing_value)
+            yield chunk
+
+
+def _row_getter(header: Sequence[str], names: Sequence[str]) -> Optional[Callable[[List[str]], Any]]:
+    """Return itemgetter of names fields from a row, None if names are the whole header in order."""
+    if list(names) == list(header):
+        return None
+    return itemgetter(*(list(header).index(col) for col in names))
+
+
+def _transpose(
+    rows: List[List[str]],
+    width: int,
+    getter: Optional[Callable[[List[str]], Any]],
+    count: int
+) -> Iterable[Sequence[str]]:
+    """Return the columns of csv rows, short rows padded with empty strings."""
+    lengths = set(map(len, rows))
+    if max(lengths) > width:
+        raise ValueError('csv row has more fields than the header.')
+    if lengths != {width}:
+        rows = [row + [''] * (width - len(row)) for row in rows]
+    if getter is None:
+        return zip(*rows)
+    if count == 1:
+        return [list(map(getter, rows))]
+    return zip(*map(getter, rows))
+
+
+def _convert_chunk_column(
+    col: str,
+    values: Sequence[str],
+    types: Mapping[str, Converter],
+    inferred: Dict[str, Optional[Converter]],
+    infer_types: bool,
+    na_values: Collection[str],
+    missing_value: Any
+) -> List[Any]:
+    """Convert a chunk column with its given type or the type inferred from earlier chunks."""
+    if col in types:
+        return convert_column(values, types[col], na_values, missing_value)
+    if not infer_types:
+        return list(values)
+    candidates = INFER_TYPES
+    if col in inferred:
+        converter = inferred[col]
+        if converter is None:
+            return list(values)
+        try:
+            return _convert_inferred(values, converter, na_values, missing_value)
+        except (TypeError, ValueError):
+            # only widen, so later chunks never switch back to a narrower type
+            candidates = INFER_TYPES[INFER_TYPES.index(converter) + 1:]
+    inferred[col], converted = infer_column(values, na_values, missing_value, candidates)
+    return converted
+
+
+def read_csv(
+    path_or_file: PathOrFile,
+    columns: Optional[Sequence[str]] = None,
+    types: Optional[Mapping[str, Converter]] = None,
+    infer_types: bool = False,
+    na_values: Collection[str] = ('',),
+    missing_value: Any = None,
+    encoding: str = 'utf-8',
+    **fmtparams: Any
+) -> DataDict:
+    """
+    Read a csv file with a header row into data format.
+
+    Same parameters as iter_csv, types are inferred over whole columns.
+
+    Example
+    -------
+    >>> import io
+    >>> read_csv(io.StringIO('x,y\\n1,a\\n2,b\\n'))
+    {'x': ['1', '2'], 'y': ['a', 'b']}
+    """
+    data: DataDict = {}
+    for chunk in iter_csv(path_or_file, _READ_CHUNK_SIZE, columns, types, False, na_values, missing_value, encoding, **fmtparams):
+        for col, values in chunk.items():
+            data.setdefault(col, []).extend(values)
+    if infer_types:
+        for col in data_functions.column_names(data):
+            if types is None or col not in types:
+                data[col] = infer_column(data[col], na_values, missing_value)[1]
+    return data
+
+
+def write_csv(
+    data: DataMapping,
+    path_or_file: PathOrFile,
+    columns: Optional[Sequence[str]] = None,
+    header: bool = True,
+    encoding: str = 'utf-8',
+    **fmtparams: Any
+) -> None:
+    """
+    Write data to a csv file, zipping the columns into rows without row dicts.
+    None is written as an empty field.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    path_or_file : str | PathLike | file
+        csv file path or open text file
+    columns : Sequence[str], optional
+        names of columns to write, in this order, all columns if None
+    header : bool, default True
+        write a header row of column names
+    encoding : str, default 'utf-8'
+        encoding used to open path_or_file paths
+    **fmtparams
+        csv.writer format parameters, such as delimiter
+
+    Example
+    -------
+    >>> import io
+    >>> file = io.StringIO()
+    >>> write_csv({'x': [1, 2], 'y': ['a', None]}, file, lineterminator='\\n')
+    >>> file.getvalue()
+    'x,y\\n1,a\\n2,\\n'
+    """
+    write_csv_chunks([data], path_or_file, columns, header, encoding, **fmtparams)
+
+
+def write_csv_chunks(
+    chunks: Iterable[DataMapping],
+    path_or_file: PathOrFile,
+    columns: Optional[Sequence[str]] = None,
+    header: bool = True,
+    encoding: str = 'utf-8',
+    **fmtparams: Any
+) -> None:
+    """
+    Write a stream of data chunks to one csv file, one chunk at a time.
+    The columns are the first chunk's columns if columns is None.
+
+    Example
+    -------
+    >>> import io
+    >>> file = io.StringIO()
+    >>> write_csv_chunks([{'x': [1]}, {'x': [2]}], file, lineterminator='\\n')
+    >>> file.getvalue()
+    'x\\n1\\n2\\n'
+    """
+    with utils_functions.open_file(path_or_file, 'w', encoding) as file:
+        writer = csv.writer(file, **fmtparams)
+        names = None if columns is None else list(columns)
+        for chunk in chunks:
+            if names is None:
+                names = data_functions.column_names(chunk)
+            if header:
+                writer.writerow(names)
+                header = False
+            writer.writerows(zip(*(chunk[col] for col in names)))
+        if header and names is not None:
+            writer.writerow(names)
+
+
+def csv_to_data(text: str, **kwargs: Any) -> DataDict:
+    """
+    Convert csv string to data format, see read_csv for parameters.
+
+    Example
+    -------
+    >>> csv_to_data('x,y\\n1,2\\n', infer_types=True)
+    {'x': [1], 'y': [2]}
+    """
+    return read_csv(io.StringIO(text), **kwargs)
+
+
+def data_to_csv(data: DataMapping, **kwargs: Any) -> str:
+    """
+    Convert data to csv string, see write_csv for parameters.
+
+    Example
+    -------
+    >>> data_to_csv({'x': [1, 2], 'y': [6, 7]}, lineterminator='\\n')
+    'x,y\\n1,6\\n2,7\\n'
+    """
+    file = io.StringIO()
+    write_csv(data, file, **kwargs)
+    return file.getvalue()
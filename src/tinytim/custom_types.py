@@ -1,16 +1,21 @@
-from typing import Any, Dict, List, Mapping, MutableMapping, MutableSequence, Sequence
+import os
+from typing import IO, Any, Dict, Mapping, MutableMapping, MutableSequence, Sequence, Union
 
+import tinytim.arrays as arrays_functions
 from tinytim.interfaces import SequenceItems
 
+# a stored column: list, array.array or tinytim.categorical.Categorical
+Column = MutableSequence[Any]
 DataMapping = Mapping[str, Sequence[Any]]
 MutableDataMapping = MutableMapping[str, MutableSequence[Any]]
 RowMapping = Mapping[str, Any]
-DataDict = Dict[str, List[Any]]
+DataDict = Dict[str, Column]
 RowDict = Dict[str, Any]
+PathOrFile = Union[str, 'os.PathLike[str]', IO[str]]
 
 
 def data_dict(m: SequenceItems) -> DataDict:
-    return {str(col): list(values) for col, values in m.items()}
+    return {str(col): arrays_functions.like_column(values, values) for col, values in m.items()}
 
 
 def row_dict(m: SequenceItems) -> RowDict:
@@ -1,6 +1,8 @@
 from typing import Any, List, Tuple
 
-from tinytim.custom_types import DataDict
+import tinytim.views as views_functions
+from tinytim.arrays import like_column
+from tinytim.custom_types import Column, DataDict
 from tinytim.interfaces import GetSequence, KeyNames, KeyNamesSequenceValues, SequenceItems, SequenceValues
 
 
@@ -158,7 +160,7 @@ def column_names(data: KeyNames) -> List[str]:
     return list(data.keys())
 
 
-def head(data: SequenceItems, n: int = 5) -> DataDict:
+def head(data: SequenceItems, n: int = 5, view: bool = False) -> DataDict:
     """
     Return the first n rows of data.
 
@@ -168,6 +170,9 @@ def head(data: SequenceItems, n: int = 5) -> DataDict:
         data mapping of {column name: column values}
     n : int, optional
         number of rows to return from top of data
+    view : bool, default False
+        if True, return tinytim.views.ColumnView columns
+        that read data without copying it
 
     Returns
     -------
@@ -180,10 +185,12 @@ def head(data: SequenceItems, n: int = 5) -> DataDict:
     >>> head(data, 2)
     {'x': [1, 2], 'y': [6, 7]}
     """
-    return {k: list(v[:n]) for k, v in data.items()}
+    if view:
+        return views_functions.head(data, n)  # type: ignore[return-value]
+    return {k: like_column(v, v[:n]) for k, v in data.items()}
 
 
-def tail(data: SequenceItems, n: int = 5) -> DataDict:
+def tail(data: SequenceItems, n: int = 5, view: bool = False) -> DataDict:
     """
     Return the last n rows of data.
 
@@ -194,6 +201,9 @@ def tail(data: SequenceItems, n: int = 5) -> DataDict:
 
     n : int, optional
         number of rows to return from bottom of data
+    view : bool, default False
+        if True, return tinytim.views.ColumnView columns
+        that read data without copying it
 
     Returns
     -------
@@ -206,7 +216,9 @@ def tail(data: SequenceItems, n: int = 5) -> DataDict:
     >>> tail(data, 2)
     {'x': [2, 3], 'y': [7, 8]}
     """
-    return {k: list(v[-n:]) for k, v in data.items()}
+    if view:
+        return views_functions.tail(data, n)  # type: ignore[return-value]
+    return {k: like_column(v, v[-n:]) for k, v in data.items()}
 
 
 def index(data: SequenceValues) -> Tuple[int, ...]:
@@ -259,7 +271,7 @@ def table_value(data: GetSequence, column_name: str, index: int) -> Any:
     return data[column_name][index]
 
 
-def column_values(data: GetSequence, column_name: str) -> List[Any]:
+def column_values(data: GetSequence, column_name: str) -> Column:
     """
     Return all the values from one column.
 
@@ -281,4 +293,4 @@ def column_values(data: GetSequence, column_name: str) -> List[Any]:
     >>> column_values(data, 'y')
     [6, 7, 8]
     """
-    return list(data[column_name])
+    return like_column(data[column_name], data[column_name])
@@ -1,10 +1,12 @@
+import operator
+from array import array
+from itertools import compress, repeat
 from typing import Any, List, Optional, Sequence, Union
 
 import tinytim.data as data_functions
 import tinytim.edit as edit_functions
 import tinytim.filter as filter_functions
 import tinytim.isna as isna_functions
-import tinytim.rows as rows_functions
 from tinytim.custom_types import DataDict, DataMapping, RowMapping, data_dict
 
 
@@ -204,8 +206,9 @@ def dropna_columns_any_names(
     na_value: Optional[Any] = None
 ) -> List[str]:
     columns = []
+    names = None if subset is None else set(subset)
     for col in data_functions.column_names(data):
-        if subset is not None and col not in subset:
+        if names is not None and col not in names:
             columns.append(col)
             continue
         if not column_any_na(data[col], na_value):
@@ -249,11 +252,8 @@ def dropna_rows_any_indexes(
     subset: Optional[Sequence[str]] = None,
     na_value: Optional[Any] = None
 ) -> List[int]:
-    remaining_indexes = []
-    for i, row in rows_functions.iterrows(data):
-        if not row_any_na(row, subset, na_value):
-            remaining_indexes.append(i)
-    return remaining_indexes
+    counts = row_na_counts(data, subset, na_value)
+    return _indexes_where(counts, 0, operator.eq)
 
 
 def dropna_rows_any(
@@ -272,7 +272,7 @@ def column_any_na(
     column: Sequence[Any],
     na_value: Optional[Any] = None
 ) -> bool:
-    return any(isna_functions.is_missing(val, na_value) for val in column)
+    return any(isna_functions.column_isnull_mask(column, na_value))
 
 
 def subset_row_values(
@@ -288,14 +288,14 @@ def row_any_na(
     na_value: Optional[Any] = None
 ) -> bool:
     values = subset_row_values(row, subset)
-    return any(isna_functions.is_missing(val, na_value) for val in values)
+    return any(map(isna_functions.missing_check(na_value), values))
 
 
 def column_all_na(
     column: Sequence[Any],
     na_value: Optional[Any] = None
 ) -> bool:
-    return all(isna_functions.is_missing(val, na_value) for val in column)
+    return all(isna_functions.column_isnull_mask(column, na_value))
 
 
 def row_all_na(
@@ -304,7 +304,7 @@ def row_all_na(
     na_value: Optional[Any] = None
 ) -> bool:
     values = subset_row_values(row, subset)
-    return all(isna_functions.is_missing(val, na_value) for val in values)
+    return all(map(isna_functions.missing_check(na_value), values))
 
 
 def dropna_all_inplace(
@@ -360,8 +360,9 @@ def dropna_columns_all_names(
     na_value: Optional[Any] = None
 ) -> List[str]:
     columns = []
+    names = None if subset is None else set(subset)
     for col in data_functions.column_names(data):
-        if subset is not None and col not in subset:
+        if names is not None and col not in names:
             columns.append(col)
             continue
         if not column_all_na(data[col], na_value):
@@ -395,11 +396,8 @@ def dropna_rows_all_indexes(
     subset: Optional[Sequence[str]] = None,
     na_value: Optional[Any] = None,
 ) -> List[int]:
-    indexes = []
-    for i, row in rows_functions.iterrows(data):
-        if not row_all_na(row, subset, na_value):
-            indexes.append(i)
-    return indexes
+    counts = row_na_counts(data, subset, na_value)
+    return _indexes_where(counts, len(_subset_columns(data, subset)), operator.lt)
 
 
 def dropna_columns_thresh_inplace(
@@ -432,8 +430,9 @@ def dropna_columns_thresh_names(
     na_value: Optional[Any] = None
 ) -> List[str]:
     columns = []
+    names = None if subset is None else set(subset)
     for col in data_functions.column_names(data):
-        if subset is not None and col not in subset:
+        if names is not None and col not in names:
             columns.append(col)
             continue
         if column_na_thresh(data[col], thresh, na_value):
@@ -480,11 +479,73 @@ def dropna_rows_thresh_indexes(
     subset: Optional[Sequence[str]] = None,
     na_value: Optional[Any] = None
 ) -> List[int]:
-    indexes = []
-    for i, row in rows_functions.iterrows(data):
-        if row_na_thresh(row, thresh, subset, na_value):
-            indexes.append(i)
-    return indexes
+    counts = row_na_counts(data, subset, na_value)
+    # at least thresh not missing values: missing count <= column count - thresh
+    return _indexes_where(counts, len(_subset_columns(data, subset)) - thresh, operator.le)
+
+
+def row_na_counts(
+    data: DataMapping,
+    subset: Optional[Sequence[str]] = None,
+    na_value: Optional[Any] = None
+) -> 'array[int]':
+    """
+    Return the number of missing values in each row,
+    scanning only the subset columns one column at a time.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    subset : Sequence[str], optional
+        column names to count missing values in, all columns if None
+    na_value : Any, default None
+        value to look for missing values
+
+    Returns
+    -------
+    array('q')
+        missing value count per row
+
+    Raises
+    ------
+    KeyError
+        if a subset column is not in data
+
+    Example
+    -------
+    >>> row_na_counts({'x': [1, None, None], 'y': [None, 2, None]})
+    array('q', [1, 1, 2])
+    """
+    row_count = data_functions.row_count(data)
+    counts = array('q', bytes(8 * row_count))
+    # Masks are added as integers with one byte per row,
+    # flushed into counts before any byte can overflow.
+    lanes = 0
+    for i, col in enumerate(_subset_columns(data, subset), 1):
+        lanes += int.from_bytes(isna_functions.column_isnull_mask(data[col], na_value), 'little')
+        if i % 255 == 0:
+            counts = array('q', map(operator.add, counts, lanes.to_bytes(row_count, 'little')))
+            lanes = 0
+    if lanes:
+        counts = array('q', map(operator.add, counts, lanes.to_bytes(row_count, 'little')))
+    return counts
+
+
+def _subset_columns(data: DataMapping, subset: Optional[Sequence[str]] = None) -> List[str]:
+    """Return names of data columns in subset, all column names if subset is None."""
+    if subset is None:
+        return data_functions.column_names(data)
+    for col in subset:
+        if col not in data:
+            raise KeyError(col)
+    names = set(subset)
+    return [col for col in data_functions.column_names(data) if col in names]
+
+
+def _indexes_where(counts: Sequence[int], value: int, op: Any) -> List[int]:
+    """Return indexes i where op(counts[i], value) is True."""
+    return list(compress(range(len(counts)), map(op, counts, repeat(value))))
 
 
 def column_na_thresh(
@@ -492,7 +553,7 @@ def column_na_thresh(
     thresh: int,
     na_value: Optional[Any] = None
 ) -> bool:
-    return bool(sum(val != na_value for val in column) >= thresh)
+    return len(column) - sum(isna_functions.column_isnull_mask(column, na_value)) >= thresh
 
 
 def row_na_thresh(
@@ -502,5 +563,6 @@ def row_na_thresh(
     na_value: Optional[Any] = None
 ) -> bool:
     items = row.values() if subset is None else [val for key, val in row.items() if key in subset]
-    return bool(sum(val != na_value for val in items) >= thresh)
+    is_missing = isna_functions.missing_check(na_value)
+    return sum(not is_missing(val) for val in items) >= thresh
 
@@ -1,11 +1,14 @@
-from itertools import repeat
+import operator
+from itertools import compress, repeat
 from numbers import Number
 from typing import Any, Callable, Iterable, List, MutableSequence, Sequence, Sized, Union
 
+import tinytim.arrays as arrays_functions
+import tinytim.copy as copy_functions
 import tinytim.data as data_functions
 import tinytim.sequences as sequences_functions
 import tinytim.utils as utils_functions
-from tinytim.custom_types import DataDict, DataMapping, data_dict
+from tinytim.custom_types import DataDict, DataMapping
 from tinytim.interfaces import (
     DeleteItem,
     GetMutableSequence,
@@ -201,7 +204,7 @@ def add_to_column_inplace(
     >>> data
     {'x': [2, 3, 4], 'y': [6, 7, 8]}
     """
-    operator_column_inplace(data, column_name, values, lambda x, y : x + y)
+    operator_column_inplace(data, column_name, values, operator.add)
 
 
 def subtract_from_column_inplace(
@@ -241,7 +244,7 @@ def subtract_from_column_inplace(
     >>> data
     {'x': [0, 1, 2], 'y': [6, 7, 8]}
     """
-    operator_column_inplace(data, column_name, values, lambda x, y : x - y)
+    operator_column_inplace(data, column_name, values, operator.sub)
 
 
 def divide_column_inplace(
@@ -286,7 +289,7 @@ def divide_column_inplace(
     >>> data
     {'x': [0.5, 1.0, 1.5], 'y': [6, 7, 8]}
     """
-    operator_column_inplace(data, column_name, values, lambda x, y : x / y)
+    operator_column_inplace(data, column_name, values, operator.truediv)
 
 
 def drop_row_inplace(
@@ -352,6 +355,88 @@ def drop_label_inplace(
         labels.pop(index)
 
 
+def drop_rows_inplace(
+    data: KeyNamesGetMutableSequenceSequenceValues,
+    rows: Union[Iterable[int], bytes, Sequence[bool]]
+) -> None:
+    """
+    Remove rows at indexes, or where a mask is True, from data.
+    Each column is compacted once, so indexes refer to rows before any are removed.
+
+    Parameters
+    ----------
+    data : MutableMapping[str, MutableSequence]
+        data mapping of {column name: column values}
+    rows : Iterable[int] | bytes | Sequence[bool]
+        indexes of rows to remove, or mask that is True for rows to remove
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> data = {'x': [1, 2, 3, 4], 'y': [6, 7, 8, 9]}
+    >>> drop_rows_inplace(data, {0, 2})
+    >>> data
+    {'x': [2, 4], 'y': [7, 9]}
+
+    >>> data = {'x': [1, 2, 3, 4], 'y': [6, 7, 8, 9]}
+    >>> drop_rows_inplace(data, [False, True, True, False])
+    >>> data
+    {'x': [1, 4], 'y': [6, 9]}
+    """
+    keep = _keep_mask(data_functions.row_count(data), rows)
+    if keep.count(0) == 0:
+        return
+    for col in data_functions.column_names(data):
+        column = data[col]
+        column[:] = arrays_functions.like_column(column, compress(column, keep))
+
+
+def drop_labels_inplace(
+    labels: Union[None, MutableSequence[Any]],
+    rows: Union[Iterable[int], bytes, Sequence[bool]]
+) -> None:
+    """
+    If labels exists, drop items at indexes, or where a mask is True, in one pass.
+
+    Parameters
+    ----------
+    labels : List[Any], optional
+        list of values used as labels
+    rows : Iterable[int] | bytes | Sequence[bool]
+        indexes of values to remove, or mask that is True for values to remove
+
+    Returns
+    -------
+    None
+
+    Example
+    -------
+    >>> labels = [1, 2, 3, 4, 5]
+    >>> drop_labels_inplace(labels, [0, -1])
+    >>> labels
+    [2, 3, 4]
+    """
+    if labels is not None:
+        labels[:] = arrays_functions.like_column(labels, compress(labels, _keep_mask(len(labels), rows)))
+
+
+def _keep_mask(row_count: int, rows: Union[Iterable[int], bytes, Sequence[bool]]) -> bytes:
+    """Return mask of rows to keep, from indexes or a mask of rows to drop."""
+    if isinstance(rows, (bytes, bytearray)) or (
+        isinstance(rows, Sequence) and len(rows) and all(isinstance(row, bool) for row in rows)
+    ):
+        if len(rows) != row_count:
+            raise ValueError('mask length must match data rows count.')
+        return bytes(map(operator.not_, rows))
+    keep = bytearray(b'\x01') * row_count
+    for index in rows:
+        keep[index] = 0
+    return bytes(keep)
+
+
 def drop_column_inplace(
     data: DeleteItem,
     column_name: str
@@ -443,7 +528,7 @@ def edit_row_items(
     >>> data
     {'x': [1, 2, 3], 'y': [6, 7, 8]}
     """
-    data = data_dict(data)
+    data = copy_functions.copy_on_write(data)
     edit_row_items_inplace(data, index, items)
     return data
 
@@ -478,7 +563,7 @@ def edit_row_values(
     >>> data
     {'x': [1, 2, 3], 'y': [6, 7, 8]}
     """
-    data = data_dict(data)
+    data = copy_functions.copy_on_write(data)
     if len(values) != data_functions.column_count(data):
         raise AttributeError('values length must match columns length.')
     for col, value in zip(data_functions.column_names(data), values):
@@ -521,21 +606,22 @@ def edit_column(
     >>> edit_column(data, 'z', [66, 77, 88])
     {'x': [1, 2, 3], 'y': [6, 7, 8], 'z': [66, 77, 88]}
     """
-    data = data_dict(data)
+    table = copy_functions.copy_on_write(data)
     iterable_and_sized = isinstance(values, Iterable) and isinstance(values, Sized)
     if isinstance(values, str) or not iterable_and_sized:
-        if column_name in data:
-            utils_functions.set_values_to_one(data[column_name], values)
+        if column_name in table:
+            column = copy_functions.read_column(table, column_name)
+            table[column_name] = arrays_functions.like_column(column, repeat(values, len(column)))
         else:
-            data[column_name] = list(repeat(values, data_functions.row_count(data)))
-        return data
-    if len(values) != data_functions.row_count(data):
+            table[column_name] = list(repeat(values, data_functions.row_count(copy_functions.read_columns(table))))
+        return table
+    if len(values) != data_functions.row_count(copy_functions.read_columns(table)):
         raise ValueError('values length must match data rows count.')
-    if column_name in data:
-        utils_functions.set_values_to_many(data[column_name], values)
+    if column_name in table and arrays_functions.is_array(copy_functions.read_column(table, column_name)):
+        table[column_name] = arrays_functions.compact_column(values)
     else:
-        data[column_name] = list(values)
-    return data
+        table[column_name] = list(values)
+    return table
 
 
 def operator_column(
@@ -579,10 +665,14 @@ def operator_column(
     >>> data
     {'x': [1, 2, 3], 'y': [6, 7, 8]}
     """
-    data = data_dict(data)
-    new_values = sequences_functions.operate_on_sequence(data[column_name], values, func)
-    utils_functions.set_values_to_many(data[column_name], new_values)
-    return data
+    table = copy_functions.copy_on_write(data)
+    column = copy_functions.read_column(table, column_name)
+    new_values = sequences_functions.operate_on_sequence(column, values, func)
+    if arrays_functions.is_array(column):
+        table[column_name] = arrays_functions.compact_column(new_values)
+    else:
+        table[column_name] = new_values
+    return table
 
 
 def add_to_column(
@@ -620,7 +710,7 @@ def add_to_column(
     >>> add_to_column(data, 'x', 1)
     {'x': [2, 3, 4], 'y': [6, 7, 8]}
     """
-    return operator_column(data, column_name, values, lambda x, y : x + y)
+    return operator_column(data, column_name, values, operator.add)
 
 
 def subtract_from_column(
@@ -660,7 +750,7 @@ def subtract_from_column(
     >>> data
     {'x': [0, 1, 2], 'y': [6, 7, 8]}
     """
-    return operator_column(data, column_name, values, lambda x, y : x - y)
+    return operator_column(data, column_name, values, operator.sub)
 
 
 def multiply_column_inplace(
@@ -700,7 +790,7 @@ def multiply_column_inplace(
     >>> data
     {'x': [2, 4, 6], 'y': [6, 7, 8]}
     """
-    operator_column_inplace(data, column_name, values, lambda x, y : x * y)
+    operator_column_inplace(data, column_name, values, operator.mul)
 
 
 def multiply_column(
@@ -738,8 +828,7 @@ def multiply_column(
     >>> multiply_column(data, 'x', 2)
     {'x': [2, 4, 6], 'y': [6, 7, 8]}
     """
-    data = data_dict(data)
-    return operator_column(data, column_name, values, lambda x, y : x * y)
+    return operator_column(data, column_name, values, operator.mul)
 
 
 def divide_column(
@@ -782,7 +871,7 @@ def divide_column(
     >>> divide_column(data, 'x', 2)
     {'x': [0.5, 1.0, 1.5], 'y': [6, 7, 8]}
     """
-    return operator_column(data, column_name, values, lambda x, y : x / y)
+    return operator_column(data, column_name, values, operator.truediv)
 
 
 def drop_row(
@@ -809,7 +898,7 @@ def drop_row(
     >>> drop_row(data, 1)
     {'x': [1, 3], 'y': [6, 8]}
     """
-    data = data_dict(data)
+    data = copy_functions.copy_on_write(data)
     for col in data_functions.column_names(data):
         data[col].pop(index)
     return data
@@ -851,6 +940,68 @@ def drop_label(
     return labels
 
 
+def drop_rows(
+    data: DataMapping,
+    rows: Union[Iterable[int], bytes, Sequence[bool]]
+) -> DataDict:
+    """
+    Return data with rows at indexes, or where a mask is True, removed.
+    Each column is copied once, without the removed rows.
+
+    Parameters
+    ----------
+    data : MutableMapping[str, MutableSequence]
+        data mapping of {column name: column values}
+    rows : Iterable[int] | bytes | Sequence[bool]
+        indexes of rows to remove, or mask that is True for rows to remove
+
+    Returns
+    -------
+    Dict[str, list]
+
+    Example
+    -------
+    >>> data = {'x': [1, 2, 3, 4], 'y': [6, 7, 8, 9]}
+    >>> drop_rows(data, [1, 3])
+    {'x': [1, 3], 'y': [6, 8]}
+    """
+    columns = copy_functions.read_columns(data)
+    keep = _keep_mask(data_functions.row_count(columns), rows)
+    if keep.count(0) == 0:
+        return copy_functions.copy_on_write(data)
+    return copy_functions.CopyOnWriteTable(
+        (col, arrays_functions.like_column(values, compress(values, keep))) for col, values in columns.items()
+    )
+
+
+def drop_labels(
+    labels: Union[None, Sequence[Any]],
+    rows: Union[Iterable[int], bytes, Sequence[bool]]
+) -> Union[None, List[Any]]:
+    """
+    If labels exists, return labels with items at indexes, or where a mask is True, removed.
+
+    Parameters
+    ----------
+    labels : List[Any], optional
+        list of values used as labels
+    rows : Iterable[int] | bytes | Sequence[bool]
+        indexes of values to remove, or mask that is True for values to remove
+
+    Returns
+    -------
+    None | list
+
+    Example
+    -------
+    >>> drop_labels(['a', 'b', 'c', 'd'], {1, 2})
+    ['a', 'd']
+    """
+    if labels is None:
+        return None
+    return list(compress(labels, _keep_mask(len(labels), rows)))
+
+
 def drop_column(
     data: DataMapping,
     column_name: str
@@ -875,9 +1026,9 @@ def drop_column(
     >>> drop_column(data, 'y')
     {'x': [1, 2, 3]}
     """
-    data = data_dict(data)
-    del data[column_name]
-    return data
+    table = copy_functions.copy_on_write(data)
+    del table[column_name]
+    return table
 
 
 def edit_value(
@@ -910,7 +1061,7 @@ def edit_value(
     >>> edit_value(data, 'x', 0, 11)
     {'x': [11, 2, 3], 'y': [6, 7, 8]}
     """
-    data = data_dict(data)
+    data = copy_functions.copy_on_write(data)
     data[column_name][index] = value
     return data
 
@@ -945,4 +1096,5 @@ def replace_column_names(
     old_names = data_functions.column_names(data)
     if len(new_names) != len(old_names):
         raise ValueError('new_names must be same size as data column_count.')
-    return {new_name: list(data[old_name]) for new_name, old_name in zip(new_names, old_names)}
+    return {new_name: arrays_functions.like_column(data[old_name], data[old_name])
+                for new_name, old_name in zip(new_names, old_names)}
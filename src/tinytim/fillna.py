@@ -1,12 +1,11 @@
-from typing import Any, List, Optional, Sequence, Union
+from itertools import compress, islice
+from typing import Any, Iterable, List, MutableSequence, Optional, Sequence, Union
 
 from hasattrs import has_mapping_attrs
 
 import tinytim.data as data_functions
-import tinytim.edit as edit_functions
 import tinytim.isna as isna_functions
-import tinytim.rows as rows_functions
-from tinytim.custom_types import DataDict, DataMapping, RowDict, RowMapping, data_dict, row_dict
+from tinytim.custom_types import Column, DataDict, DataMapping, RowDict, RowMapping, data_dict, row_dict
 
 
 def fillna(
@@ -176,9 +175,9 @@ def backfill_inplace(
     data : MutableMapping[str, MutableSequence]
         data mapping of {column name: column values}
     """
-    if axis in [0, 'row']:
+    if axis in [0, 'rows', 'row']:
         backfill_columns_inplace(data, limit, na_value)
-    elif axis in [1, 'column']:
+    elif axis in [1, 'columns', 'column']:
         backfill_rows_inplace(data, limit, na_value)
 
 
@@ -287,9 +286,18 @@ def fill_rows_with_value_inplace(
     -------
     None
     """
-    for i, row in rows_functions.iterrows(data):
-        new_row = fill_row_with_value(row, value, limit, na_value)
-        edit_functions.edit_row_items_inplace(data, i, new_row)
+    fill_counts = [0] * data_functions.row_count(data)
+    for col in data_functions.column_names(data):
+        try:
+            fill_value = _get_fill_value(value, col)
+        except ContinueError:
+            continue
+        column = data[col]
+        missing = compress(range(len(column)), isna_functions.column_isnull_mask(column, na_value))
+        for i in missing:
+            if limit is None or fill_counts[i] < limit:
+                column[i] = fill_value
+                fill_counts[i] += 1
 
 
 def backfill_columns_inplace(
@@ -356,9 +364,8 @@ def backfill_rows_inplace(
     -------
     None
     """
-    for i, row in rows_functions.iterrows(data):
-        new_row = backfill_row(row, limit, na_value)
-        edit_functions.edit_row_items_inplace(data, i, new_row)
+    columns = [data[col] for col in data]
+    _fill_rows_inplace(columns[::-1], data_functions.row_count(data), limit, na_value)
 
 
 def forwardfill_columns_inplace(
@@ -415,9 +422,8 @@ def forwardfill_rows_inplace(
     -------
     None
     """
-    for i, row in rows_functions.iterrows(data):
-        new_row = forwardfill_row(row, limit, na_value)
-        edit_functions.edit_row_items_inplace(data, i, new_row)
+    columns = [data[col] for col in data]
+    _fill_rows_inplace(columns, data_functions.row_count(data), limit, na_value)
 
 
 def forwardfill_rows(
@@ -491,7 +497,7 @@ def fill_column_with_value(
 
 
 def fill_column_with_value_inplace(
-    column: List[Any],
+    column: Column,
     value: Optional[Any] = None,
     limit: Optional[int] = None,
     na_value: Optional[Any] = None
@@ -524,13 +530,9 @@ def fill_column_with_value_inplace(
     >>> col
     [1, 0, 3, 0, 5]
     """
-    fill_count = 0
-    for i, item in enumerate(column):
-        if limit is not None and fill_count >= limit:
-            return
-        if isna_functions.is_missing(item, na_value):
-            column[i] = value
-            fill_count += 1
+    mask = isna_functions.column_isnull_mask(column, na_value)
+    for i in islice(compress(range(len(column)), mask), limit):
+        column[i] = value
 
 
 def fill_row_with_value(
@@ -611,10 +613,11 @@ def fill_row_with_value_inplace(
     {'a': 1, 'b': 22, 'c': 3, 'd': 44, 'e': 5}
     """
     fill_count = 0
+    is_missing = isna_functions.missing_check(na_value)
     for key, item in row.items():
         if limit is not None and fill_count >= limit:
             return
-        if isna_functions.is_missing(item, na_value):
+        if is_missing(item):
             try:
                 fill_value = _get_fill_value(value, key)
             except ContinueError:
@@ -624,27 +627,95 @@ def fill_row_with_value_inplace(
 
 
 def backfill_column_inplace(
-    column: List[Any],
+    column: Column,
+    limit: Optional[int] = None,
+    na_value: Optional[Any] = None
+) -> None:
+    _carry_fill_column_inplace(column, True, limit, na_value)
+
+
+def _carry_fill_column_inplace(
+    column: MutableSequence[Any],
+    backward: bool = False,
     limit: Optional[int] = None,
     na_value: Optional[Any] = None
 ) -> None:
+    """
+    Fill missing column values with the previous value (next value if backward),
+    visiting only the missing values found by the column mask.
+    Stops after limit fills.
+    """
+    mask = isna_functions.column_isnull_mask(column, na_value)
+    length = len(column)
+    step = -1 if backward else 1
+    order = range(length - 1, -1, -1) if backward else range(length)
+    missing = compress(order, mask[::-1] if backward else mask)
     fill_count = 0
-    for i, item in reversed(list(enumerate(column))):
+    last_filled = -1
+    for i in missing:
         if limit is not None and fill_count >= limit:
-            return
-        if isna_functions.is_missing(item, na_value):
-            b = _back(column, i, na_value)
-            if isna_functions.is_missing(b, na_value):
-                continue
-            column[i] = b
+            break
+        source = i - step
+        if 0 <= source < length and (not mask[source] or source == last_filled):
+            column[i] = column[source]
+            last_filled = i
             fill_count += 1
 
 
-def _back(values: Sequence[Any], index: int, na_value=None) -> Any:
-    """Return the next value after index."""
-    if index >= len(values) - 1:
-        return na_value
-    return values[index + 1]
+def _carry_fill_inplace(
+    values: Any,
+    keys: Iterable[Any],
+    limit: Optional[int] = None,
+    na_value: Optional[Any] = None
+) -> None:
+    """
+    Fill missing values[key] with the last valid value seen, visiting keys in order.
+    Stops after limit fills.
+    """
+    fill_count = 0
+    has_last = False
+    last = na_value
+    is_missing = isna_functions.missing_check(na_value)
+    for key in keys:
+        if limit is not None and fill_count >= limit:
+            return
+        item = values[key]
+        if is_missing(item):
+            if has_last:
+                values[key] = last
+                fill_count += 1
+        else:
+            last = item
+            has_last = True
+
+
+def _fill_rows_inplace(
+    columns: Sequence[MutableSequence[Any]],
+    row_count: int,
+    limit: Optional[int] = None,
+    na_value: Optional[Any] = None
+) -> None:
+    """
+    Fill missing values across each row of columns with the last valid value
+    of an earlier column in that row, without building row dicts.
+    Pass columns reversed to back fill.
+    """
+    is_missing = isna_functions.missing_check(na_value)
+    for i in range(row_count):
+        fill_count = 0
+        has_last = False
+        last = na_value
+        for column in columns:
+            if limit is not None and fill_count >= limit:
+                break
+            item = column[i]
+            if is_missing(item):
+                if has_last:
+                    column[i] = last
+                    fill_count += 1
+            else:
+                last = item
+                has_last = True
 
 
 def backfill_rows(
@@ -672,16 +743,7 @@ def backfill_row_inplace(
     limit: Optional[int] = None,
     na_value: Optional[Any] = None
 ) -> None:
-    fill_count = 0
-    for i, (key, item) in reversed(list(enumerate(row.items()))):
-        if limit is not None and fill_count >= limit:
-            return
-        if isna_functions.is_missing(item, na_value):
-            b = _back(list(row.values()), i, na_value)
-            if isna_functions.is_missing(b, na_value):
-                continue
-            row[key] = b
-            fill_count += 1
+    _carry_fill_inplace(row, reversed(list(row)), limit, na_value)
 
 
 def backfill_row(
@@ -695,20 +757,11 @@ def backfill_row(
 
 
 def forwardfill_column_inplace(
-    column: List[Any],
+    column: Column,
     limit: Optional[int] = None,
     na_value: Optional[Any] = None
 ) -> None:
-    fill_count = 0
-    for i, item in enumerate(column):
-        if limit is not None and fill_count >= limit:
-            return
-        if isna_functions.is_missing(item, na_value):
-            f = _forward(column, i, na_value)
-            if isna_functions.is_missing(f, na_value):
-                continue
-            column[i] = f
-            fill_count += 1
+    _carry_fill_column_inplace(column, False, limit, na_value)
 
 
 def forwardfill_column(
@@ -721,28 +774,12 @@ def forwardfill_column(
     return column
 
 
-def _forward(values: Sequence[Any], index: int, na_value=None) -> Any:
-    """Return the previoud value before index."""
-    if index < 1:
-        return na_value
-    return values[index - 1]
-
-
 def forwardfill_row_inplace(
     row: RowDict,
     limit: Optional[int] = None,
     na_value: Optional[Any] = None
 ) -> None:
-    fill_count = 0
-    for i, (key, value) in enumerate(row.items()):
-        if limit is not None and fill_count >= limit:
-            return
-        if isna_functions.is_missing(value, na_value):
-            f = _forward(list(row.values()), i, na_value)
-            if isna_functions.is_missing(f, na_value):
-                continue
-            row[key] = f
-            fill_count += 1
+    _carry_fill_inplace(row, list(row), limit, na_value)
 
 
 def forwardfill_row(
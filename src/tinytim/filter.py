@@ -1,11 +1,19 @@
+import operator
 import random
-from typing import Any, Callable, List, Optional, Sequence
+from array import array
+from itertools import compress, repeat
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
 
+import tinytim.arrays as arrays_functions
 import tinytim.data as data_functions
 import tinytim.edit as edit_functions
-from tinytim.custom_types import DataDict, DataMapping
+import tinytim.utils as utils_functions
+import tinytim.views as views_functions
+from tinytim.categorical import Categorical
+from tinytim.custom_types import Column, DataDict, DataMapping
 
 BoolSequence = Sequence[bool]
+Mask = Union[bytes, BoolSequence]
 
 
 def column_filter(column: Sequence[Any], func: Callable[[Any], bool]) -> List[bool]:
@@ -13,16 +21,25 @@ def column_filter(column: Sequence[Any], func: Callable[[Any], bool]) -> List[bo
 
 
 def indexes_from_filter(f: BoolSequence) -> List[int]:
-    return [i for i, b in enumerate(f) if b]
+    return list(compress(range(len(f)), f))
 
 
-def filter_list_by_indexes(values: Sequence[Any], indexes: Sequence[int]) -> List[Any]:
+def filter_list_by_indexes(values: Sequence[Any], indexes: Sequence[int]) -> Column:
     """Return only values in indexes."""
-    return [values[i] for i in indexes]
-
-
-def filter_by_indexes(data: DataMapping, indexes: Sequence[int]) -> DataDict:
-    """Return only rows in indexes"""
+    if isinstance(values, Categorical):
+        return values.take(indexes)
+    if len(indexes) < 2:
+        return arrays_functions.like_column(values, [values[i] for i in indexes])
+    return arrays_functions.like_column(values, operator.itemgetter(*indexes)(values))
+
+
+def filter_by_indexes(data: DataMapping, indexes: Sequence[int], view: bool = False) -> DataDict:
+    """
+    Return only rows in indexes.
+    If view is True, return tinytim.views.ColumnView columns instead of copies.
+    """
+    if view:
+        return views_functions.filter_by_indexes(data, indexes)  # type: ignore[return-value]
     return {col: filter_list_by_indexes(values, indexes) for col, values in data.items()}
 
 
@@ -32,9 +49,246 @@ def filter_by_indexes_inplace(data: DataDict, indexes: Sequence[int]) -> None:
         data[col] = filter_list_by_indexes(values, indexes)
 
 
-def filter_data(data: DataMapping, f: BoolSequence) -> DataDict:
-    indexes = indexes_from_filter(f)
-    return filter_by_indexes(data, indexes)
+def filter_data(data: DataMapping, f: Mask) -> DataDict:
+    return filter_by_mask(data, f)
+
+
+def as_mask(f: Mask) -> bytes:
+    """
+    Return f as a compact mask: bytes of 1 where f is True, 0 where False.
+
+    Example
+    -------
+    >>> as_mask([True, False, True])
+    b'\\x01\\x00\\x01'
+    """
+    if isinstance(f, bytes):
+        return f
+    return bytes(map(bool, f))
+
+
+def _compare_mask(column: Sequence[Any], op: Callable[[Any, Any], Any], value: Any) -> bytes:
+    """Return mask of op(item, value) for each column item, looping in C instead of calling a lambda per item."""
+    if isinstance(column, Categorical):
+        # compare each category once
+        return column.mask_where(lambda category: op(category, value))
+    return bytes(map(bool, map(op, column, repeat(value))))
+
+
+def mask_eq(column: Sequence[Any], value: Any) -> bytes:
+    """
+    Return mask of column items equal to value.
+
+    Example
+    -------
+    >>> mask_eq([1, 2, 1], 1)
+    b'\\x01\\x00\\x01'
+    """
+    return _compare_mask(column, operator.eq, value)
+
+
+def mask_ne(column: Sequence[Any], value: Any) -> bytes:
+    """Return mask of column items not equal to value."""
+    return _compare_mask(column, operator.ne, value)
+
+
+def mask_gt(column: Sequence[Any], value: Any) -> bytes:
+    """Return mask of column items greater than value."""
+    return _compare_mask(column, operator.gt, value)
+
+
+def mask_lt(column: Sequence[Any], value: Any) -> bytes:
+    """Return mask of column items less than value."""
+    return _compare_mask(column, operator.lt, value)
+
+
+def mask_ge(column: Sequence[Any], value: Any) -> bytes:
+    """Return mask of column items greater than or equal value."""
+    return _compare_mask(column, operator.ge, value)
+
+
+def mask_le(column: Sequence[Any], value: Any) -> bytes:
+    """Return mask of column items less than or equal value."""
+    return _compare_mask(column, operator.le, value)
+
+
+class ValueSet:
+    """
+    Lookup values hashed once for O(1) membership checks.
+
+    Unhashable values are kept in a list and checked by equality,
+    so membership matches `value in values` for any values.
+
+    Example
+    -------
+    >>> lookup = ValueSet([1, [2, 3]])
+    >>> 1 in lookup, [2, 3] in lookup, 4 in lookup
+    (True, True, False)
+    """
+    def __init__(self, values: Iterable[Any]) -> None:
+        self.values = utils_functions.KeyIndex(values)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def mask(self, column: Sequence[Any]) -> bytes:
+        """Return mask of column items in this set."""
+        if isinstance(column, Categorical):
+            return column.mask(self.mask(column.categories))
+        if not self.values.unhashed:
+            try:
+                return bytes(map(self.values.hashed.__contains__, column))
+            except TypeError:
+                pass
+        return bytes(map(self.__contains__, column))
+
+
+def mask_isin(column: Sequence[Any], values: Iterable[Any]) -> bytes:
+    """
+    Return mask of column items in values.
+    values are hashed once, so each check is O(1).
+    Only the distinct values of Categorical values are hashed.
+
+    Example
+    -------
+    >>> mask_isin([1, 2, 3], [3, 1])
+    b'\\x01\\x00\\x01'
+    """
+    if isinstance(values, Categorical):
+        values = values.unique()
+    lookup = values if isinstance(values, ValueSet) else ValueSet(values)
+    return lookup.mask(column)
+
+
+def mask_notin(column: Sequence[Any], values: Iterable[Any]) -> bytes:
+    """Return mask of column items not in values."""
+    return mask_not(mask_isin(column, values))
+
+
+def mask_isin_multi(columns: Sequence[Sequence[Any]], values: Iterable[Sequence[Any]]) -> bytes:
+    """
+    Return mask of rows whose tuple of columns items is in values.
+
+    Parameters
+    ----------
+    columns : Sequence[Sequence]
+        columns to build row tuples from
+    values : Iterable[Sequence]
+        lookup row values, one item per column
+
+    Example
+    -------
+    >>> mask_isin_multi([[1, 1, 2], ['a', 'b', 'a']], [(1, 'b'), (2, 'a')])
+    b'\\x00\\x01\\x01'
+    """
+    lookup = ValueSet(map(tuple, values))
+    return lookup.mask(list(zip(*columns)))
+
+
+def mask_notin_multi(columns: Sequence[Sequence[Any]], values: Iterable[Sequence[Any]]) -> bytes:
+    """Return mask of rows whose tuple of columns items is not in values."""
+    return mask_not(mask_isin_multi(columns, values))
+
+
+def mask_func(column: Sequence[Any], func: Callable[[Any], bool]) -> bytes:
+    """Return mask of func(item) for each column item."""
+    if isinstance(column, Categorical):
+        return column.mask_where(func)
+    return bytes(map(bool, map(func, column)))
+
+
+def _mask_int(mask: Mask) -> int:
+    return int.from_bytes(as_mask(mask), 'little')
+
+
+def _int_mask(bits: int, length: int) -> bytes:
+    return bits.to_bytes(length, 'little')
+
+
+def mask_and(*masks: Mask) -> bytes:
+    """
+    Return mask that is True where all masks are True.
+    Masks are combined a machine word at a time as integers.
+
+    Example
+    -------
+    >>> mask_and([True, True, False], b'\\x01\\x00\\x01')
+    b'\\x01\\x00\\x00'
+    """
+    length = len(masks[0])
+    bits = _mask_int(masks[0])
+    for mask in masks[1:]:
+        bits &= _mask_int(mask)
+    return _int_mask(bits, length)
+
+
+def mask_or(*masks: Mask) -> bytes:
+    """
+    Return mask that is True where any mask is True.
+
+    Example
+    -------
+    >>> mask_or([True, False, False], b'\\x00\\x00\\x01')
+    b'\\x01\\x00\\x01'
+    """
+    length = len(masks[0])
+    bits = _mask_int(masks[0])
+    for mask in masks[1:]:
+        bits |= _mask_int(mask)
+    return _int_mask(bits, length)
+
+
+def mask_not(mask: Mask) -> bytes:
+    """
+    Return mask that is True where mask is False.
+
+    Example
+    -------
+    >>> mask_not([True, False])
+    b'\\x00\\x01'
+    """
+    length = len(mask)
+    ones = _mask_int(b'\x01' * length)
+    return _int_mask(_mask_int(mask) ^ ones, length)
+
+
+def indexes_from_mask(mask: Mask) -> 'array[int]':
+    """
+    Return array('q') of the indexes where mask is True.
+
+    Example
+    -------
+    >>> indexes_from_mask(b'\\x00\\x01\\x01')
+    array('q', [1, 2])
+    """
+    return array('q', compress(range(len(mask)), mask))
+
+
+def filter_list_by_mask(values: Sequence[Any], mask: Mask) -> Column:
+    """Return only values where mask is True."""
+    if isinstance(values, Categorical):
+        return values.compress(mask)
+    return arrays_functions.like_column(values, compress(values, mask))
+
+
+def filter_by_mask(data: DataMapping, mask: Mask, view: bool = False) -> DataDict:
+    """
+    Return only rows of data where mask is True.
+    Each column is gathered once, however many masks were combined.
+    If view is True, return tinytim.views.ColumnView columns instead of copies.
+
+    Example
+    -------
+    >>> data = {'x': [1, 2, 3], 'y': ['a', 'b', 'c']}
+    >>> filter_by_mask(data, mask_and(mask_gt(data['x'], 1), mask_ne(data['y'], 'c')))
+    {'x': [2], 'y': ['b']}
+    """
+    if view:
+        return views_functions.filter_by_mask(data, mask)  # type: ignore[return-value]
+    return {col: filter_list_by_mask(values, mask) for col, values in data.items()}
 
 
 def filter_by_column_func(
@@ -42,49 +296,74 @@ def filter_by_column_func(
     column_name: str,
     func: Callable[[Any], bool]
 ) -> DataDict:
-    """Return only rows of data where named column equals value."""
-    indexes = [i for i, val in enumerate(data[column_name]) if func(val)]
-    return filter_by_indexes(data, indexes)
+    """Return only rows of data where func(named column value) is True."""
+    return filter_by_mask(data, mask_func(data[column_name], func))
 
 
 def filter_by_column_eq(data: DataMapping, column_name: str, value) -> DataDict:
     """Return only rows of data where named column equals value."""
-    return filter_by_column_func(data, column_name, lambda x: x == value)
+    return filter_by_mask(data, mask_eq(data[column_name], value))
 
 
 def filter_by_column_ne(data: DataMapping, column_name: str, value) -> DataDict:
     """Return only rows of data where named column does not equal value."""
-    return filter_by_column_func(data, column_name, lambda x: x != value)
+    return filter_by_mask(data, mask_ne(data[column_name], value))
 
 
 def filter_by_column_gt(data: DataMapping, column_name: str, value) -> DataDict:
     """Return only rows of data where named column is greater than value."""
-    return filter_by_column_func(data, column_name, lambda x: x > value)
+    return filter_by_mask(data, mask_gt(data[column_name], value))
 
 
 def filter_by_column_lt(data: DataMapping, column_name: str, value) -> DataDict:
     """Return only rows of data where named column is less than value."""
-    return filter_by_column_func(data, column_name, lambda x: x < value)
+    return filter_by_mask(data, mask_lt(data[column_name], value))
 
 
 def filter_by_column_ge(data: DataMapping, column_name: str, value) -> DataDict:
     """Return only rows of data where named column is greater than or equal value."""
-    return filter_by_column_func(data, column_name, lambda x: x >= value)
+    return filter_by_mask(data, mask_ge(data[column_name], value))
 
 
 def filter_by_column_le(data: DataMapping, column_name: str, value) -> DataDict:
     """Return only rows of data where named column is less than or equal value."""
-    return filter_by_column_func(data, column_name, lambda x: x <= value)
+    return filter_by_mask(data, mask_le(data[column_name], value))
 
 
 def filter_by_column_isin(data: DataMapping, column_name: str, values: Sequence[Any]) -> DataDict:
     """Return only rows of data where named column is in values."""
-    return filter_by_column_func(data, column_name, lambda x: x in values)
+    return filter_by_mask(data, mask_isin(data[column_name], values))
 
 
 def filter_by_column_notin(data: DataMapping, column_name: str, values: Sequence[Any]) -> DataDict:
     """Return only rows of data where named column is not in values."""
-    return filter_by_column_func(data, column_name, lambda x: x not in values)
+    return filter_by_mask(data, mask_notin(data[column_name], values))
+
+
+def filter_by_multi_isin(
+    data: DataMapping,
+    column_names: Sequence[str],
+    values: Iterable[Sequence[Any]]
+) -> DataDict:
+    """
+    Return only rows of data where the tuple of named columns values is in values.
+
+    Example
+    -------
+    >>> data = {'x': [1, 1, 2], 'y': ['a', 'b', 'a'], 'z': [7, 8, 9]}
+    >>> filter_by_multi_isin(data, ['x', 'y'], [(1, 'b'), (2, 'a')])
+    {'x': [1, 2], 'y': ['b', 'a'], 'z': [8, 9]}
+    """
+    return filter_by_mask(data, mask_isin_multi([data[col] for col in column_names], values))
+
+
+def filter_by_multi_notin(
+    data: DataMapping,
+    column_names: Sequence[str],
+    values: Iterable[Sequence[Any]]
+) -> DataDict:
+    """Return only rows of data where the tuple of named columns values is not in values."""
+    return filter_by_mask(data, mask_notin_multi([data[col] for col in column_names], values))
 
 
 def sample(data: DataMapping, n: int, random_state: Optional[int] = None) -> DataDict:
@@ -95,9 +374,14 @@ def sample(data: DataMapping, n: int, random_state: Optional[int] = None) -> Dat
     return filter_by_indexes(data, indexes)
 
 
-def filter_by_columns(data: DataMapping, column_names: Sequence[str]) -> DataDict:
-    """Return new TableDict with only column_names."""
-    return {str(col): list(data[col]) for col in column_names}
+def filter_by_columns(data: DataMapping, column_names: Sequence[str], view: bool = False) -> DataDict:
+    """
+    Return new TableDict with only column_names.
+    If view is True, return tinytim.views.ColumnView columns instead of copies.
+    """
+    if view:
+        return views_functions.filter_by_columns(data, column_names)  # type: ignore[return-value]
+    return {str(col): arrays_functions.like_column(data[col], data[col]) for col in column_names}
 
 
 def filter_by_columns_inplace(data: DataDict, column_names: Sequence[str]) -> None:
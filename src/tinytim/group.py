@@ -1,9 +1,12 @@
-from statistics import mean, mode, pstdev, stdev
-from typing import Any, Callable, List, Mapping, Sequence, Tuple, Union
+from abc import ABC, abstractmethod
+from math import sqrt
+from statistics import StatisticsError, mean, mode, pstdev, stdev
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
 
 import tinytim.filter as filter_functions
 import tinytim.rows as rows_functions
 import tinytim.utils as utils_functions
+from tinytim.categorical import Categorical, combined_codes
 from tinytim.custom_types import DataDict, DataMapping, RowDict, RowMapping
 
 GroupbyValue = Union[Any, Tuple[Any, ...]]
@@ -62,15 +65,66 @@ def groupby(
         return groupbymulti(data, by)
 
 
+def group_indexes(column: Sequence[Any]) -> List[Tuple[Any, List[int]]]:
+    """
+    Find the row indexes of each distinct value in column, in one pass.
+
+    Values are hashed to find their group. Unhashable values
+    (lists, dicts, ...) fall back to an equality scan of the
+    unhashable groups seen so far.
+    Categorical columns are grouped by their int codes.
+
+    Parameters
+    ----------
+    column : Sequence
+        sequence of values to group
+
+    Returns
+    -------
+    list[tuple[Any, list[int]]]
+        (value, row indexes) for each distinct value, in first-seen order
+
+    Example
+    -------
+    >>> group_indexes(['a', 'b', 'a', 'c'])
+    [('a', [0, 2]), ('b', [1]), ('c', [3])]
+    """
+    if isinstance(column, Categorical):
+        return [(column.categories[code], indexes) for code, indexes in group_indexes(column.codes)]
+    keys = utils_functions.KeyIndex()
+    positions = keys.add_all(column)
+    groups: List[List[int]] = [[] for _ in keys.keys]
+    for i, position in enumerate(positions):
+        groups[position].append(i)
+    return list(zip(keys.keys, groups))
+
+
 def groupbycolumn(data: Mapping[Any, Any], column: Sequence[Any]) -> List[Group]:
-    keys = utils_functions.uniques(column)
+    """
+    Group data by the values in column.
+
+    Rows are assigned to groups in one hashed pass,
+    then each data column is gathered once per group.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+    column : Sequence
+        values to group by, same len as data columns
 
-    def make_filter(key: Any) -> Callable[[Any], bool]:
-        return lambda x: x == key
+    Returns
+    -------
+    list[tuple[Any, dict[str, list]]]
+        (group value, group data) in first-seen value order
 
-    return [(k, filter_functions.filter_data(data,
-                                             filter_functions.column_filter(column, make_filter(k))))
-                for k in keys]
+    Example
+    -------
+    >>> data = {'x': ['a', 'b', 'a'], 'y': [1, 2, 3]}
+    >>> groupbycolumn(data, data['x'])
+    [('a', {'x': ['a', 'a'], 'y': [1, 3]}), ('b', {'x': ['b'], 'y': [2]})]
+    """
+    return [(key, filter_functions.filter_by_indexes(data, indexes))
+                for key, indexes in group_indexes(column)]
 
 
 def groupbyone(data: Mapping[Any, Any], column_name: str) -> List[Group]:
@@ -78,6 +132,11 @@ def groupbyone(data: Mapping[Any, Any], column_name: str) -> List[Group]:
 
 
 def groupbymulti(data: Mapping[Any, Any], column_names: Sequence[str]) -> List[Group]:
+    columns = [data[col] for col in column_names]
+    if columns and all(isinstance(column, Categorical) for column in columns):
+        # group by one int per code combination instead of hashing row tuples
+        return [(tuple(column[indexes[0]] for column in columns), filter_functions.filter_by_indexes(data, indexes))
+                    for _, indexes in group_indexes(combined_codes(columns))]
     return groupbycolumn(data, utils_functions.row_value_tuples(data, column_names))
 
 
@@ -95,6 +154,231 @@ def aggregate_groups(
     return labels, rows_functions.row_dicts_to_data(rows)
 
 
+class _Accumulator(ABC):
+    """Running aggregate of one column for one group."""
+    @abstractmethod
+    def add(self, value: Any) -> None:
+        """Add one value to the aggregate."""
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Return the aggregate of the values added so far."""
+
+
+class _SumAccumulator(_Accumulator):
+    def __init__(self) -> None:
+        self.total: Any = 0
+
+    def add(self, value: Any) -> None:
+        self.total = self.total + value
+
+    def result(self) -> Any:
+        return self.total
+
+
+class _CountAccumulator(_Accumulator):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+
+    def result(self) -> Any:
+        return self.count
+
+
+class _MinAccumulator(_Accumulator):
+    def __init__(self) -> None:
+        self.empty = True
+        self.value: Any = None
+
+    def add(self, value: Any) -> None:
+        if self.empty or value < self.value:
+            self.value = value
+            self.empty = False
+
+    def result(self) -> Any:
+        return self.value
+
+
+class _MaxAccumulator(_MinAccumulator):
+    def add(self, value: Any) -> None:
+        if self.empty or value > self.value:
+            self.value = value
+            self.empty = False
+
+
+class _MeanAccumulator(_Accumulator):
+    """Welford running mean and sum of squared differences."""
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def result(self) -> Any:
+        if self.count < 1:
+            raise StatisticsError('mean requires at least one data point')
+        return self.mean
+
+
+class _StdevAccumulator(_MeanAccumulator):
+    def result(self) -> Any:
+        if self.count < 2:
+            raise StatisticsError('variance requires at least two data points')
+        return sqrt(self.m2 / (self.count - 1))
+
+
+class _PstdevAccumulator(_MeanAccumulator):
+    def result(self) -> Any:
+        if self.count < 1:
+            raise StatisticsError('pvariance requires at least one data point')
+        return sqrt(self.m2 / self.count)
+
+
+class _NuniqueAccumulator(_Accumulator):
+    def __init__(self) -> None:
+        self.values = utils_functions.KeyIndex()
+
+    def add(self, value: Any) -> None:
+        self.values.add(value)
+
+    def result(self) -> Any:
+        return len(self.values)
+
+
+class _ModeAccumulator(_Accumulator):
+    def __init__(self) -> None:
+        self.counts: Dict[Any, int] = {}
+
+    def add(self, value: Any) -> None:
+        self.counts[value] = self.counts.get(value, 0) + 1
+
+    def result(self) -> Any:
+        if not self.counts:
+            raise StatisticsError('no mode for empty data')
+        return max(self.counts, key=self.counts.__getitem__)
+
+
+AGGREGATIONS: Dict[str, Callable[[], _Accumulator]] = {
+    'sum': _SumAccumulator,
+    'count': _CountAccumulator,
+    'min': _MinAccumulator,
+    'max': _MaxAccumulator,
+    'mean': _MeanAccumulator,
+    'stdev': _StdevAccumulator,
+    'pstdev': _PstdevAccumulator,
+    'nunique': _NuniqueAccumulator,
+    'mode': _ModeAccumulator,
+}
+
+
+class GroupAggregator:
+    """
+    Running per group aggregations of data columns.
+
+    Keeps one accumulator per (group, column) and updates them
+    row by row, so groups are never copied into their own tables.
+    update can be called repeatedly with chunks of the same table.
+
+    Parameters
+    ----------
+    by : str | Sequence[str]
+        column name/s to group by
+    funcs : Mapping[str, str]
+        {column name: aggregation name},
+        aggregation names are the keys of AGGREGATIONS
+
+    Example
+    -------
+    >>> aggregator = GroupAggregator('Animal', {'Max Speed': 'sum'})
+    >>> aggregator.update({'Animal': ['Falcon', 'Parrot'], 'Max Speed': [380, 24]})
+    >>> aggregator.update({'Animal': ['Falcon', 'Parrot'], 'Max Speed': [370, 26]})
+    >>> aggregator.result()
+    (['Falcon', 'Parrot'], {'Max Speed': [750, 50]})
+    """
+    def __init__(
+        self,
+        by: Union[str, Sequence[str]],
+        funcs: Mapping[str, str]
+    ) -> None:
+        for func in funcs.values():
+            if func not in AGGREGATIONS:
+                raise ValueError(f'unknown aggregation {func!r}, must be one of {list(AGGREGATIONS)}')
+        self.by = by
+        self.columns = list(funcs)
+        self.factories = [AGGREGATIONS[funcs[col]] for col in self.columns]
+        self.accumulators: List[List[_Accumulator]] = []
+        self.keys = utils_functions.KeyIndex()
+
+    def _group(self, key: Any) -> List[_Accumulator]:
+        """Return accumulators for key's group, creating them for a new key."""
+        position = self.keys.add(key)
+        if position == len(self.accumulators):
+            self.accumulators.append([factory() for factory in self.factories])
+        return self.accumulators[position]
+
+    def update(self, data: DataMapping) -> None:
+        """Add the rows of data to the running aggregations."""
+        if isinstance(self.by, str):
+            keys: Iterable[Any] = data[self.by]
+        else:
+            keys = zip(*[data[col] for col in self.by])
+        columns = [data[col] for col in self.columns]
+        for key, *values in zip(keys, *columns):
+            for accumulator, value in zip(self._group(key), values):
+                accumulator.add(value)
+
+    def result(self) -> Tuple[List[Any], DataDict]:
+        """Return group labels and data dict of aggregations, in first-seen group order."""
+        out: DataDict = {col: [] for col in self.columns}
+        for accumulators in self.accumulators:
+            for col, accumulator in zip(self.columns, accumulators):
+                out[col].append(accumulator.result())
+        return list(self.keys.keys), out
+
+
+def aggregate(
+    data: DataMapping,
+    by: Union[str, Sequence[str]],
+    funcs: Mapping[str, str]
+) -> Tuple[List[Any], DataDict]:
+    """
+    Group data and aggregate columns in one pass,
+    without building a data table for each group.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+    by : str | Sequence[str]
+        column name/s to group by
+    funcs : Mapping[str, str]
+        {column name: aggregation name}, aggregation names are
+        'sum', 'count', 'min', 'max', 'mean', 'stdev', 'pstdev', 'nunique', 'mode'
+
+    Returns
+    -------
+    tuple[list, dict]
+        tuple of groupby values, data dict of aggregations
+
+    Example
+    -------
+    >>> data = {'Animal': ['Falcon', 'Falcon', 'Parrot', 'Parrot'],
+                'Color': ['Brown', 'Brown', 'Blue', 'Red'],
+                'Max Speed': [380, 370, 24, 26]}
+    >>> aggregate(data, 'Animal', {'Max Speed': 'mean', 'Color': 'nunique'})
+    (['Falcon', 'Parrot'], {'Max Speed': [375.0, 25.0], 'Color': [1, 2]})
+    """
+    aggregator = GroupAggregator(by, funcs)
+    aggregator.update(data)
+    return aggregator.result()
+
+
 def sum_groups(groups: List[Group]) -> Tuple[List[Any], DataDict]:
     """
     Sum groups together
@@ -1,8 +1,13 @@
-from typing import Iterable
+from itertools import chain, groupby, islice, repeat
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Sequence, Union
 
+import tinytim.arrays as arrays_functions
 import tinytim.data as data_features
 from tinytim.custom_types import DataDict, DataMapping, RowMapping, data_dict
 
+Row = Union[RowMapping, Sequence[Any]]
+
 
 def insert_row(
     data: DataMapping,
@@ -15,10 +20,12 @@ def insert_row(
 
 def insert_rows(
     data: DataMapping,
-    rows: Iterable[RowMapping]
+    rows: Iterable[RowMapping],
+    missing_value=None,
+    add_columns: bool = False
 ) -> DataDict:
     data = data_dict(data)
-    insert_rows_inplace(data, rows)
+    insert_rows_inplace(data, rows, missing_value, add_columns)
     return data
 
 
@@ -32,10 +39,150 @@ def insert_row_inplace(
 def insert_rows_inplace(
     data: DataDict,
     rows: Iterable[RowMapping],
-    missing_value=None
+    missing_value=None,
+    add_columns: bool = False
 ) -> None:
-    column_names = data_features.column_names(data)
-    for row in rows:
-        for column in column_names:
-            value = row.get(column, missing_value)
-            data[column].append(value)
+    with RowAppender(data, missing_value=missing_value, add_columns=add_columns) as appender:
+        appender.extend(rows)
+
+
+class RowAppender:
+    """
+    Buffer rows and append them to data columns in bulk.
+
+    Rows are row mappings of {column name: value} or tuples/lists of
+    values in column order. Buffered rows are transposed and added with
+    one extend per column when flush_size rows are buffered, when flush()
+    is called and when a with block ends without an exception.
+
+    Parameters
+    ----------
+    data : dict[str, list]
+        data mapping of {column name: column values} to append to
+    flush_size : int, default 10_000
+        number of buffered rows that triggers a flush
+    add_columns : bool, default False
+        add a column for row mapping keys that are not data columns,
+        filled with missing_value for earlier rows.
+        If False, those keys are ignored.
+    missing_value : Any, default None
+        value appended for columns missing from a row mapping
+
+    Example
+    -------
+    >>> data = {'x': [1], 'y': [6]}
+    >>> with RowAppender(data, add_columns=True) as appender:
+    ...     appender.append({'x': 2, 'y': 7})
+    ...     appender.append((3, 8))
+    ...     appender.append({'x': 4, 'z': 0})
+    >>> data
+    {'x': [1, 2, 3, 4], 'y': [6, 7, 8, None], 'z': [None, None, None, 0]}
+    """
+    def __init__(
+        self,
+        data: DataDict,
+        flush_size: int = 10_000,
+        add_columns: bool = False,
+        missing_value: Any = None
+    ) -> None:
+        if flush_size < 1:
+            raise ValueError('flush_size must be at least 1')
+        self.data = data
+        self.flush_size = flush_size
+        self.add_columns = add_columns
+        self.missing_value = missing_value
+        self._rows: List[Any] = []
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._rows)
+
+    def __enter__(self) -> 'RowAppender':
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def append(self, row: Row) -> None:
+        """Buffer one row."""
+        self.extend([row])
+
+    def extend(self, rows: Iterable[Row]) -> None:
+        """Buffer rows, flushing every flush_size rows."""
+        rows = iter(rows)
+        while True:
+            self._rows.extend(islice(rows, self.flush_size - len(self._rows)))
+            if len(self._rows) < self.flush_size:
+                return
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Append the buffered rows to data.
+
+        All new column values are built and checked before any column is extended,
+        so if a row does not fit (wrong length, a None for an array column, ...)
+        the error is raised with data unchanged and the rows still buffered.
+        """
+        rows = self._rows
+        if not rows:
+            return
+        columns: Dict[str, List[Any]] = {column: [] for column in data_features.column_names(self.data)}
+        sequences = bytes(map(isinstance, rows, repeat((tuple, list))))
+        if 1 not in sequences:
+            self._mapping_values(rows, columns)
+        elif 0 not in sequences:
+            self._sequence_values(rows, columns)
+        else:
+            for is_sequence, run in groupby(zip(sequences, rows), itemgetter(0)):
+                run_rows = [row for _, row in run]
+                if is_sequence:
+                    self._sequence_values(run_rows, columns)
+                else:
+                    self._mapping_values(run_rows, columns)
+        new_values: Dict[str, Sequence[Any]] = {}
+        for column, values in columns.items():
+            stored = self.data.get(column)
+            if stored is None or isinstance(stored, list):
+                new_values[column] = values
+            else:
+                # array and Categorical columns check and convert values before anything is extended
+                new_values[column] = arrays_functions.like_column(stored, values)
+        row_count = data_features.row_count(self.data)
+        for column, new in new_values.items():
+            if column not in self.data:
+                self.data[column] = [self.missing_value] * row_count
+            self.data[column].extend(new)
+        self._rows = []
+
+    def _sequence_values(self, rows: List[Sequence[Any]], columns: Dict[str, List[Any]]) -> None:
+        """Add the values of row sequences to columns."""
+        if set(map(len, rows)) != {len(columns)}:
+            raise ValueError(f'row sequences must have {len(columns)} values, one per column')
+        for values, row_values in zip(columns.values(), zip(*rows)):
+            values.extend(row_values)
+
+    def _mapping_values(self, rows: List[RowMapping], columns: Dict[str, List[Any]]) -> None:
+        """Add the values of row mappings to columns, adding new columns if add_columns."""
+        if self.add_columns:
+            buffered = len(next(iter(columns.values()), []))
+            for key in dict.fromkeys(chain.from_iterable(rows)):
+                if key not in columns:
+                    columns[key] = [self.missing_value] * buffered
+        if not columns:
+            return
+        names = list(columns)
+        try:
+            # every row has every column: one C level gather per row
+            values = list(map(itemgetter(*names), rows))
+        except KeyError:
+            missing_value = self.missing_value
+            for column, column_values in columns.items():
+                column_values.extend([row.get(column, missing_value) for row in rows])
+            return
+        if len(names) == 1:
+            columns[names[0]].extend(values)
+            return
+        for column_values, row_values in zip(columns.values(), zip(*values)):
+            column_values.extend(row_values)
@@ -1,23 +1,164 @@
-from typing import Any, List, Sequence
+"""
+Functions for finding missing values.
 
-import tinytim.data as data_functions
-from tinytim.custom_types import DataDict, DataMapping, RowDict, RowMapping, data_dict, row_dict
+na_value can be a single missing value (None by default, NaN matches any NaN)
+or a MissingValues of several sentinels checked together.
+"""
 
+import operator
+from itertools import repeat
+from typing import Any, Callable, List, Sequence
 
-def is_missing(value, missing_value) -> bool:
-    return value == missing_value or value is missing_value
+import tinytim.data as data_functions
+import tinytim.utils as utils_functions
+from tinytim.custom_types import Column, DataDict, DataMapping, RowDict, RowMapping, row_dict
+
+NAN = float('nan')
+
+# builtin types that never equal None or themselves unless NaN, so no __eq__ call is needed
+_SCALAR_TYPES = frozenset([type(None), bool, int, float, complex, str, bytes])
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and value != value
+
+
+class MissingValues:
+    """
+    Several missing value sentinels checked together, pass as na_value.
+
+    A value is missing if it is one of the sentinels, if it is NaN
+    and NaN is a sentinel, or if it is hashable and equal to a hashable sentinel.
+    Values are never compared with __eq__ to unhashable sentinels,
+    those only match by identity.
+
+    Parameters
+    ----------
+    *values : Any
+        missing value sentinels
+
+    Example
+    -------
+    >>> na = MissingValues(None, NAN, '')
+    >>> [is_missing(x, na) for x in [None, float('nan'), '', 0]]
+    [True, True, True, False]
+    """
+    def __init__(self, *values: Any) -> None:
+        self.values = values
+        self.nan = any(_is_nan(value) for value in values)
+        # unhashable sentinels only match by identity
+        self.sentinels = utils_functions.KeyIndex((value for value in values if not _is_nan(value)), identity=True)
+
+    def __repr__(self) -> str:
+        return f'MissingValues({", ".join(map(repr, self.values))})'
+
+    def __contains__(self, value: Any) -> bool:
+        if self.nan and _is_nan(value):
+            return True
+        return value in self.sentinels
+
+    def mask(self, column: Sequence[Any]) -> bytes:
+        """Return bytes of 1 where column item is missing, 0 where not."""
+        try:
+            mask = bytes(map(self.sentinels.hashed.__contains__, column))
+        except TypeError:
+            return bytes(map(self.__contains__, column))
+        if not self.nan and not self.sentinels.unhashed:
+            return mask
+        bits = int.from_bytes(mask, 'little')
+        if self.nan:
+            bits |= int.from_bytes(_nan_mask(column), 'little')
+        for sentinel, _ in self.sentinels.unhashed:
+            bits |= int.from_bytes(bytes(map(operator.is_, column, repeat(sentinel))), 'little')
+        return bits.to_bytes(len(column), 'little')
+
+
+NA = MissingValues(None, NAN)
+
+
+def is_missing(value: Any, missing_value: Any) -> bool:
+    """
+    Return if value is missing_value.
+
+    Examples
+    --------
+    >>> is_missing(None, None)
+    True
+    >>> is_missing(float('nan'), NAN)
+    True
+    >>> is_missing(float('nan'), MissingValues(None, NAN))
+    True
+    """
+    if isinstance(missing_value, MissingValues):
+        return value in missing_value
+    if value is missing_value:
+        return True
+    if _is_nan(missing_value):
+        return _is_nan(value)
+    return bool(value == missing_value)
+
+
+def _is_none(value: Any) -> bool:
+    return value is None or (type(value) not in _SCALAR_TYPES and bool(value == None))  # noqa: E711
+
+
+def missing_check(na_value: Any = None) -> Callable[[Any], bool]:
+    """
+    Return a function that tests if a value is missing, same as is_missing,
+    specialized for na_value so per value checks skip the dispatch.
+
+    Example
+    -------
+    >>> check = missing_check(None)
+    >>> check(None), check(0)
+    (True, False)
+    """
+    if isinstance(na_value, MissingValues):
+        return na_value.__contains__
+    if na_value is None:
+        return _is_none
+    if _is_nan(na_value):
+        return _is_nan
+    return lambda value: value is na_value or bool(value == na_value)
+
+
+def _nan_mask(column: Sequence[Any]) -> bytes:
+    if set(map(type, column)) <= _SCALAR_TYPES:
+        # only NaN floats are not equal to themselves
+        return bytes(map(operator.ne, column, column))
+    return bytes(map(_is_nan, column))
+
+
+def column_isnull_mask(column: Sequence[Any], na_value=None) -> bytes:
+    """
+    Return bytes of 1 where column item is missing, 0 where not.
+    Same test as is_missing, looping in C.
+
+    Example
+    -------
+    >>> column_isnull_mask([1, None, 3])
+    b'\\x00\\x01\\x00'
+    >>> column_isnull_mask([1.0, float('nan'), None], MissingValues(None, NAN))
+    b'\\x00\\x01\\x01'
+    """
+    if isinstance(na_value, MissingValues):
+        return na_value.mask(column)
+    if _is_nan(na_value):
+        return _nan_mask(column)
+    na_values = repeat(na_value)
+    if na_value is None and set(map(type, column)) <= _SCALAR_TYPES:
+        # these types only equal None when they are None
+        return bytes(map(operator.is_, column, na_values))
+    equal = map(bool, map(operator.eq, column, na_values))
+    return bytes(map(operator.or_, equal, map(operator.is_, column, na_values)))
 
 
 def isnull(data: DataMapping, na_value=None) -> DataDict:
-    data = data_dict(data)
-    isnull_inplace(data, na_value)
-    return data
+    return {str(col): column_isnull(values, na_value) for col, values in data.items()}
 
 
 def notnull(data: DataMapping, na_value=None) -> DataDict:
-    data = data_dict(data)
-    notnull_inplace(data, na_value)
-    return data
+    return {str(col): column_notnull(values, na_value) for col, values in data.items()}
 
 
 isna = isnull
@@ -35,25 +176,19 @@ def notnull_inplace(data: DataDict, na_value=None) -> None:
 
 
 def column_isnull(column: Sequence[Any], na_value=None) -> List[Any]:
-    column = list(column)
-    column_isnull_inplace(column, na_value)
-    return column
+    return list(map(bool, column_isnull_mask(column, na_value)))
 
 
 def column_notnull(column: Sequence[Any], na_value=None) -> List[Any]:
-    column = list(column)
-    column_notnull_inplace(column, na_value)
-    return column
+    return list(map(operator.not_, column_isnull_mask(column, na_value)))
 
 
-def column_isnull_inplace(column: List[Any], na_value=None) -> None:
-    for i, item in enumerate(column):
-        column[i] =  is_missing(item, na_value)
+def column_isnull_inplace(column: Column, na_value=None) -> None:
+    column[:] = column_isnull(column, na_value)
 
 
-def column_notnull_inplace(column: List[Any], na_value=None) -> None:
-    for i, item in enumerate(column):
-        column[i] = not is_missing(item, na_value)
+def column_notnull_inplace(column: Column, na_value=None) -> None:
+    column[:] = column_notnull(column, na_value)
 
 
 def row_isnull(row: RowMapping, na_value=None) -> RowDict:
@@ -1,6 +1,25 @@
-from itertools import repeat
-from typing import Any, Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
-
+"""
+Functions for joining data tables on key columns.
+
+Join strategies
+---------------
+strategy='hash' matches keys with a hash table,
+output is in left table order (right table order for right_join).
+
+strategy='merge' sort-merge joins, output is in join key order.
+Already sorted keys are not re-sorted.
+Keys must be comparable with each other (such as all numbers or all str),
+otherwise ValueError is raised.
+None and NaN keys, and tuple keys holding them, cannot be ordered:
+they are matched the way the hash strategy matches them and come after all other keys.
+"""
+
+from itertools import islice, repeat
+from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import tinytim.filter as filter_functions
+import tinytim.group as group_functions
+from tinytim.categorical import Categorical
 from tinytim.custom_types import DataDict, DataMapping
 
 
@@ -19,7 +38,8 @@ def inner_join(
     right: DataMapping,
     left_on: str,
     right_on: Optional[str] = None,
-    select: Optional[Sequence[str]] = None
+    select: Optional[Sequence[str]] = None,
+    strategy: str = 'hash'
 ) -> DataDict:
     """
     Inner Join two data dict on a specified column name(s).
@@ -36,6 +56,8 @@ def inner_join(
         column name to join on in right, join on left_on if None
     select : list[str], optional
         column names to return
+    strategy : str, default 'hash'
+        'hash' or 'merge', see Join strategies in the tinytim.join module docstring.
 
     Returns
     -------
@@ -49,7 +71,8 @@ def inner_join(
     >>> inner_join(left, right, 'id')
     {'id': ['a', 'c', 'd'], 'x': [33, 44, 55], 'y': [11, 33, 44]}
     """
-    return _join(left, right, left_on, right_on, select, _inner_matching_indexes)
+    join_strategy = _choose_strategy(strategy, _inner_matching_indexes, _inner_merge_indexes)
+    return _join(left, right, left_on, right_on, select, join_strategy)
 
 
 def full_join(
@@ -57,7 +80,8 @@ def full_join(
     right: DataMapping,
     left_on: str,
     right_on: Optional[str] = None,
-    select: Optional[Sequence[str]] = None
+    select: Optional[Sequence[str]] = None,
+    strategy: str = 'hash'
 ) -> DataDict:
     """
     Full Join two data dict on a specified column name(s).
@@ -74,6 +98,8 @@ def full_join(
         column name to join on in right, join on left_on if None
     select : list[str], optional
         column names to return
+    strategy : str, default 'hash'
+        'hash' or 'merge', see Join strategies in the tinytim.join module docstring.
 
     Returns
     -------
@@ -89,7 +115,8 @@ def full_join(
      'x': [33, 44, 55, 66, 77, None],
      'y': [11, 33, 44, None, None, 22]}
     """
-    return _join(left, right, left_on, right_on, select, _full_matching_indexes)
+    join_strategy = _choose_strategy(strategy, _full_matching_indexes, _full_merge_indexes)
+    return _join(left, right, left_on, right_on, select, join_strategy)
 
 
 def left_join(
@@ -97,7 +124,8 @@ def left_join(
     right: DataMapping,
     left_on: str,
     right_on: Optional[str] = None,
-    select: Optional[Sequence[str]] = None
+    select: Optional[Sequence[str]] = None,
+    strategy: str = 'hash'
 ) -> DataDict:
     """
     Left Join two data dict on a specified column name(s).
@@ -115,6 +143,8 @@ def left_join(
         column name to join on in right, join on left_on if None
     select : list[str], optional
         column names to return
+    strategy : str, default 'hash'
+        'hash' or 'merge', see Join strategies in the tinytim.join module docstring.
 
     Returns
     -------
@@ -128,7 +158,8 @@ def left_join(
     >>> left_join(left, right, 'id')
     {'id': ['a', 'c', 'd', 'f'], 'x': [33, 44, 55, 66], 'y': [11, 33, 44, None]}
     """
-    return _join(left, right, left_on, right_on, select, _left_matching_indexes)
+    join_strategy = _choose_strategy(strategy, _left_matching_indexes, _left_merge_indexes)
+    return _join(left, right, left_on, right_on, select, join_strategy)
 
 
 def right_join(
@@ -136,7 +167,8 @@ def right_join(
     right: DataMapping,
     left_on: str,
     right_on: Optional[str] = None,
-    select: Optional[Sequence[str]] = None
+    select: Optional[Sequence[str]] = None,
+    strategy: str = 'hash'
 ) -> DataDict:
     """
     Right Join two data dict on a specified column name(s).
@@ -154,6 +186,8 @@ def right_join(
         column name to join on in right, join on left_on if None
     select : list[str], optional
         column names to return
+    strategy : str, default 'hash'
+        'hash' or 'merge', see Join strategies in the tinytim.join module docstring.
 
     Returns
     -------
@@ -167,7 +201,95 @@ def right_join(
     >>> right_join(left, right, 'id')
     {'id': ['a', 'b', 'c', 'd'], 'x': [33, None, 44, 55], 'y': [11, 22, 33, 44]}
     """
-    return _join(left, right, left_on, right_on, select, _right_matching_indexes)
+    join_strategy = _choose_strategy(strategy, _right_matching_indexes, _right_merge_indexes)
+    return _join(left, right, left_on, right_on, select, join_strategy)
+
+
+def semi_join(
+    left: DataMapping,
+    right: DataMapping,
+    left_on: Union[str, Sequence[str]],
+    right_on: Optional[Union[str, Sequence[str]]] = None
+) -> DataDict:
+    """
+    Return only left rows whose join key is in right.
+    Right keys are hashed once and no right columns are added.
+
+    Parameters
+    ----------
+    left : Mapping[str, Sequence[Any]]
+        left data mapping of {column name: column values}
+    right : Mapping[str, Sequence[Any]]
+        right data mapping of {column name: column values}
+    left_on : str | Sequence[str]
+        column name/s to join on in left
+    right_on : str | Sequence[str], optional
+        column name/s to join on in right, join on left_on if None
+
+    Returns
+    -------
+    DataDict
+        left rows with a match in right
+
+    Example
+    -------
+    >>> left = {'id': ['a', 'c', 'd', 'f'], 'x': [33, 44, 55, 66]}
+    >>> right = {'id': ['a', 'b', 'c', 'c'], 'y': [11, 22, 33, 44]}
+    >>> semi_join(left, right, 'id')
+    {'id': ['a', 'c'], 'x': [33, 44]}
+    """
+    return filter_functions.filter_by_mask(left, _semi_mask(left, right, left_on, right_on))
+
+
+def anti_join(
+    left: DataMapping,
+    right: DataMapping,
+    left_on: Union[str, Sequence[str]],
+    right_on: Optional[Union[str, Sequence[str]]] = None
+) -> DataDict:
+    """
+    Return only left rows whose join key is not in right.
+
+    Parameters
+    ----------
+    left : Mapping[str, Sequence[Any]]
+        left data mapping of {column name: column values}
+    right : Mapping[str, Sequence[Any]]
+        right data mapping of {column name: column values}
+    left_on : str | Sequence[str]
+        column name/s to join on in left
+    right_on : str | Sequence[str], optional
+        column name/s to join on in right, join on left_on if None
+
+    Returns
+    -------
+    DataDict
+        left rows without a match in right
+
+    Example
+    -------
+    >>> left = {'id': ['a', 'c', 'd', 'f'], 'x': [33, 44, 55, 66]}
+    >>> right = {'id': ['a', 'b', 'c', 'c'], 'y': [11, 22, 33, 44]}
+    >>> anti_join(left, right, 'id')
+    {'id': ['d', 'f'], 'x': [55, 66]}
+    """
+    return filter_functions.filter_by_mask(left, filter_functions.mask_not(_semi_mask(left, right, left_on, right_on)))
+
+
+def _semi_mask(
+    left: DataMapping,
+    right: DataMapping,
+    left_on: Union[str, Sequence[str]],
+    right_on: Optional[Union[str, Sequence[str]]] = None
+) -> bytes:
+    """Return mask of left rows whose join key is in right."""
+    right_on = left_on if right_on is None else right_on
+    _check_on_types(left_on, right_on)
+    _check_for_missing_on(left, left_on, 'left')
+    _check_for_missing_on(right, right_on, 'right')
+    if isinstance(left_on, str):
+        return filter_functions.mask_isin(left[left_on], right[right_on])  # type: ignore[index]
+    return filter_functions.mask_isin_multi([left[col] for col in left_on], _tuple_keys(right, right_on))
 
 
 def locate(
@@ -198,6 +320,115 @@ def locate(
     return [i for i, x in enumerate(seq) if x == value]
 
 
+def _index_multimap(values: Sequence[Any]) -> Dict[Any, List[int]]:
+    """
+    Map each distinct value to the ascending list of indexes it is found at.
+    Raises TypeError if any value is unhashable.
+
+    Parameters
+    ----------
+    values : Sequence
+        sequence of values to index
+
+    Returns
+    -------
+    dict[Any, list[int]]
+        {value: indexes of value in values}
+
+    Example
+    -------
+    >>> values = ['a', 'b', 'a', 'c']
+    >>> _index_multimap(values)
+    {'a': [0, 2], 'b': [1], 'c': [3]}
+    """
+    multimap: Dict[Any, List[int]] = {}
+    for i, value in enumerate(values):
+        indexes = multimap.get(value)
+        if indexes is None:
+            multimap[value] = [i]
+        else:
+            indexes.append(i)
+    return multimap
+
+
+def _locate_matches(
+    outer: Sequence[Any],
+    inner: Sequence[Any]
+) -> List[Tuple[int, Any, List[int]]]:
+    """
+    Return (outer index, value, matching inner indexes) for every outer value
+    by scanning inner with locate. Used when join keys are unhashable.
+    """
+    return [(i, value, locate(inner, value)) for i, value in enumerate(outer)]
+
+
+def _hash_matches(
+    outer: Sequence[Any],
+    inner: Sequence[Any]
+) -> List[Tuple[int, Any, List[int]]]:
+    """
+    Return (outer index, value, matching inner indexes) for every outer value.
+
+    Builds a value -> indexes hash table on the smaller sequence once
+    and probes it with the other, so matching runs in linear time.
+    Results follow outer order, with inner indexes in ascending order.
+    Falls back to scanning with locate if any value is unhashable.
+    If either sequence is a Categorical, both are matched by code.
+
+    Parameters
+    ----------
+    outer : Sequence
+        sequence of values that drives output order
+    inner : Sequence
+        sequence of values to find matches in
+
+    Returns
+    -------
+    list[tuple[int, Any, list[int]]]
+
+    Example
+    -------
+    >>> outer = ['a', 'c', 'd']
+    >>> inner = ['c', 'a', 'c']
+    >>> _hash_matches(outer, inner)
+    [(0, 'a', [1]), (1, 'c', [0, 2]), (2, 'd', [])]
+    """
+    if isinstance(outer, Categorical):
+        return _categorical_matches(outer, inner, outer)
+    if isinstance(inner, Categorical):
+        return _categorical_matches(outer, inner, inner)
+    try:
+        if len(inner) <= len(outer):
+            inner_map = _index_multimap(inner)
+            return [(i, value, inner_map.get(value, [])) for i, value in enumerate(outer)]
+        outer_map = _index_multimap(outer)
+        found: Dict[int, List[int]] = {}
+        for j, value in enumerate(inner):
+            for i in outer_map.get(value, ()):
+                found.setdefault(i, []).append(j)
+        return [(i, value, found.get(i, [])) for i, value in enumerate(outer)]
+    except TypeError:
+        return _locate_matches(outer, inner)
+
+
+def _categorical_matches(
+    outer: Sequence[Any],
+    inner: Sequence[Any],
+    base: Categorical
+) -> List[Tuple[int, Any, List[int]]]:
+    """
+    _hash_matches by code: outer and inner are encoded with the categories of base,
+    inner indexes are grouped by code once, then looked up by outer code.
+    """
+    outer_column = base.like(outer)
+    # inner categories extend outer categories, so outer codes mean the same in both
+    inner_column = outer_column.like(inner)
+    by_code: List[List[int]] = [[] for _ in inner_column.categories]
+    for code, indexes in group_functions.group_indexes(inner_column.codes):
+        by_code[code] = indexes
+    return list(zip(range(len(outer)), outer_column, map(by_code.__getitem__, outer_column.codes)))
+
+
 def _name_matches(matches: Iterable[Tuple[Any, int, int]]) -> Tuple[MatchIndexes, ...]:
     """
     Convert tuples into MatchIndexes namedtuples.
@@ -256,8 +487,7 @@ def _inner_matching_indexes(
      MatchIndexes(value='a', left_index=4, right_index=0))
     """
     out: List[MatchIndexes] = []
-    for i, value in enumerate(left):
-        right_i = locate(right, value)
+    for i, value, right_i in _hash_matches(left, right):
         count = len(right_i)
         out.extend(_name_matches(zip(repeat(value, count), repeat(i, count), right_i)))
     return tuple(out)
@@ -295,8 +525,7 @@ def _left_matching_indexes(
      MatchIndexes(value='g', left_index=5, right_index=None))
     """
     out: List[MatchIndexes] = []
-    for i, value in enumerate(left):
-        right_i = locate(right, value)
+    for i, value, right_i in _hash_matches(left, right):
         if right_i:
             count = len(right_i)
             out.extend(_name_matches(zip(repeat(value, count), repeat(i, count), right_i)))
@@ -335,8 +564,7 @@ def _right_matching_indexes(
      MatchIndexes(value='c', left_index=1, right_index=4))
     """
     out: List[MatchIndexes] = []
-    for i, value in enumerate(l2):
-        l1_i = locate(l1, value)
+    for i, value, l1_i in _hash_matches(l2, l1):
         if l1_i:
             count = len(l1_i)
             out.extend(_name_matches(zip(repeat(value, count), l1_i, repeat(i, count))))
@@ -378,8 +606,7 @@ def _full_matching_indexes(
      MatchIndexes(value='b', left_index=None, right_index=1))
     """
     out: List[MatchIndexes] = []
-    for i, value in enumerate(left):
-        right_i = locate(right, value)
+    for i, value, right_i in _hash_matches(left, right):
         if right_i:
             count = len(right_i)
             out.extend(_name_matches(zip(repeat(value, count), repeat(i, count), right_i)))
@@ -392,6 +619,196 @@ def _full_matching_indexes(
     return tuple(out)
 
 
+def _is_sorted(values: Sequence[Any]) -> bool:
+    """Return if values are in ascending order."""
+    return all(a <= b for a, b in zip(values, islice(values, 1, None)))
+
+
+def _is_unordered_key(value: Any) -> bool:
+    """Return if value is None, NaN or a tuple key holding one, which cannot be sorted."""
+    if isinstance(value, tuple):
+        return any(map(_is_unordered_key, value))
+    return value is None or value != value
+
+
+def _sorted_indexes(values: Sequence[Any]) -> Tuple[Sequence[int], List[int]]:
+    """
+    Return the indexes of values in ascending value order,
+    and the indexes of unordered (None or NaN) values.
+    Equal values keep their original index order.
+    Already sorted values are not re-sorted.
+
+    Example
+    -------
+    >>> _sorted_indexes(['c', 'a', None, 'b', 'a'])
+    ([1, 4, 3, 0], [2])
+    """
+    unordered = [i for i, value in enumerate(values) if _is_unordered_key(value)]
+    if not unordered:
+        if _is_sorted(values):
+            return range(len(values)), unordered
+        return sorted(range(len(values)), key=values.__getitem__), unordered
+    skip = set(unordered)
+    ordered = [i for i in range(len(values)) if i not in skip]
+    return sorted(ordered, key=values.__getitem__), unordered
+
+
+def _merge_runs(
+    left: Sequence[Any],
+    right: Sequence[Any]
+) -> Generator[Tuple[Any, List[int], List[int]], None, None]:
+    """
+    Sort-merge two sequences of keys.
+    Yields (value, left indexes, right indexes) for each distinct value
+    found in either sequence, in ascending value order,
+    followed by the unordered (None or NaN) values grouped like dict keys.
+    One of the index lists is empty if the value is only found on one side.
+
+    Parameters
+    ----------
+    left : Sequence
+    right : Sequence
+
+    Returns
+    -------
+    Generator[tuple[Any, list[int], list[int]], None, None]
+
+    Raises
+    ------
+    ValueError
+        if keys cannot be compared with each other
+
+    Example
+    -------
+    >>> list(_merge_runs(['a', 'c', None, 'c'], ['b', 'c', None]))
+    [('a', [0], []), ('b', [], [0]), ('c', [1, 3], [1]), (None, [2], [2])]
+    """
+    try:
+        left_order, left_unordered = _sorted_indexes(left)
+        right_order, right_unordered = _sorted_indexes(right)
+        left_len, right_len = len(left_order), len(right_order)
+        li = ri = 0
+        while li < left_len or ri < right_len:
+            left_run: List[int] = []
+            right_run: List[int] = []
+            if li < left_len and (ri == right_len or not right[right_order[ri]] < left[left_order[li]]):
+                value = left[left_order[li]]
+                left_run.append(left_order[li])
+                li += 1
+            else:
+                value = right[right_order[ri]]
+                right_run.append(right_order[ri])
+                ri += 1
+            while li < left_len and left[left_order[li]] == value:
+                left_run.append(left_order[li])
+                li += 1
+            while ri < right_len and right[right_order[ri]] == value:
+                right_run.append(right_order[ri])
+                ri += 1
+            yield value, left_run, right_run
+    except TypeError as error:
+        raise ValueError(f"strategy='merge' needs join keys that can be compared with each other: {error}") from None
+    runs: Dict[Any, Tuple[List[int], List[int]]] = {}
+    for i in left_unordered:
+        runs.setdefault(left[i], ([], []))[0].append(i)
+    for j in right_unordered:
+        runs.setdefault(right[j], ([], []))[1].append(j)
+    for value, (left_run, right_run) in runs.items():
+        yield value, left_run, right_run
+
+
+def _inner_merge_indexes(
+    left: Sequence[Any],
+    right: Sequence[Any]
+) -> Tuple[MatchIndexes, ...]:
+    """
+    Sort-merge version of _inner_matching_indexes.
+    Matches are in ascending value order.
+
+    Example
+    -------
+    >>> l1 = ['a', 'c', 'd', 'f', 'a']
+    >>> l2 = ['a', 'b', 'c', 'd', 'c']
+    >>> _inner_merge_indexes(l1, l2)
+    (MatchIndexes(value='a', left_index=0, right_index=0),
+     MatchIndexes(value='a', left_index=4, right_index=0),
+     MatchIndexes(value='c', left_index=1, right_index=2),
+     MatchIndexes(value='c', left_index=1, right_index=4),
+     MatchIndexes(value='d', left_index=2, right_index=3))
+    """
+    return tuple(MatchIndexes(value, i, j)
+        for value, left_run, right_run in _merge_runs(left, right)
+            for i in left_run for j in right_run)
+
+
+def _left_merge_indexes(
+    left: Sequence[Any],
+    right: Sequence[Any]
+) -> Tuple[MatchIndexes, ...]:
+    """
+    Sort-merge version of _left_matching_indexes.
+    Matches are in ascending value order.
+    """
+    out: List[MatchIndexes] = []
+    for value, left_run, right_run in _merge_runs(left, right):
+        for i in left_run:
+            if right_run:
+                out.extend(MatchIndexes(value, i, j) for j in right_run)
+            else:
+                out.append(MatchIndexes(value, left_index=i))
+    return tuple(out)
+
+
+def _right_merge_indexes(
+    left: Sequence[Any],
+    right: Sequence[Any]
+) -> Tuple[MatchIndexes, ...]:
+    """
+    Sort-merge version of _right_matching_indexes.
+    Matches are in ascending value order.
+    """
+    out: List[MatchIndexes] = []
+    for value, left_run, right_run in _merge_runs(left, right):
+        for j in right_run:
+            if left_run:
+                out.extend(MatchIndexes(value, i, j) for i in left_run)
+            else:
+                out.append(MatchIndexes(value, right_index=j))
+    return tuple(out)
+
+
+def _full_merge_indexes(
+    left: Sequence[Any],
+    right: Sequence[Any]
+) -> Tuple[MatchIndexes, ...]:
+    """
+    Sort-merge version of _full_matching_indexes.
+    Matches, including unmatched right values, are in ascending value order.
+    """
+    out: List[MatchIndexes] = []
+    for value, left_run, right_run in _merge_runs(left, right):
+        if not left_run:
+            out.extend(MatchIndexes(value, right_index=j) for j in right_run)
+        for i in left_run:
+            if right_run:
+                out.extend(MatchIndexes(value, i, j) for j in right_run)
+            else:
+                out.append(MatchIndexes(value, left_index=i))
+    return tuple(out)
+
+
+def _choose_strategy(
+    strategy: str,
+    hash_strategy: JoinStrategy,
+    merge_strategy: JoinStrategy
+) -> JoinStrategy:
+    if strategy == 'hash':
+        return hash_strategy
+    if strategy == 'merge':
+        return merge_strategy
+    raise ValueError(f"strategy must be 'hash' or 'merge', not {strategy!r}")
+
+
 def _filter_values_by_index_matches(
     values: Sequence[Any],
     indexes: Sequence[Union[int, None]]
@@ -457,7 +874,7 @@ def _check_for_missing_on(
     else:
         for col in on_name:
             if col not in table:
-                _missing_col_error(col, table_name)
+                raise _missing_col_error(col, table_name)
 
 
 def _tuple_keys(
@@ -557,7 +974,7 @@ def _join(
     values = [x.value for x in indexes]
     left_indexes = [x.left_index for x in indexes]
     right_indexes = [x.right_index for x in indexes]
-    out = {col: _filter_values_by_index_matches(left[col], left_indexes) for col in left}
+    out: DataDict = {col: _filter_values_by_index_matches(left[col], left_indexes) for col in left}
 
     for col in right:
         if col not in [left_on, right_on]:
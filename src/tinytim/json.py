@@ -1,12 +1,38 @@
 """
 Module used for converting data format to json and json to data format.
+
+Data is written as a list of row objects (orient='records'),
+or as one object of {column name: column values} (orient='columns'),
+which maps to data format without transposing rows.
+read_json, iter_json and the writers work on files one row at a time,
+so the whole json text is never held as one str.
+
+JSON Lines (ndjson) files have one row object per line,
+iter_ndjson and read_ndjson parse them in chunks of lines,
+optionally across a pool of processes.
 """
 
 import json
-from typing import Any, Dict, List, Sequence
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence
 
+import tinytim.data as data_functions
+import tinytim.insert as insert_functions
 import tinytim.rows as rows_functions
-from tinytim.custom_types import DataDict, DataMapping, RowDict, RowMapping
+import tinytim.stream as stream_functions
+import tinytim.utils as utils_functions
+from tinytim.custom_types import DataDict, DataMapping, PathOrFile, RowDict, RowMapping
+
+# characters read from a file at a time by the incremental readers
+BLOCK_SIZE = 1 << 16
+
+# rows encoded per write by the streaming writers
+_WRITE_BATCH_SIZE = 10_000
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
 
 
 def data_to_json_list(data: DataMapping) -> List[RowDict]:
@@ -29,7 +55,7 @@ def data_to_json_list(data: DataMapping) -> List[RowDict]:
     >>> data_to_json_list(data)
     [{'x': 1, 'y': 6}, {'x': 2, 'y': 7}, {'x': 3, 'y': 8}]
     """
-    return [row for _, row in rows_functions.iterrows(data)]
+    return list(rows_functions.records(data))
 
 
 def json_list_to_data(row_list: Sequence[RowMapping]) -> DataDict:
@@ -55,49 +81,514 @@ def json_list_to_data(row_list: Sequence[RowMapping]) -> DataDict:
     return rows_functions.row_dicts_to_data(row_list)
 
 
-def data_to_json(data: DataMapping) -> str:
+def data_to_json(data: DataMapping, orient: str = 'records') -> str:
     """
-    Convert data table to list of row dicts json string.
+    Convert data table to list of row dicts json string,
+    or to a {column name: column values} json string.
 
     Parameters
     ----------
     data : Mapping[str, Sequence[Any]]
         data mapping of {column name: column values}
+    orient : {'records', 'columns'}, default 'records'
+        'records' for a list of row dicts, 'columns' for an object of column lists
 
     Returns
     -------
     str
-        json string, list of row dicts
+        json string
 
-    Example
-    -------
+    Examples
+    --------
     >>> data = {'x': [1, 2, 3], 'y': [6, 7, 8]}
     >>> data_to_json(data)
     '[{"x": 1, "y": 6}, {"x": 2, "y": 7}, {"x": 3, "y": 8}]'
+    >>> data_to_json(data, orient='columns')
+    '{"x": [1, 2, 3], "y": [6, 7, 8]}'
     """
-    json_list: List[Dict[str, Any]] = data_to_json_list(data)
-    return json.dumps(json_list)
+    if orient == 'columns':
+        return json.dumps(_json_columns(data))
+    if orient == 'records':
+        json_list: List[Dict[str, Any]] = data_to_json_list(data)
+        return json.dumps(json_list)
+    raise ValueError("orient must be 'records' or 'columns'.")
 
 
 def json_to_data(j: str) -> DataDict:
     """
-    Convert row dicts json string to data dict table.
+    Convert row dicts json string, or {column name: column values}
+    json string, to data dict table.
 
     Parameters
     ----------
     j : str
-        json string, list of row dicts
+        json string, list of row dicts or object of column lists
 
     Returns
     -------
     Mapping[str, Sequence[Any]]
         data mapping of {column name: column values}
 
-    Example
-    -------
+    Examples
+    --------
     >>> j = '[{"x": 1, "y": 6}, {"x": 2, "y": 7}, {"x": 3, "y": 8}]'
     >>> json_to_data(j)
     {'x': [1, 2, 3], 'y': [6, 7, 8]}
+    >>> json_to_data('{"x": [1, 2, 3], "y": [6, 7, 8]}')
+    {'x': [1, 2, 3], 'y': [6, 7, 8]}
     """
     parsed = json.loads(j)
+    if isinstance(parsed, dict):
+        return _columns_data(parsed)
     return json_list_to_data(parsed)
+
+
+def write_json(
+    data: DataMapping,
+    path_or_file: PathOrFile,
+    orient: str = 'records',
+    encoding: str = 'utf-8'
+) -> None:
+    """
+    Write data as json to a file, same text as data_to_json,
+    encoding a batch of rows or one column at a time.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    path_or_file : str | PathLike | file
+        json file path or open text file
+    orient : {'records', 'columns'}, default 'records'
+        'records' for a list of row dicts, 'columns' for an object of column lists
+    encoding : str, default 'utf-8'
+        encoding used to open path_or_file paths
+
+    Example
+    -------
+    >>> import io
+    >>> file = io.StringIO()
+    >>> write_json({'x': [1, 2], 'y': [6, 7]}, file, orient='columns')
+    >>> file.getvalue()
+    '{"x": [1, 2], "y": [6, 7]}'
+    """
+    if orient == 'records':
+        write_json_chunks([data], path_or_file, encoding)
+        return
+    if orient != 'columns':
+        raise ValueError("orient must be 'records' or 'columns'.")
+    with utils_functions.open_file(path_or_file, 'w', encoding) as file:
+        file.write('{')
+        for i, (col, values) in enumerate(data.items()):
+            file.write(f'{", " if i else ""}{json.dumps(str(col))}: {json.dumps(_json_list(values))}')
+        file.write('}')
+
+
+def write_json_chunks(
+    chunks: Iterable[DataMapping],
+    path_or_file: PathOrFile,
+    encoding: str = 'utf-8'
+) -> None:
+    """
+    Write a stream of data chunks to a file as one json list of row dicts.
+
+    Example
+    -------
+    >>> import io
+    >>> file = io.StringIO()
+    >>> write_json_chunks([{'x': [1, 2]}, {'x': [3]}], file)
+    >>> file.getvalue()
+    '[{"x": 1}, {"x": 2}, {"x": 3}]'
+    """
+    with utils_functions.open_file(path_or_file, 'w', encoding) as file:
+        file.write('[')
+        separator = ''
+        for chunk in chunks:
+            records = rows_functions.records(chunk)
+            while True:
+                batch = list(islice(records, _WRITE_BATCH_SIZE))
+                if not batch:
+                    break
+                file.write(separator + ', '.join(map(json.dumps, batch)))
+                separator = ', '
+        file.write(']')
+
+
+def read_json(
+    path_or_file: PathOrFile,
+    missing_value: Optional[Any] = None,
+    encoding: str = 'utf-8'
+) -> DataDict:
+    """
+    Read a json file of row dicts, or of column lists, into data format.
+    Row dicts are parsed one at a time and appended to columns in batches.
+    Columns are the keys of all rows, missing keys are filled with missing_value.
+
+    Example
+    -------
+    >>> import io
+    >>> read_json(io.StringIO('[{"x": 1}, {"x": 2, "y": 7}]'))
+    {'x': [1, 2], 'y': [None, 7]}
+    """
+    with utils_functions.open_file(path_or_file, 'r', encoding) as file:
+        reader = _JsonReader(file)
+        if reader.peek() == '{':
+            return _columns_data(json.loads(reader.rest()))
+        data: DataDict = {}
+        with insert_functions.RowAppender(data, add_columns=True, missing_value=missing_value) as appender:
+            appender.extend(reader.rows())
+        return data
+
+
+def iter_json(
+    path_or_file: PathOrFile,
+    chunk_size: int = 10_000,
+    missing_value: Optional[Any] = None,
+    encoding: str = 'utf-8'
+) -> Iterator[DataDict]:
+    """
+    Read a json file of row dicts, or of column lists, in chunks of chunk_size rows.
+
+    Each chunk has the columns of earlier chunks plus keys first seen in its rows;
+    missing keys are filled with missing_value.
+    Use tinytim.stream.concat to collect chunks into one table.
+
+    Example
+    -------
+    >>> import io
+    >>> list(iter_json(io.StringIO('[{"x": 1}, {"x": 2}, {"x": 3, "y": 0}]'), 2))
+    [{'x': [1, 2]}, {'x': [3], 'y': [0]}]
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    with utils_functions.open_file(path_or_file, 'r', encoding) as file:
+        reader = _JsonReader(file)
+        if reader.peek() == '{':
+            yield from stream_functions.chunked(_columns_data(json.loads(reader.rest())), chunk_size)
+            return
+        yield from record_chunks(reader.rows(), chunk_size, missing_value)
+
+
+def record_chunks(
+    rows: Iterable[RowMapping],
+    chunk_size: int,
+    missing_value: Optional[Any] = None
+) -> Iterator[DataDict]:
+    """
+    Collect row dicts into data chunks of chunk_size rows.
+
+    Each chunk has the columns of earlier chunks, in first seen order,
+    plus keys first seen in its rows; missing keys are filled with missing_value.
+
+    Example
+    -------
+    >>> list(record_chunks([{'x': 1}, {'y': 2}, {'x': 3}], 2))
+    [{'x': [1, None], 'y': [None, 2]}, {'x': [3], 'y': [None]}]
+    """
+    rows = iter(rows)
+    columns: List[str] = []
+    while True:
+        batch = list(islice(rows, chunk_size))
+        if not batch:
+            return
+        chunk: DataDict = {col: [] for col in columns}
+        with insert_functions.RowAppender(chunk, len(batch), True, missing_value) as appender:
+            appender.extend(batch)
+        columns = data_functions.column_names(chunk)
+        yield chunk
+
+
+def iter_ndjson(
+    path_or_file: PathOrFile,
+    chunk_size: int = 10_000,
+    columns: Optional[Sequence[str]] = None,
+    missing_value: Optional[Any] = None,
+    processes: Optional[int] = None,
+    encoding: str = 'utf-8'
+) -> Iterator[DataDict]:
+    """
+    Read a JSON Lines file, one row object per line, in chunks of chunk_size rows.
+
+    Without columns, the schema grows as keys are first seen:
+    each chunk has the columns of earlier chunks plus its new keys,
+    in first seen order, and missing keys are filled with missing_value.
+    Use tinytim.stream.concat to collect chunks into one table,
+    it fills columns that first appear mid-stream for earlier rows.
+
+    Parameters
+    ----------
+    path_or_file : str | PathLike | file
+        ndjson file path or open text file
+    chunk_size : int, default 10_000
+        number of rows in each chunk, the last chunk can be shorter
+    columns : Sequence[str], optional
+        keys to keep, in this order; other keys are ignored
+    missing_value : Any, default None
+        value for keys missing from a row
+    processes : int, optional
+        parse chunks of lines in a pool of this many processes,
+        which pays off for long lines or slow disks; chunks keep file order
+    encoding : str, default 'utf-8'
+        encoding used to open path_or_file paths
+
+    Returns
+    -------
+    Iterator[dict[str, list]]
+
+    Example
+    -------
+    >>> import io
+    >>> lines = io.StringIO('{"x": 1}\\n{"x": 2}\\n\\n{"x": 3, "y": "a"}\\n')
+    >>> list(iter_ndjson(lines, 2))
+    [{'x': [1, 2]}, {'x': [3], 'y': ['a']}]
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    projection = None if columns is None else list(columns)
+    with utils_functions.open_file(path_or_file, 'r', encoding) as file:
+        # skip blank lines
+        lines = filter(str.strip, file)
+        batches = iter(lambda: list(islice(lines, chunk_size)), [])
+        if processes is None:
+            chunks: Iterator[DataDict] = (_parse_ndjson_lines(batch, projection, missing_value) for batch in batches)
+        else:
+            chunks = _parse_ndjson_in_pool(batches, projection, missing_value, processes)
+        schema: List[str] = []
+        for chunk in chunks:
+            yield chunk if projection is not None else _align_chunk(chunk, schema, missing_value)
+
+
+def read_ndjson(
+    path_or_file: PathOrFile,
+    columns: Optional[Sequence[str]] = None,
+    missing_value: Optional[Any] = None,
+    processes: Optional[int] = None,
+    encoding: str = 'utf-8'
+) -> DataDict:
+    """
+    Read a JSON Lines file into data format, see iter_ndjson for parameters.
+    Columns first seen after the first row are filled with missing_value for earlier rows.
+
+    Example
+    -------
+    >>> import io
+    >>> read_ndjson(io.StringIO('{"x": 1}\\n{"y": 2}\\n'))
+    {'x': [1, None], 'y': [None, 2]}
+    """
+    chunks = iter_ndjson(path_or_file, 10_000, columns, missing_value, processes, encoding)
+    return stream_functions.concat(chunks, missing_value)
+
+
+def write_ndjson(
+    data: DataMapping,
+    path_or_file: PathOrFile,
+    append: bool = False,
+    encoding: str = 'utf-8'
+) -> None:
+    """
+    Write data to a JSON Lines file, one row object per line.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    path_or_file : str | PathLike | file
+        ndjson file path or open text file
+    append : bool, default False
+        append to the end of a path instead of replacing it
+    encoding : str, default 'utf-8'
+        encoding used to open path_or_file paths
+
+    Example
+    -------
+    >>> import io
+    >>> file = io.StringIO()
+    >>> write_ndjson({'x': [1, 2], 'y': ['a', None]}, file)
+    >>> file.getvalue()
+    '{"x": 1, "y": "a"}\\n{"x": 2, "y": null}\\n'
+    """
+    write_ndjson_chunks([data], path_or_file, append, encoding)
+
+
+def write_ndjson_chunks(
+    chunks: Iterable[DataMapping],
+    path_or_file: PathOrFile,
+    append: bool = False,
+    encoding: str = 'utf-8'
+) -> None:
+    """
+    Write a stream of data chunks to a JSON Lines file, one chunk at a time.
+
+    Example
+    -------
+    >>> import io
+    >>> file = io.StringIO()
+    >>> write_ndjson_chunks([{'x': [1]}, {'x': [2]}], file)
+    >>> file.getvalue()
+    '{"x": 1}\\n{"x": 2}\\n'
+    """
+    with utils_functions.open_file(path_or_file, 'a' if append else 'w', encoding) as file:
+        for chunk in chunks:
+            records = rows_functions.records(chunk)
+            while True:
+                batch = list(islice(records, _WRITE_BATCH_SIZE))
+                if not batch:
+                    break
+                file.write('\n'.join(map(json.dumps, batch)) + '\n')
+
+
+def data_to_ndjson(data: DataMapping) -> str:
+    """
+    Convert data to a JSON Lines string.
+
+    Example
+    -------
+    >>> data_to_ndjson({'x': [1, 2]})
+    '{"x": 1}\\n{"x": 2}\\n'
+    """
+    return ''.join(f'{json.dumps(row)}\n' for row in rows_functions.records(data))
+
+
+def ndjson_to_data(text: str, columns: Optional[Sequence[str]] = None, missing_value: Optional[Any] = None) -> DataDict:
+    """
+    Convert a JSON Lines string to data format.
+
+    Example
+    -------
+    >>> ndjson_to_data('{"x": 1, "y": 6}\\n{"x": 2, "y": 7}\\n', columns=['y'])
+    {'y': [6, 7]}
+    """
+    return _parse_ndjson_lines(list(filter(str.strip, text.splitlines())), columns, missing_value)
+
+
+def _parse_ndjson_lines(lines: List[str], columns: Optional[Sequence[str]], missing_value: Any) -> DataDict:
+    """Return data of ndjson lines, with columns if given, else with the keys of the rows."""
+    rows = _loads_lines(lines)
+    if not all(isinstance(row, dict) for row in rows):
+        raise ValueError('ndjson lines must be row objects.')
+    chunk: DataDict = {} if columns is None else {col: [] for col in columns}
+    with insert_functions.RowAppender(chunk, max(len(rows), 1), columns is None, missing_value) as appender:
+        appender.extend(rows)
+    return chunk
+
+
+def _loads_lines(lines: List[str]) -> List[Any]:
+    """Return the json value of each line, decoding the lines as one json array when possible."""
+    try:
+        # one decode call is about twice as fast as a call per line
+        values = json.loads(f'[{",".join(lines)}]')
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != len(lines):
+        # lines that are not one value each: decode line by line for the error
+        values = list(map(json.loads, lines))
+    return values
+
+
+def _parse_ndjson_in_pool(
+    batches: Iterator[List[str]],
+    columns: Optional[Sequence[str]],
+    missing_value: Any,
+    processes: int
+) -> Iterator[DataDict]:
+    """Parse batches of lines in a process pool, yielding chunks in order with a bounded number in flight."""
+    with ProcessPoolExecutor(processes) as executor:
+        pending: Deque[Future[DataDict]] = deque()
+        for batch in batches:
+            pending.append(executor.submit(_parse_ndjson_lines, batch, columns, missing_value))
+            if len(pending) > 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _align_chunk(chunk: DataDict, schema: List[str], missing_value: Any) -> DataDict:
+    """Return chunk with schema columns first, filling missing ones, and add its new columns to schema."""
+    row_count = data_functions.row_count(chunk)
+    aligned = {col: chunk.get(col) or [missing_value] * row_count for col in schema}
+    for col, values in chunk.items():
+        if col not in aligned:
+            aligned[col] = values
+            schema.append(col)
+    return aligned
+
+
+class _JsonReader:
+    """Read a json file's top level list one item at a time."""
+    def __init__(self, file: IO[str]) -> None:
+        self.file = file
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _read(self, size: int) -> None:
+        text = self.file.read(size)
+        if not text:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, '' at end of file."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._read(BLOCK_SIZE)
+
+    def rest(self) -> str:
+        """Return the rest of the file."""
+        return self.buffer[self.pos:] + self.file.read()
+
+    def rows(self) -> Iterator[Any]:
+        """Yield the row dicts of a top level json list."""
+        if self.peek() != '[':
+            raise ValueError('json must be a list of row objects or an object of column lists.')
+        self.pos += 1
+        first = True
+        while True:
+            char = self.peek()
+            if char == ']':
+                self.pos += 1
+                return
+            if not first:
+                if char != ',':
+                    raise ValueError(f'expected , or ] in json list, found {char!r}.')
+                self.pos += 1
+                self.peek()
+            row = self._decode()
+            if not isinstance(row, dict):
+                raise ValueError('json list items must be row objects.')
+            first = False
+            yield row
+
+    def _decode(self) -> Any:
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                # read at least as much again, so long items are decoded a bounded number of times
+                self._read(max(BLOCK_SIZE, len(self.buffer)))
+                continue
+            self.pos = end
+            return value
+
+
+def _json_list(values: Sequence[Any]) -> List[Any]:
+    return values if type(values) is list else list(values)
+
+
+def _json_columns(data: DataMapping) -> Dict[str, List[Any]]:
+    return {str(col): _json_list(values) for col, values in data.items()}
+
+
+def _columns_data(parsed: Dict[str, Any]) -> DataDict:
+    """Return data of a parsed {column name: column values} object."""
+    if not all(isinstance(values, list) for values in parsed.values()):
+        raise ValueError('json object values must be column lists.')
+    if len(set(map(len, parsed.values()))) > 1:
+        raise ValueError('json column lists must be the same length.')
+    return {str(col): values for col, values in parsed.items()}
@@ -0,0 +1,400 @@
+"""
+Lazy query plans over tinytim functions.
+
+Operations on a LazyTable build a logical plan instead of a new table.
+When the result is needed (collect, groupby, aggregate) the plan is optimized:
+filters are pushed below joins and projections, consecutive filters are fused
+into one pass and only the columns that are used are read from each table.
+Then each step materializes once.
+
+Example
+-------
+>>> left = {'id': [1, 2, 3, 4], 'x': [10, 20, 30, 40], 'unused': ['a', 'b', 'c', 'd']}
+>>> right = {'id': [2, 3, 4], 'y': [200, 300, 400]}
+>>> (lazy(left)
+...     .left_join(right, 'id')
+...     .filter_by_column_gt('x', 15)
+...     .filter_by_column_lt('y', 400)
+...     .filter_by_columns(['id', 'x', 'y'])
+...     .collect())
+{'id': [2, 3], 'x': [20, 30], 'y': [200, 300]}
+"""
+
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import tinytim.arrays as arrays_functions
+import tinytim.data as data_functions
+import tinytim.filter as filter_functions
+import tinytim.group as group_functions
+import tinytim.join as join_functions
+from tinytim.custom_types import DataDict, DataMapping
+
+JoinOn = Union[str, Sequence[str]]
+
+
+class Predicate(NamedTuple):
+    column: str
+    func: Callable[[Any], bool]
+    description: str
+
+
+class Scan(NamedTuple):
+    data: DataMapping
+
+
+class Filter(NamedTuple):
+    child: 'Plan'
+    predicates: Tuple[Predicate, ...]
+
+
+class Project(NamedTuple):
+    child: 'Plan'
+    columns: Tuple[str, ...]
+
+
+class Join(NamedTuple):
+    left: 'Plan'
+    right: 'Plan'
+    left_on: JoinOn
+    right_on: JoinOn
+    how: str
+    strategy: str
+
+
+Plan = Union[Scan, Filter, Project, Join]
+
+_JOINS: Dict[str, Callable[..., DataDict]] = {
+    'inner': join_functions.inner_join,
+    'left': join_functions.left_join,
+    'right': join_functions.right_join,
+    'full': join_functions.full_join,
+}
+
+
+class LazyTable:
+    """
+    Lazily evaluated table: a logical plan of tinytim operations.
+
+    Create one with lazy(data). Each method returns a new LazyTable,
+    nothing is computed until collect, groupby or aggregate is called.
+    """
+    def __init__(self, plan: Plan) -> None:
+        self.plan = plan
+
+    def __repr__(self) -> str:
+        return f'LazyTable(\n{self.explain()}\n)'
+
+    def filter_by_column_func(
+        self,
+        column_name: str,
+        func: Callable[[Any], bool],
+        description: Optional[str] = None
+    ) -> 'LazyTable':
+        """Keep only rows where func(column value) is True."""
+        if description is None:
+            description = f'{getattr(func, "__name__", "func")}({column_name})'
+        predicate = Predicate(column_name, func, description)
+        return LazyTable(Filter(self.plan, (predicate,)))
+
+    def _compare(self, column_name: str, op: Callable[[Any, Any], bool], symbol: str, value: Any) -> 'LazyTable':
+        return self.filter_by_column_func(column_name, lambda x: op(x, value), f'{column_name} {symbol} {value!r}')
+
+    def filter_by_column_eq(self, column_name: str, value: Any) -> 'LazyTable':
+        """Keep only rows where named column equals value."""
+        return self._compare(column_name, eq, '==', value)
+
+    def filter_by_column_ne(self, column_name: str, value: Any) -> 'LazyTable':
+        """Keep only rows where named column does not equal value."""
+        return self._compare(column_name, ne, '!=', value)
+
+    def filter_by_column_gt(self, column_name: str, value: Any) -> 'LazyTable':
+        """Keep only rows where named column is greater than value."""
+        return self._compare(column_name, gt, '>', value)
+
+    def filter_by_column_lt(self, column_name: str, value: Any) -> 'LazyTable':
+        """Keep only rows where named column is less than value."""
+        return self._compare(column_name, lt, '<', value)
+
+    def filter_by_column_ge(self, column_name: str, value: Any) -> 'LazyTable':
+        """Keep only rows where named column is greater than or equal value."""
+        return self._compare(column_name, ge, '>=', value)
+
+    def filter_by_column_le(self, column_name: str, value: Any) -> 'LazyTable':
+        """Keep only rows where named column is less than or equal value."""
+        return self._compare(column_name, le, '<=', value)
+
+    def filter_by_column_isin(self, column_name: str, values: Sequence[Any]) -> 'LazyTable':
+        """Keep only rows where named column is in values."""
+        lookup = filter_functions.ValueSet(values)
+        return self.filter_by_column_func(column_name, lambda x: x in lookup, f'{column_name} in {values!r}')
+
+    def filter_by_column_notin(self, column_name: str, values: Sequence[Any]) -> 'LazyTable':
+        """Keep only rows where named column is not in values."""
+        lookup = filter_functions.ValueSet(values)
+        return self.filter_by_column_func(column_name, lambda x: x not in lookup, f'{column_name} not in {values!r}')
+
+    def filter_by_columns(self, column_names: Sequence[str]) -> 'LazyTable':
+        """Keep only column_names."""
+        return LazyTable(Project(self.plan, tuple(column_names)))
+
+    only_columns = filter_by_columns
+
+    def _join(
+        self,
+        right: Union['LazyTable', DataMapping],
+        left_on: JoinOn,
+        right_on: Optional[JoinOn],
+        how: str,
+        strategy: str
+    ) -> 'LazyTable':
+        right_plan = right.plan if isinstance(right, LazyTable) else Scan(right)
+        right_on = left_on if right_on is None else right_on
+        return LazyTable(Join(self.plan, right_plan, left_on, right_on, how, strategy))
+
+    def inner_join(
+        self,
+        right: Union['LazyTable', DataMapping],
+        left_on: JoinOn,
+        right_on: Optional[JoinOn] = None,
+        strategy: str = 'hash'
+    ) -> 'LazyTable':
+        """Inner join with right, see tinytim.join.inner_join."""
+        return self._join(right, left_on, right_on, 'inner', strategy)
+
+    def left_join(
+        self,
+        right: Union['LazyTable', DataMapping],
+        left_on: JoinOn,
+        right_on: Optional[JoinOn] = None,
+        strategy: str = 'hash'
+    ) -> 'LazyTable':
+        """Left join with right, see tinytim.join.left_join."""
+        return self._join(right, left_on, right_on, 'left', strategy)
+
+    def right_join(
+        self,
+        right: Union['LazyTable', DataMapping],
+        left_on: JoinOn,
+        right_on: Optional[JoinOn] = None,
+        strategy: str = 'hash'
+    ) -> 'LazyTable':
+        """Right join with right, see tinytim.join.right_join."""
+        return self._join(right, left_on, right_on, 'right', strategy)
+
+    def full_join(
+        self,
+        right: Union['LazyTable', DataMapping],
+        left_on: JoinOn,
+        right_on: Optional[JoinOn] = None,
+        strategy: str = 'hash'
+    ) -> 'LazyTable':
+        """Full join with right, see tinytim.join.full_join."""
+        return self._join(right, left_on, right_on, 'full', strategy)
+
+    def optimized_plan(self) -> Plan:
+        """Return the plan with filters pushed down and unused columns pruned."""
+        return optimize(self.plan)
+
+    def explain(self) -> str:
+        """Return a readable description of the optimized plan."""
+        return explain(self.optimized_plan())
+
+    def collect(self) -> DataDict:
+        """Run the optimized plan and return the resulting data table."""
+        return collect(self.plan)
+
+    def groupby(self, by: Union[str, Sequence[str]]) -> List[group_functions.Group]:
+        """Run the plan and group the result, see tinytim.group.groupby."""
+        return group_functions.groupby(self.collect(), by)
+
+    def aggregate(
+        self,
+        by: Union[str, Sequence[str]],
+        funcs: Dict[str, str]
+    ) -> Tuple[List[Any], DataDict]:
+        """
+        Run the plan reading only the by and aggregated columns,
+        then aggregate it, see tinytim.group.aggregate.
+        """
+        by_columns = [by] if isinstance(by, str) else list(by)
+        columns = list(dict.fromkeys(by_columns + list(funcs)))
+        data = self.filter_by_columns(columns).collect()
+        return group_functions.aggregate(data, by, funcs)
+
+
+def lazy(data: DataMapping) -> LazyTable:
+    """
+    Start a lazy plan over data.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+
+    Returns
+    -------
+    LazyTable
+    """
+    return LazyTable(Scan(data))
+
+
+def plan_columns(plan: Plan) -> List[str]:
+    """Return the column names plan produces, in order."""
+    if isinstance(plan, Scan):
+        return data_functions.column_names(plan.data)
+    if isinstance(plan, Filter):
+        return plan_columns(plan.child)
+    if isinstance(plan, Project):
+        return list(plan.columns)
+    out = dict.fromkeys(plan_columns(plan.left))
+    out.update(dict.fromkeys(plan_columns(plan.right)))
+    out.update(dict.fromkeys(_on_names(plan.right_on)))
+    return list(out)
+
+
+def _on_names(on: JoinOn) -> List[str]:
+    return [on] if isinstance(on, str) else list(on)
+
+
+def _key_pairs(join: Join) -> Dict[str, Tuple[str, str]]:
+    """Map each join key column name to its (left column, right column) pair."""
+    pairs: Dict[str, Tuple[str, str]] = {}
+    for left_col, right_col in zip(_on_names(join.left_on), _on_names(join.right_on)):
+        pairs[left_col] = (left_col, right_col)
+        pairs[right_col] = (left_col, right_col)
+    return pairs
+
+
+def _push_filters(plan: Plan, predicates: Tuple[Predicate, ...] = ()) -> Plan:
+    """
+    Move predicates as far down the plan as they stay correct,
+    merging consecutive filters into one Filter.
+    """
+    if isinstance(plan, Filter):
+        return _push_filters(plan.child, plan.predicates + predicates)
+    if isinstance(plan, Project):
+        # a column the projection removed can not be filtered on, as in the eager functions
+        for predicate in predicates:
+            if predicate.column not in plan.columns:
+                raise KeyError(predicate.column)
+        return Project(_push_filters(plan.child, predicates), plan.columns)
+    if isinstance(plan, Join):
+        return _push_join_filters(plan, predicates)
+    return Filter(plan, predicates) if predicates else plan
+
+
+def _push_join_filters(join: Join, predicates: Tuple[Predicate, ...]) -> Plan:
+    # Join keys hold the same value on both sides, so key predicates can go to both.
+    # Other columns can only go to the side whose unmatched rows are kept,
+    # because the other side's columns are None on unmatched rows.
+    keys = _key_pairs(join)
+    left_columns = set(plan_columns(join.left))
+    right_columns = set(plan_columns(join.right))
+    left_predicates: List[Predicate] = []
+    right_predicates: List[Predicate] = []
+    kept: List[Predicate] = []
+    for predicate in predicates:
+        if predicate.column in keys:
+            left_col, right_col = keys[predicate.column]
+            left_predicates.append(predicate._replace(column=left_col))
+            right_predicates.append(predicate._replace(column=right_col))
+        elif predicate.column in right_columns and join.how in ('inner', 'right'):
+            right_predicates.append(predicate)
+        elif predicate.column in left_columns - right_columns and join.how in ('inner', 'left'):
+            left_predicates.append(predicate)
+        else:
+            kept.append(predicate)
+    pushed = join._replace(
+        left=_push_filters(join.left, tuple(left_predicates)),
+        right=_push_filters(join.right, tuple(right_predicates))
+    )
+    return Filter(pushed, tuple(kept)) if kept else pushed
+
+
+def _prune_columns(plan: Plan, required: Optional[FrozenSet[str]] = None) -> Plan:
+    """
+    Project away columns that are not required above each step.
+    required of None means every column is needed.
+    """
+    if isinstance(plan, Scan):
+        if required is None:
+            return plan
+        columns = [col for col in data_functions.column_names(plan.data) if col in required]
+        if len(columns) == data_functions.column_count(plan.data):
+            return plan
+        return Project(plan, tuple(columns))
+    if isinstance(plan, Filter):
+        child_required = None if required is None else required | {p.column for p in plan.predicates}
+        return Filter(_prune_columns(plan.child, child_required), plan.predicates)
+    if isinstance(plan, Project):
+        kept = plan.columns if required is None else tuple(col for col in plan.columns if col in required)
+        return Project(_prune_columns(plan.child, frozenset(kept)), kept)
+    if required is None:
+        return plan._replace(left=_prune_columns(plan.left), right=_prune_columns(plan.right))
+    left_on = frozenset(_on_names(plan.left_on))
+    right_on = frozenset(_on_names(plan.right_on))
+    right_columns = frozenset(plan_columns(plan.right))
+    # Right columns replace left columns with the same name in join output.
+    left_required = (required - right_columns) | left_on
+    right_required = (required & right_columns) | right_on
+    return plan._replace(
+        left=_prune_columns(plan.left, left_required),
+        right=_prune_columns(plan.right, right_required)
+    )
+
+
+def optimize(plan: Plan) -> Plan:
+    """
+    Optimize a plan: push filters down, fuse consecutive filters
+    and read only the columns that are used.
+    """
+    return _prune_columns(_push_filters(plan))
+
+
+def _execute(plan: Plan) -> DataMapping:
+    if isinstance(plan, Scan):
+        return plan.data
+    if isinstance(plan, Project):
+        data = _execute(plan.child)
+        return {col: data[col] for col in plan.columns}
+    if isinstance(plan, Filter):
+        data = _execute(plan.child)
+        columns = [data[p.column] for p in plan.predicates]
+        funcs = [p.func for p in plan.predicates]
+        indexes = [i for i, values in enumerate(zip(*columns))
+                       if all(func(value) for func, value in zip(funcs, values))]
+        return filter_functions.filter_by_indexes(data, indexes)
+    join = _JOINS[plan.how]
+    return join(_execute(plan.left), _execute(plan.right), plan.left_on, plan.right_on, strategy=plan.strategy)
+
+
+def collect(plan: Plan) -> DataDict:
+    """Optimize and run plan, return the resulting data table."""
+    data = _execute(optimize(plan))
+    sources = {id(values) for values in _source_columns(plan)}
+    # Columns passed straight through from a source table are copied.
+    return {col: arrays_functions.like_column(values, values) if id(values) in sources else values  # type: ignore[misc]
+                for col, values in data.items()}
+
+
+def _source_columns(plan: Plan) -> List[Any]:
+    if isinstance(plan, Scan):
+        return list(plan.data.values())
+    if isinstance(plan, Join):
+        return _source_columns(plan.left) + _source_columns(plan.right)
+    return _source_columns(plan.child)
+
+
+def explain(plan: Plan, indent: int = 0) -> str:
+    """Return a readable tree description of plan."""
+    pad = '  ' * indent
+    if isinstance(plan, Scan):
+        return f'{pad}Scan {data_functions.column_names(plan.data)}'
+    if isinstance(plan, Filter):
+        conditions = ' and '.join(p.description for p in plan.predicates)
+        return f'{pad}Filter {conditions}\n{explain(plan.child, indent + 1)}'
+    if isinstance(plan, Project):
+        return f'{pad}Project {list(plan.columns)}\n{explain(plan.child, indent + 1)}'
+    return (f'{pad}Join {plan.how} on {plan.left_on!r} = {plan.right_on!r}\n'
+            f'{explain(plan.left, indent + 1)}\n{explain(plan.right, indent + 1)}')
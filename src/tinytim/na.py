@@ -1,4 +1,4 @@
 from tinytim.dropna import dropna  # noqa: F401
 from tinytim.fillna import fillna  # noqa: F401
-from tinytim.isna import isna, isnull, notna, notnull  # noqa: F401
+from tinytim.isna import NA, NAN, MissingValues, isna, isnull, notna, notnull  # noqa: F401
 
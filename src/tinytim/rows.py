@@ -1,9 +1,11 @@
-from collections import defaultdict
-from itertools import zip_longest
-from typing import Any, Dict, Generator, Iterable, Optional, Sequence, Tuple
+from collections import Counter, namedtuple
+from itertools import count, repeat
+from operator import itemgetter
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import tinytim.data as data_functions
 import tinytim.edit as edit_functions
+import tinytim.insert as insert_functions
 import tinytim.utils as utils_functions
 from tinytim.custom_types import DataDict, DataMapping, RowDict, RowMapping
 
@@ -33,8 +35,7 @@ def row_dict(
     >>> row_dict(data, 1)
     {'x': 2, 'y': 7}
     """
-    return {col: data_functions.table_value(data, col, index)
-                for col in data_functions.column_names(data)}
+    return {col: values[index] for col, values in data.items()}
 
 
 def row_values(
@@ -96,10 +97,15 @@ def iterrows(
     ...
     StopIteration
     """
-    indexes = data_functions.index(data)
-    indexes_iter: Iterable[int] = reversed(indexes) if reverse else indexes
-    for i in indexes_iter:
-        yield i, row_dict(data, i)
+    names = data_functions.column_names(data)
+    columns = list(data.values())
+    indexes: Iterable[int] = count()
+    rows = zip(*columns)
+    if reverse:
+        indexes = reversed(data_functions.index(data))
+        rows = zip(*map(reversed, columns))
+    for i, row in zip(indexes, rows):
+        yield i, dict(zip(names, row))
 
 
 def itertuples(
@@ -132,8 +138,43 @@ def itertuples(
     ...
     StopIteration
     """
-    for _, row in iterrows(data):
-        yield tuple(row.values())
+    yield from zip(*data.values())
+
+
+def iternamedtuples(
+    data: DataMapping,
+    name: str = 'Row'
+) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Return a generator of namedtuple row values,
+    with a field for each column name.
+    Column names that are not valid field names
+    are replaced with positional names (_0, _1, ...).
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    name : str, default 'Row'
+        namedtuple type name
+
+    Returns
+    -------
+    generator[namedtuple]
+        generator of namedtuple row values
+
+    Example
+    -------
+    >>> data = {'x': [1, 2, 3], 'y': [6, 7, 8]}
+    >>> generator = iternamedtuples(data)
+    >>> row = next(generator)
+    >>> row
+    Row(x=1, y=6)
+    >>> row.y
+    6
+    """
+    row_type = namedtuple(name, data_functions.column_names(data), rename=True)  # type: ignore[misc]
+    yield from map(row_type._make, zip(*data.values()))
 
 
 def itervalues(
@@ -191,7 +232,7 @@ def values(
     >>> values(data)
     ((1, 6), (2, 7), (3, 8))
     """
-    return tuple(itervalues(data))
+    return tuple(zip(*data.values()))
 
 
 def row_value_counts(
@@ -222,9 +263,7 @@ def row_value_counts(
     >>> row_value_counts(data)
     {(3, 3): 2, (1, 6): 1, (2, 7): 1}
     """
-    d: Dict[Tuple[Any, ...], int] = {}
-    for row in itertuples(data):
-        d[row] = d.get(row, 0) + 1
+    d: Dict[Tuple[Any, ...], int] = Counter(zip(*data.values()))
     if sort:
         return dict(sorted(d.items(),
                            key=lambda item: item[1],
@@ -255,8 +294,8 @@ def records(d: DataMapping) -> Generator[RowDict, None, None]:
     >>> next(generator)
     {'x': 4, 'y': 88}
     """
-    for _, record in iterrows(d):
-        yield record
+    names = data_functions.column_names(d)
+    yield from map(dict, map(zip, repeat(names), zip(*d.values())))
 
 
 def records_equal(d1: DataMapping, d2: DataMapping) -> bool:
@@ -264,6 +303,9 @@ def records_equal(d1: DataMapping, d2: DataMapping) -> bool:
     Compare d1 and d2 records (rows) to see if they are equal.
     Order of records or columns does not matter.
 
+    Rows are counted as hashed tuples, so comparing takes O(n);
+    tables with unhashable values are compared row by row.
+
     Parameters
     ----------
     d1 : Mapping[str, Sequence[Any]]
@@ -283,12 +325,18 @@ def records_equal(d1: DataMapping, d2: DataMapping) -> bool:
     >>> records_equal(d1, d2)
     False
     """
-    if set(data_functions.column_names(d1)) != set(data_functions.column_names(d2)):
+    names = data_functions.column_names(d1)
+    if set(names) != set(data_functions.column_names(d2)):
         return False
 
     if data_functions.row_count(d1) != data_functions.row_count(d2):
         return False
 
+    try:
+        return Counter(_row_tuples(d1, names)) == Counter(_row_tuples(d2, names))
+    except TypeError:
+        pass
+
     d2_rows = list(records(d2))
 
     for row in records(d1):
@@ -300,6 +348,161 @@ def records_equal(d1: DataMapping, d2: DataMapping) -> bool:
     return True
 
 
+class RecordsDiff(NamedTuple):
+    """
+    Rows removed from, added to and changed between two tables.
+
+    Attributes
+    ----------
+    removed : dict[str, list]
+        rows of the first table that are not in the second table
+    added : dict[str, list]
+        rows of the second table that are not in the first table
+    changed : list[tuple[dict, dict]]
+        (first table row, second table row) pairs with the same key
+        and different values, only when diffing by key columns
+    """
+    removed: DataDict
+    added: DataDict
+    changed: List[Tuple[RowDict, RowDict]]
+
+    @property
+    def equal(self) -> bool:
+        """Return True if nothing was removed, added or changed."""
+        return not (data_functions.row_count(self.removed) or data_functions.row_count(self.added) or self.changed)
+
+
+def records_diff(
+    d1: DataMapping,
+    d2: DataMapping,
+    key: Optional[Union[str, Sequence[str]]] = None
+) -> RecordsDiff:
+    """
+    Return the rows removed, added and changed from d1 to d2, in O(n).
+    Order of records or columns does not matter.
+
+    Without key, rows are compared as multisets of whole rows:
+    a row in d1 twice and in d2 once is removed once.
+    With key, rows are matched by their key column values,
+    which must be unique in each table, and matched rows
+    with different values are changed.
+
+    Parameters
+    ----------
+    d1 : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    d2 : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}, with the same columns
+    key : str | Sequence[str], optional
+        names of columns that identify a row
+
+    Returns
+    -------
+    RecordsDiff
+        removed and added rows tables in table order, changed row pairs
+
+    Raises
+    ------
+    ValueError
+        if the tables have different columns, a key column is missing
+        or key values are not unique
+
+    Examples
+    --------
+    >>> d1 = {'id': [1, 2, 3], 'x': [10, 20, 30]}
+    >>> d2 = {'id': [3, 2, 4], 'x': [30, 25, 40]}
+    >>> records_diff(d1, d2)
+    RecordsDiff(removed={'id': [1, 2], 'x': [10, 20]}, added={'id': [2, 4], 'x': [25, 40]}, changed=[])
+
+    >>> records_diff(d1, d2, 'id')
+    RecordsDiff(removed={'id': [1], 'x': [10]}, added={'id': [4], 'x': [40]}, changed=[({'id': 2, 'x': 20}, {'id': 2, 'x': 25})])
+    """
+    names = data_functions.column_names(d1)
+    if set(names) != set(data_functions.column_names(d2)):
+        raise ValueError('d1 and d2 must have the same columns.')
+    rows1 = list(_row_tuples(d1, names))
+    rows2 = list(_row_tuples(d2, names))
+    if key is None:
+        return RecordsDiff(
+            removed=_rows_data(_multiset_difference(rows1, rows2), names),
+            added=_rows_data(_multiset_difference(rows2, rows1), names),
+            changed=[]
+        )
+    keys = [key] if isinstance(key, str) else list(key)
+    missing = [col for col in keys if col not in names]
+    if missing:
+        raise ValueError(f'key columns {missing} are not in the tables.')
+    key_of = itemgetter(*(names.index(col) for col in keys))
+    try:
+        index1 = _index_rows(rows1, key_of, 'd1')
+        index2 = _index_rows(rows2, key_of, 'd2')
+    except TypeError:
+        # unhashable key values are matched by their position in a KeyIndex
+        keys_index = utils_functions.KeyIndex()
+        index1 = _index_rows(rows1, lambda row: keys_index.add(key_of(row)), 'd1')
+        index2 = _index_rows(rows2, lambda row: keys_index.add(key_of(row)), 'd2')
+    changed = []
+    for row_key, row1 in index1.items():
+        row2 = index2.get(row_key, row1)
+        if row2 != row1:
+            changed.append((dict(zip(names, row1)), dict(zip(names, row2))))
+    return RecordsDiff(
+        removed=_rows_data([row for row_key, row in index1.items() if row_key not in index2], names),
+        added=_rows_data([row for row_key, row in index2.items() if row_key not in index1], names),
+        changed=changed
+    )
+
+
+def _row_tuples(data: DataMapping, names: Sequence[str]) -> Iterator[Tuple[Any, ...]]:
+    """Return row value tuples of data columns in names order."""
+    return zip(*(data[col] for col in names))
+
+
+def _rows_data(rows: Sequence[Tuple[Any, ...]], names: Sequence[str]) -> DataDict:
+    """Return data of rows with names columns, keeping the columns if there are no rows."""
+    columns: Iterable[Sequence[Any]] = zip(*rows) if rows else repeat((), len(names))
+    return {col: list(values) for col, values in zip(names, columns)}
+
+
+def _multiset_difference(rows: Sequence[Tuple[Any, ...]], other: Sequence[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+    """Return rows not matched by a row of other, each other row matching once, in rows order."""
+    try:
+        remaining = Counter(other)
+        unmatched = []
+        for row in rows:
+            if remaining[row]:
+                remaining[row] -= 1
+            else:
+                unmatched.append(row)
+        return unmatched
+    except TypeError:
+        pass
+
+    # rows with unhashable values are matched by their position in a KeyIndex
+    index = utils_functions.KeyIndex()
+    remaining_positions = Counter(index.add_all(other))
+    unmatched = []
+    for row in rows:
+        position = index.find(row)
+        if position is not None and remaining_positions[position]:
+            remaining_positions[position] -= 1
+        else:
+            unmatched.append(row)
+    return unmatched
+
+
+def _index_rows(
+    rows: Sequence[Tuple[Any, ...]],
+    key_of: Callable[[Tuple[Any, ...]], Any],
+    name: str
+) -> Dict[Any, Tuple[Any, ...]]:
+    """Return {key: row} of rows, raising if key values are not unique."""
+    index = dict(zip(map(key_of, rows), rows))
+    if len(index) != len(rows):
+        raise ValueError(f'key values must be unique in {name}.')
+    return index
+
+
 def row_dicts_to_data(
     rows: Sequence[RowMapping],
     columns: Optional[Sequence[str]] = None,
@@ -330,18 +533,12 @@ def row_dicts_to_data(
     >>> row_dicts_to_data(rows)
     {'x': [1, 2, 3], 'y': [20, None, 22]}
     """
-    keys = utils_functions.all_keys(rows)
-    data = defaultdict(list)
-    for row in rows:
-        for col in keys:
-            if col in row:
-                data[col].append(row[col])
-            else:
-                data[col].append(missing_value)
+    data: DataDict = {col: [] for col in utils_functions.all_keys(rows)}
+    insert_functions.insert_rows_inplace(data, rows, missing_value)
     if columns:
-        data = edit_functions.replace_column_names(dict(data), columns)  # type: ignore[assignment]
+        data = edit_functions.replace_column_names(data, columns)
         return {col: list(values) for col, values in data.items()}
-    return dict(data)  # type: ignore[arg-type]
+    return data
 
 
 def row_values_to_data(
@@ -365,11 +562,12 @@ def row_values_to_data(
     >>> row_values_to_data(rows, columns)
     {'x': [1, 2, 3], 'y': [20, None, 22]}
     """
-    data = defaultdict(list)
+    if not rows:
+        return {}
     col_count = len(column_names)
-    for row in rows:
-        if len(row) > col_count:
-            raise ValueError('row values cannot be longer than column names.')
-        for col, val in zip_longest(column_names, row, fillvalue=missing_value):
-            data[col].append(val)
-    return dict(data)  # type: ignore[arg-type]
+    lengths = set(map(len, rows))
+    if max(lengths) > col_count:
+        raise ValueError('row values cannot be longer than column names.')
+    if lengths != {col_count}:
+        rows = [tuple(row) + (missing_value,) * (col_count - len(row)) for row in rows]
+    return {col: list(values) for col, values in zip(column_names, zip(*rows))}
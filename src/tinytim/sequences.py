@@ -1,12 +1,120 @@
+import operator
 from itertools import repeat
+from math import log2
 from numbers import Number
-from typing import Any, Callable, Iterable, List, Sequence, Sized, Union
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Sized, Union
+
+import tinytim.arrays as arrays_functions
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+# Columns shorter than this are not worth converting to numpy arrays.
+NUMPY_MIN_LENGTH = 64
+
+_NUMPY_UFUNCS = {
+    operator.add: 'add',
+    operator.sub: 'subtract',
+    operator.mul: 'multiply',
+    operator.truediv: 'true_divide',
+    operator.floordiv: 'floor_divide',
+    operator.mod: 'remainder',
+    operator.pow: 'power',
+}
+
+_NUMPY_DTYPES = {
+    arrays_functions.INT_TYPECODE: 'int64',
+    arrays_functions.FLOAT_TYPECODE: 'float64',
+}
+
+
+def _scalar_typecode(value: Any) -> Optional[str]:
+    if type(value) is int:
+        return arrays_functions.column_typecode([value])
+    if type(value) is float:
+        return arrays_functions.FLOAT_TYPECODE
+    return None
+
+
+def _numpy_array(values: Any, typecode: str) -> Any:
+    """Convert column values to a numpy array, sharing array.array buffers."""
+    if arrays_functions.is_array(values):
+        return numpy.frombuffer(values, dtype=_NUMPY_DTYPES[typecode])
+    return numpy.array(values, dtype=_NUMPY_DTYPES[typecode])
+
+
+def _int_bound(values: Any) -> int:
+    """Return the largest absolute value of an int64 numpy array as a Python int."""
+    # abs() on the int64 array would wrap -2 ** 63 back to itself
+    return max(abs(int(values.min())), abs(int(values.max())))
+
+
+def _ints_fit(name: str, x_max: int, y_max: int) -> bool:
+    """Check that an int64 ufunc result matches Python int arithmetic."""
+    if name in ('add', 'subtract'):
+        return x_max < 2 ** 62 and y_max < 2 ** 62
+    if name == 'multiply':
+        return x_max * y_max < 2 ** 63
+    if name == 'true_divide':
+        return x_max <= 2 ** 53 and y_max <= 2 ** 53
+    if name == 'power':
+        return x_max < 2 or y_max * log2(x_max) < 62
+    if name in ('floor_divide', 'remainder'):
+        # -2 ** 63 // -1 wraps back to -2 ** 63
+        return x_max < 2 ** 63
+    return True
+
+
+def _numpy_operate(
+    column: Sequence[Any],
+    values: Any,
+    func: Callable[[Any, Any], Any]
+) -> Any:
+    """
+    Operate on column with a vectorized numpy ufunc.
+    Returns None when numpy is not installed, func has no ufunc,
+    column or values are not all int or all float,
+    or numpy could give a different result than Python
+    (zero division, int overflow, negative powers, inf/nan results).
+    Then the caller should use the pure Python loop.
+    """
+    name = _NUMPY_UFUNCS.get(func)
+    if numpy is None or name is None or len(column) < NUMPY_MIN_LENGTH:
+        return None
+    x_code = arrays_functions.column_typecode(column)
+    if x_code not in _NUMPY_DTYPES:
+        return None
+    if isinstance(values, Sized) and not isinstance(values, str):
+        if len(values) != len(column):
+            return None
+        y_code = arrays_functions.column_typecode(values)  # type: ignore[arg-type]
+    else:
+        y_code = _scalar_typecode(values)
+    if y_code not in _NUMPY_DTYPES:
+        return None
+    x = _numpy_array(column, x_code)  # type: ignore[arg-type]
+    y = _numpy_array(values, y_code)  # type: ignore[arg-type]
+    if name in ('true_divide', 'floor_divide', 'remainder') and (y == 0).any():
+        return None
+    if name == 'power' and ((x < 0).any() or (y < 0).any()):
+        return None
+    both_ints = x_code == y_code == arrays_functions.INT_TYPECODE
+    if both_ints and not _ints_fit(name, _int_bound(x), _int_bound(y)):
+        return None
+    with numpy.errstate(all='ignore'):
+        result = getattr(numpy, name)(x, y)
+    if result.dtype.kind == 'f' and not numpy.isfinite(result).all():
+        return None
+    return result
 
 
 def operate_on_sequence(
     column: Sequence[Any],
     values: Union[Iterable[Any], str, Number],
-    func: Callable[[Any, Any], Any]
+    func: Callable[[Any, Any], Any],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Uses func operator on values in column.
@@ -14,6 +122,12 @@ def operate_on_sequence(
     values sequence must be same len as column.
     If values is not a sequence, operate on each column value with the single value.
 
+    If NumPy is installed, func is one of operator.add, sub, mul, truediv,
+    floordiv, mod or pow, and column and values are all int or all float,
+    the operation runs as a vectorized numpy ufunc.
+    Otherwise, or when numpy could differ from Python
+    (division by zero, int overflow, ...), a Python loop is used.
+
     Parameters
     ----------
     column : MutableSequence
@@ -22,6 +136,8 @@ def operate_on_sequence(
         values to operate on column values
     func : Callable[[Any, Any], Any]
         operator function to use to use values on column values
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -37,6 +153,21 @@ def operate_on_sequence(
     >>> operate_on_columns(column, [2, 3, 4, 5], lamda x, y : x + y)
     [3, 5, 7, 9]
     """
+    if as_array and numpy is None:
+        raise ImportError('as_array=True requires numpy to be installed')
+    result = _numpy_operate(column, values, func)
+    if result is None:
+        out = _python_operate(column, values, func)
+        return numpy.array(out) if as_array else out  # type: ignore[return-value, no-any-return]
+    return result if as_array else result.tolist()  # type: ignore[no-any-return]
+
+
+def _python_operate(
+    column: Sequence[Any],
+    values: Union[Iterable[Any], str, Number],
+    func: Callable[[Any, Any], Any]
+) -> List[Any]:
+    """Operate on column with a Python loop, one func call per value."""
     iterable_and_sized = isinstance(values, Iterable) and isinstance(values, Sized)
     if isinstance(values, str) or not iterable_and_sized:
         return [func(x, y) for x, y in zip(column, repeat(values, len(column)))] # type: ignore
@@ -51,7 +182,8 @@ def operate_on_sequence(
 
 def add_to_sequence(
     column: Sequence[Any],
-    values: Union[Sequence[Any], str, Number]
+    values: Union[Sequence[Any], str, Number],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Add a value or values to a sequence of column values.
@@ -60,6 +192,8 @@ def add_to_sequence(
     ----------
     column : Sequence
     values : Sequence | str | Number
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -96,12 +230,13 @@ def add_to_sequence(
     tinytim.columns.multiply_column
     tinytim.columns.divide_column
     """
-    return operate_on_sequence(column, values, lambda x, y : x + y)
+    return operate_on_sequence(column, values, operator.add, as_array)
 
 
 def subtract_from_sequence(
     column: Sequence[Any],
-    values: Union[Sequence[Any], Number]
+    values: Union[Sequence[Any], Number],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Subtract a value or values from a sequence of column values.
@@ -110,6 +245,8 @@ def subtract_from_sequence(
     ----------
     column : Sequence
     values : Sequence | str | Number
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -135,12 +272,13 @@ def subtract_from_sequence(
     tinytim.columns.multiply_column
     tinytim.columns.divide_column
     """
-    return operate_on_sequence(column, values, lambda x, y : x - y)
+    return operate_on_sequence(column, values, operator.sub, as_array)
 
 
 def multiply_sequence(
     column: Sequence[Any],
-    values: Union[Sequence[Any], Number]
+    values: Union[Sequence[Any], Number],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Multiply a value or values with a sequence of column values.
@@ -149,6 +287,8 @@ def multiply_sequence(
     ----------
     column : Sequence
     values : Sequence | str | Number
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -183,12 +323,13 @@ def multiply_sequence(
     tinytim.columns.subtract_from_column
     tinytim.columns.divide_column
     """
-    return operate_on_sequence(column, values, lambda x, y : x * y)
+    return operate_on_sequence(column, values, operator.mul, as_array)
 
 
 def divide_sequence(
     column: Sequence[Any],
-    values: Union[Sequence[Any], Number]
+    values: Union[Sequence[Any], Number],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Divide a value or values from a sequence of column values.
@@ -197,6 +338,8 @@ def divide_sequence(
     ----------
     column : Sequence
     values : Sequence | str | Number
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -222,12 +365,13 @@ def divide_sequence(
     tinytim.columns.subtract_from_column
     tinytim.columns.multiply_column
     """
-    return operate_on_sequence(column, values, lambda x, y : x / y)
+    return operate_on_sequence(column, values, operator.truediv, as_array)
 
 
 def mod_sequence(
     column: Sequence[Any],
-    values: Union[Sequence[Any], Number]
+    values: Union[Sequence[Any], Number],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Modulo a value or values from a sequence of column values.
@@ -236,6 +380,8 @@ def mod_sequence(
     ----------
     column : Sequence
     values : Sequence | Number
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -261,12 +407,13 @@ def mod_sequence(
     tinytim.columns.subtract_from_column
     tinytim.columns.divide_column
     """
-    return operate_on_sequence(column, values, lambda x, y : x % y)
+    return operate_on_sequence(column, values, operator.mod, as_array)
 
 
 def exponent_sequence(
     column: Sequence[Any],
-    values: Union[Sequence[Any], Number]
+    values: Union[Sequence[Any], Number],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Exponent a value or values with a sequence of column values.
@@ -275,6 +422,8 @@ def exponent_sequence(
     ----------
     column : Sequence
     values : Sequence | Number
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -300,12 +449,13 @@ def exponent_sequence(
     tinytim.columns.subtract_from_column
     tinytim.columns.divide_column
     """
-    return operate_on_sequence(column, values, lambda x, y : x ** y)
+    return operate_on_sequence(column, values, operator.pow, as_array)
 
 
 def floor_sequence(
     column: Sequence[Any],
-    values: Union[Sequence[Any], Number]
+    values: Union[Sequence[Any], Number],
+    as_array: bool = False
 ) -> List[Any]:
     """
     Floor divide a value or values from a sequence of column values.
@@ -314,6 +464,8 @@ def floor_sequence(
     ----------
     column : Sequence
     values : Sequence | Number
+    as_array : bool, default False
+        return a numpy.ndarray instead of a list, requires NumPy
 
     Returns
     -------
@@ -339,4 +491,4 @@ def floor_sequence(
     tinytim.columns.subtract_from_column
     tinytim.columns.divide_column
     """
-    return operate_on_sequence(column, values, lambda x, y : x // y)
+    return operate_on_sequence(column, values, operator.floordiv, as_array)
@@ -0,0 +1,387 @@
+"""
+Functions for processing data in row chunks.
+
+A stream is any iterable of data chunks: dicts of {column name: column values}
+with the same columns. Each stage takes a stream and returns a generator of
+chunks, so only the current chunk is held in memory.
+Stateful stages (forwardfill, backfill, fillna with limit, aggregate)
+carry their state from one chunk to the next and give the same results
+as running the eager function on the whole table.
+
+Example
+-------
+>>> rows = ({'x': i, 'y': None if i % 3 else i * 10} for i in range(6))
+>>> chunks = chunk_rows(rows, 4)
+>>> chunks = forwardfill(chunks)
+>>> chunks = filter_by_column_func(chunks, 'x', lambda x: x > 1)
+>>> concat(chunks)
+{'x': [2, 3, 4, 5], 'y': [0, 30, 30, 30]}
+"""
+
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from hasattrs import has_mapping_attrs
+
+import tinytim.data as data_functions
+import tinytim.dropna as dropna_functions
+import tinytim.fillna as fillna_functions
+import tinytim.filter as filter_functions
+import tinytim.group as group_functions
+import tinytim.isna as isna_functions
+from tinytim.custom_types import DataDict, DataMapping
+
+Chunks = Iterable[DataMapping]
+
+
+def chunked(data: DataMapping, size: int) -> Iterator[DataDict]:
+    """
+    Split data into chunks of size rows.
+
+    Parameters
+    ----------
+    data : Mapping[str, Sequence[Any]]
+        data mapping of {column name: column values}
+    size : int
+        number of rows in each chunk, the last chunk can be shorter
+
+    Returns
+    -------
+    Iterator[dict[str, list]]
+
+    Example
+    -------
+    >>> list(chunked({'x': [1, 2, 3], 'y': [4, 5, 6]}, 2))
+    [{'x': [1, 2], 'y': [4, 5]}, {'x': [3], 'y': [6]}]
+    """
+    if size < 1:
+        raise ValueError('size must be at least 1')
+    for start in range(0, data_functions.row_count(data), size):
+        yield {col: list(values[start:start + size]) for col, values in data.items()}
+
+
+def chunk_rows(rows: Iterable[Mapping[str, Any]], size: int) -> Iterator[DataDict]:
+    """
+    Collect row mappings into chunks of size rows.
+
+    The columns are the keys of the first row,
+    missing keys in later rows are filled with None.
+
+    Parameters
+    ----------
+    rows : Iterable[Mapping[str, Any]]
+        rows of {column name: value}
+    size : int
+        number of rows in each chunk, the last chunk can be shorter
+
+    Returns
+    -------
+    Iterator[dict[str, list]]
+
+    Example
+    -------
+    >>> list(chunk_rows([{'x': 1, 'y': 4}, {'x': 2, 'y': 5}, {'x': 3}], 2))
+    [{'x': [1, 2], 'y': [4, 5]}, {'x': [3], 'y': [None]}]
+    """
+    if size < 1:
+        raise ValueError('size must be at least 1')
+    rows = iter(rows)
+    columns: Optional[List[str]] = None
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        if columns is None:
+            columns = list(batch[0])
+        yield {col: [row.get(col) for row in batch] for col in columns}
+
+
+def concat(chunks: Chunks, missing_value: Optional[Any] = None) -> DataDict:
+    """
+    Materialize chunks into one data dict.
+    Columns missing from some chunks are filled with missing_value for their rows.
+
+    Example
+    -------
+    >>> concat([{'x': [1, 2]}, {'x': [3]}])
+    {'x': [1, 2, 3]}
+    >>> concat([{'x': [1]}, {'x': [2], 'y': [7]}])
+    {'x': [1, 2], 'y': [None, 7]}
+    """
+    out: DataDict = {}
+    row_count = 0
+    for chunk in chunks:
+        chunk_rows = data_functions.row_count(chunk)
+        for col, values in chunk.items():
+            if col not in out:
+                out[col] = [missing_value] * row_count
+            out[col].extend(values)
+        if len(chunk) != len(out):
+            for col, values in out.items():
+                if col not in chunk:
+                    values.extend([missing_value] * chunk_rows)
+        row_count += chunk_rows
+    return out
+
+
+def map_chunks(chunks: Chunks, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Iterator[Any]:
+    """
+    Apply a chunk local function, such as tinytim.edit.add_to_column
+    or tinytim.filter.filter_by_column_gt, to each chunk.
+
+    Parameters
+    ----------
+    chunks : Iterable[Mapping[str, Sequence[Any]]]
+        data chunks
+    func : Callable
+        called as func(chunk, *args, **kwargs)
+
+    Returns
+    -------
+    Iterator
+
+    Example
+    -------
+    >>> import tinytim.edit as edit_functions
+    >>> list(map_chunks([{'x': [1, 2]}, {'x': [3]}], edit_functions.add_to_column, 'x', 10))
+    [{'x': [11, 12]}, {'x': [13]}]
+    """
+    for chunk in chunks:
+        yield func(chunk, *args, **kwargs)
+
+
+def filter_by_column_func(
+    chunks: Chunks,
+    column_name: str,
+    func: Callable[[Any], bool]
+) -> Iterator[DataDict]:
+    """
+    Keep only rows where func(column value) is True, chunk by chunk.
+
+    Example
+    -------
+    >>> list(filter_by_column_func([{'x': [1, 2]}, {'x': [3]}], 'x', lambda x: x != 2))
+    [{'x': [1]}, {'x': [3]}]
+    """
+    return map_chunks(chunks, filter_functions.filter_by_column_func, column_name, func)
+
+
+def filter_by_columns(chunks: Chunks, column_names: Sequence[str]) -> Iterator[DataDict]:
+    """Keep only column_names in each chunk."""
+    return map_chunks(chunks, filter_functions.filter_by_columns, column_names)
+
+
+def isnull(chunks: Chunks, na_value: Optional[Any] = None) -> Iterator[DataDict]:
+    """
+    Return chunks of True/False if each value is missing.
+
+    Example
+    -------
+    >>> list(isnull([{'x': [1, None]}, {'x': [None]}]))
+    [{'x': [False, True]}, {'x': [True]}]
+    """
+    return map_chunks(chunks, isna_functions.isnull, na_value)
+
+
+def notnull(chunks: Chunks, na_value: Optional[Any] = None) -> Iterator[DataDict]:
+    """Return chunks of True/False if each value is not missing."""
+    return map_chunks(chunks, isna_functions.notnull, na_value)
+
+
+isna = isnull
+notna = notnull
+
+
+def dropna(
+    chunks: Chunks,
+    how: str = 'any',
+    thresh: Optional[int] = None,
+    subset: Optional[Sequence[str]] = None,
+    na_value: Optional[Any] = None
+) -> Iterator[DataDict]:
+    """
+    Remove rows with missing values, chunk by chunk.
+
+    Only rows can be dropped from a stream, dropping columns
+    needs the whole table; see tinytim.dropna.dropna for parameters.
+
+    Example
+    -------
+    >>> list(dropna([{'x': [1, None]}, {'x': [None, 4]}]))
+    [{'x': [1]}, {'x': [4]}]
+    """
+    return map_chunks(chunks, dropna_functions.dropna, 0, how, thresh, subset, False, na_value)
+
+
+def fillna(
+    chunks: Chunks,
+    value: Optional[Any] = None,
+    method: Optional[str] = None,
+    axis: Optional[Union[int, str]] = 0,
+    limit: Optional[int] = None,
+    na_value: Optional[Any] = None
+) -> Iterator[DataDict]:
+    """
+    Fill missing values in a stream of chunks.
+
+    Same parameters and results as tinytim.fillna.fillna on the whole table,
+    except for method='backfill' with a limit, which needs the whole table.
+
+    Returns
+    -------
+    Iterator[dict[str, list]]
+
+    Example
+    -------
+    >>> list(fillna([{'x': [1, None]}, {'x': [None, 4]}], 0, limit=1))
+    [{'x': [1, 0]}, {'x': [None, 4]}]
+    """
+    if method is not None and value is not None:
+        raise ValueError("Cannot specify both 'value' and 'method'.")
+    if axis in [1, 'columns']:
+        # Row fills never cross rows, so every chunk is independent.
+        return map_chunks(chunks, fillna_functions.fillna, value, method, axis, False, limit, na_value)
+    if method is None:
+        return fill_with_value(chunks, value, limit, na_value)
+    if method in ['backfill', 'bfill']:
+        return backfill(chunks, limit, na_value)
+    if method in ['pad', 'ffill']:
+        return forwardfill(chunks, limit, na_value)
+    raise ValueError(f'unknown fill method {method!r}')
+
+
+def fill_with_value(
+    chunks: Chunks,
+    value: Any,
+    limit: Optional[int] = None,
+    na_value: Optional[Any] = None
+) -> Iterator[DataDict]:
+    """
+    Fill missing values in each column with value,
+    at most limit values per column over the whole stream.
+
+    Example
+    -------
+    >>> list(fill_with_value([{'x': [None, None]}, {'x': [None]}], 0, limit=3))
+    [{'x': [0, 0]}, {'x': [0]}]
+    """
+    filled: Dict[str, int] = {}
+    for chunk in chunks:
+        out: DataDict = {}
+        for col, values in chunk.items():
+            column = list(values)
+            if has_mapping_attrs(value) and col not in value:
+                out[col] = column
+                continue
+            fill_value = value[col] if has_mapping_attrs(value) else value
+            remaining = None if limit is None else limit - filled.get(col, 0)
+            if remaining is None or remaining > 0:
+                missing = sum(isna_functions.column_isnull(column, na_value))
+                fillna_functions.fill_column_with_value_inplace(column, fill_value, remaining, na_value)
+                filled[col] = filled.get(col, 0) + (missing if remaining is None else min(missing, remaining))
+            out[col] = column
+        yield out
+
+
+def forwardfill(
+    chunks: Chunks,
+    limit: Optional[int] = None,
+    na_value: Optional[Any] = None
+) -> Iterator[DataDict]:
+    """
+    Fill missing values with the last value before them,
+    carrying each column's last value into the next chunk.
+    At most limit values are filled per column over the whole stream.
+
+    Example
+    -------
+    >>> list(forwardfill([{'x': [1, None]}, {'x': [None, 4]}]))
+    [{'x': [1, 1]}, {'x': [1, 4]}]
+    """
+    last: Dict[str, Any] = {}
+    filled: Dict[str, int] = {}
+    is_missing = isna_functions.missing_check(na_value)
+    for chunk in chunks:
+        out: DataDict = {}
+        for col, values in chunk.items():
+            column = list(values)
+            has_previous = col in last
+            previous = last.get(col)
+            count = filled.get(col, 0)
+            for i, item in enumerate(column):
+                if limit is not None and count >= limit:
+                    break
+                if is_missing(item):
+                    if has_previous:
+                        column[i] = previous
+                        count += 1
+                else:
+                    previous = item
+                    has_previous = True
+            if has_previous:
+                last[col] = previous
+            filled[col] = count
+            out[col] = column
+        yield out
+
+
+def backfill(
+    chunks: Chunks,
+    limit: Optional[int] = None,
+    na_value: Optional[Any] = None
+) -> Iterator[DataDict]:
+    """
+    Fill missing values with the next value after them.
+
+    Rows at the end of a chunk that have missing values in any column
+    are held back until a later chunk supplies the next value,
+    so long runs of missing values are kept in memory until they end.
+    limit counts fills from the end of the table, so it is not supported.
+
+    Example
+    -------
+    >>> list(backfill([{'x': [1, None]}, {'x': [None, 4]}]))
+    [{'x': [1]}, {'x': [4, 4, 4]}]
+    """
+    if limit is not None:
+        raise ValueError('limit is not supported for streaming backfill.')
+    held: DataDict = {}
+    for chunk in chunks:
+        data = concat([held, chunk])
+        fillna_functions.backfill_columns_inplace(data, None, na_value)
+        cut = min((_trailing_missing_start(values, na_value) for values in data.values()), default=0)
+        held = {col: values[cut:] for col, values in data.items()}
+        if cut:
+            yield {col: values[:cut] for col, values in data.items()}
+    if data_functions.row_count(held):
+        yield held
+
+
+def _trailing_missing_start(values: Sequence[Any], na_value: Any) -> int:
+    """Return the index where the run of missing values at the end of values starts."""
+    i = len(values)
+    is_missing = isna_functions.missing_check(na_value)
+    while i > 0 and is_missing(values[i - 1]):
+        i -= 1
+    return i
+
+
+def aggregate(
+    chunks: Chunks,
+    by: Union[str, Sequence[str]],
+    funcs: Mapping[str, str]
+) -> Tuple[List[Any], DataDict]:
+    """
+    Aggregate a stream per group, see tinytim.group.aggregate.
+    Only the running accumulators are kept between chunks.
+
+    Example
+    -------
+    >>> chunks = [{'g': ['a', 'b'], 'x': [1, 2]}, {'g': ['a'], 'x': [3]}]
+    >>> aggregate(chunks, 'g', {'x': 'sum'})
+    (['a', 'b'], {'x': [4, 2]})
+    """
+    aggregator = group_functions.GroupAggregator(by, funcs)
+    for chunk in chunks:
+        aggregator.update(chunk)
+    return aggregator.result()
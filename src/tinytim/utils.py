@@ -1,6 +1,90 @@
-from typing import Any, Collection, Dict, Generator, Iterable, List, Mapping, MutableSequence, Optional, Sequence, Tuple
+from collections import Counter
+from contextlib import contextmanager
+from typing import IO, Any, Collection, Dict, Generator, Iterable, Iterator, List, Mapping, MutableSequence, Optional, Sequence, Tuple
 
-from tinytim.custom_types import DataMapping, RowMapping
+from tinytim.custom_types import DataMapping, PathOrFile, RowMapping
+
+
+class KeyIndex:
+    """
+    First-seen positions of distinct keys, for keys that may be unhashable.
+
+    Keys are hashed to find their position. Unhashable keys (lists, dicts, ...)
+    fall back to a linear scan of the unhashable keys seen so far,
+    comparing them like `key in list` does, or only by identity if identity is True.
+
+    Parameters
+    ----------
+    keys : Iterable, optional
+        keys to add
+    identity : bool, default False
+        match unhashable keys by identity only, never calling their __eq__
+
+    Example
+    -------
+    >>> index = KeyIndex(['a', [1], 'b'])
+    >>> index.add('b'), index.add([1]), index.add('c')
+    (2, 1, 3)
+    >>> index.keys
+    ['a', [1], 'b', 'c']
+    >>> index.find([2]) is None, [1] in index
+    (True, True)
+    """
+    def __init__(self, keys: Iterable[Any] = (), identity: bool = False) -> None:
+        self.keys: List[Any] = []
+        self.hashed: Dict[Any, int] = {}
+        self.unhashed: List[Tuple[Any, int]] = []
+        self.identity = identity
+        self.add_all(keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.find(key) is not None
+
+    def find(self, key: Any) -> Optional[int]:
+        """Return the position of key, None if it has not been added."""
+        try:
+            return self.hashed.get(key)
+        except TypeError:
+            return self._scan(key)
+
+    def add(self, key: Any) -> int:
+        """Return the position of key, adding it at the end if it is new."""
+        try:
+            position = self.hashed.get(key)
+            if position is None:
+                position = self.hashed[key] = len(self.keys)
+                self.keys.append(key)
+            return position
+        except TypeError:
+            position = self._scan(key)
+            if position is None:
+                position = len(self.keys)
+                self.unhashed.append((key, position))
+                self.keys.append(key)
+            return position
+
+    def add_all(self, keys: Iterable[Any]) -> List[int]:
+        """Return the position of each of keys, adding the new ones, in one pass."""
+        positions: List[int] = []
+        append = positions.append
+        hashed = self.hashed
+        for key in keys:
+            try:
+                append(hashed[key])
+            except KeyError:
+                append(self.add(key))
+            except TypeError:
+                append(self.add(key))
+        return positions
+
+    def _scan(self, key: Any) -> Optional[int]:
+        """Return the position of unhashable key found by linear scan."""
+        if self.identity:
+            return next((position for other, position in self.unhashed if other is key), None)
+        return next((position for other, position in self.unhashed if other is key or other == key), None)
 
 
 def uniques(values: Iterable[Any]) -> List[Any]:
@@ -22,12 +106,38 @@ def uniques(values: Iterable[Any]) -> List[Any]:
     >>> values = [1, 1, 2, 4, 5, 2, 0, 6, 1]
     >>> uniques(values)
     [1, 2, 4, 5, 0, 6]
+
+    Unhashable values are compared by equality.
+
+    >>> uniques([[1], [2], [1]])
+    [[1], [2]]
+    """
+    return KeyIndex(values).keys
+
+
+def value_counts(values: Iterable[Any]) -> List[Tuple[Any, int]]:
     """
-    out = []
-    for value in values:
-        if value not in out:
-            out.append(value)
-    return out
+    Count how many times each unique item is in values.
+
+    Parameters
+    ----------
+    values : iterable
+        iterable of objects of any type
+
+    Returns
+    -------
+    list[tuple[Any, int]]
+        (unique value, count) in first-seen order
+
+    Example
+    -------
+    >>> values = [1, 1, 2, 4, 2, 1]
+    >>> value_counts(values)
+    [(1, 3), (2, 2), (4, 1)]
+    """
+    index = KeyIndex()
+    counts = Counter(index.add_all(values))
+    return [(value, counts[position]) for position, value in enumerate(index.keys)]
 
 
 def nuniques(values: Sequence[Any]) -> int:
@@ -101,12 +211,7 @@ def all_keys(dicts: Sequence[Mapping[Any, Any]]) -> List[Any]:
     >>> all_keys(dicts)
     ['x', 'y', 'z']
     """
-    keys = []
-    for d in dicts:
-        for key in d:
-            if key not in keys:
-                keys.append(key)
-    return keys
+    return list(dict.fromkeys(key for d in dicts for key in d))
 
 
 def all_bool(values: Collection[Any]) -> bool:
@@ -283,3 +388,16 @@ def set_values_to_many(s: MutableSequence[Any], values: Sequence[Any]) -> None:
 def set_values_to_one(s: MutableSequence[Any], value: Any) -> None:
     for i in range(len(s)):
         s[i] = value
+
+
+@contextmanager
+def open_file(path_or_file: PathOrFile, mode: str = 'r', encoding: str = 'utf-8') -> Iterator[IO[str]]:
+    """
+    Open a text file path in mode, closing it when done,
+    or use an already open file as is, leaving it open.
+    """
+    if hasattr(path_or_file, 'read') or hasattr(path_or_file, 'write'):
+        yield path_or_file  # type: ignore[misc]
+        return
+    with open(path_or_file, mode, newline='', encoding=encoding) as file:  # type: ignore[arg-type]
+        yield file
@@ -0,0 +1,221 @@
+"""
+Zero-copy views of table rows.
+
+A ColumnView reads values from a base column through a range or index array,
+so head, tail, slices and index filters allocate O(1) or O(k) instead of
+copying every value. A view copies its values into its own column
+the first time it is changed; the base column is never written to.
+
+Example
+-------
+>>> data = {'x': [1, 2, 3, 4], 'y': ['a', 'b', 'c', 'd']}
+>>> top = head(data, 2)
+>>> top['x']
+ColumnView([1, 2])
+>>> top['x'][0] = 10
+>>> top['x'], data['x']
+(ColumnView([10, 2]), [1, 2, 3, 4])
+"""
+
+from array import array
+from collections.abc import MutableSequence
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import tinytim.arrays as arrays_functions
+from tinytim.custom_types import Column
+from tinytim.interfaces import SequenceItems
+
+Indexes = Union[range, 'array[int]']
+
+
+def _as_indexes(indexes: Iterable[int]) -> Indexes:
+    if isinstance(indexes, (range, array)):
+        return indexes  # type: ignore[return-value]
+    return array('q', indexes)
+
+
+class ColumnView(MutableSequence):  # type: ignore[type-arg]
+    """
+    Column of base values at indexes, copied only when changed.
+
+    Parameters
+    ----------
+    base : Sequence
+        column values to read from
+    indexes : range | Iterable[int], optional
+        positions of base values in the view, all of base if None
+    """
+    base: Sequence[Any]
+    indexes: Indexes
+    values: Optional[Column]
+
+    def __init__(self, base: Sequence[Any], indexes: Optional[Iterable[int]] = None) -> None:
+        indexes = range(len(base)) if indexes is None else _as_indexes(indexes)
+        if isinstance(base, ColumnView) and base.values is None:
+            # read straight from the root column instead of chaining views
+            if isinstance(indexes, range):
+                indexes = base.indexes[indexes.start:indexes.stop:indexes.step]
+            else:
+                indexes = array('q', map(base.indexes.__getitem__, indexes))
+            base = base.base
+        self.base = base
+        self.indexes = indexes
+        self.values = None
+
+    def materialize(self) -> Column:
+        """Copy the viewed values into this view's own column and return it."""
+        if self.values is None:
+            self.values = arrays_functions.like_column(self.base, map(self.base.__getitem__, self.indexes))
+            self.indexes = range(len(self.values))
+        return self.values
+
+    def tolist(self) -> List[Any]:
+        """Return a list copy of the viewed values."""
+        return list(self)
+
+    def __len__(self) -> int:
+        if self.values is not None:
+            return len(self.values)
+        return len(self.indexes)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.values is not None:
+            return iter(self.values)
+        return map(self.base.__getitem__, self.indexes)
+
+    def __getitem__(self, index: Any) -> Any:
+        if self.values is not None:
+            return self.values[index]
+        if isinstance(index, slice):
+            return ColumnView(self.base, self.indexes[index])
+        return self.base[self.indexes[index]]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.materialize()[index] = value
+
+    def __delitem__(self, index: Any) -> None:
+        del self.materialize()[index]
+
+    def insert(self, index: int, value: Any) -> None:
+        self.materialize().insert(index, value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ColumnView, list, tuple, array)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'ColumnView({list(self)!r})'
+
+
+def column_view(values: Sequence[Any], indexes: Optional[Iterable[int]] = None) -> ColumnView:
+    """
+    Return a view of values at indexes (all values if None).
+
+    Example
+    -------
+    >>> column_view(['a', 'b', 'c'], [2, 0])
+    ColumnView(['c', 'a'])
+    """
+    return ColumnView(values, indexes)
+
+
+def slice_rows(
+    data: SequenceItems,
+    start: Optional[int] = None,
+    stop: Optional[int] = None,
+    step: Optional[int] = None
+) -> Dict[str, ColumnView]:
+    """
+    Return views of data rows[start:stop:step], allocating O(1) per column.
+
+    Example
+    -------
+    >>> slice_rows({'x': [1, 2, 3, 4]}, 1, 3)
+    {'x': ColumnView([2, 3])}
+    """
+    rows = slice(start, stop, step)
+    return {str(col): ColumnView(values, range(len(values))[rows]) for col, values in data.items()}
+
+
+def head(data: SequenceItems, n: int = 5) -> Dict[str, ColumnView]:
+    """
+    Return views of the first n rows of data.
+
+    Example
+    -------
+    >>> head({'x': [1, 2, 3], 'y': [6, 7, 8]}, 2)
+    {'x': ColumnView([1, 2]), 'y': ColumnView([6, 7])}
+    """
+    return slice_rows(data, None, n)
+
+
+def tail(data: SequenceItems, n: int = 5) -> Dict[str, ColumnView]:
+    """
+    Return views of the last n rows of data.
+
+    Example
+    -------
+    >>> tail({'x': [1, 2, 3], 'y': [6, 7, 8]}, 2)
+    {'x': ColumnView([2, 3]), 'y': ColumnView([7, 8])}
+    """
+    return slice_rows(data, -n)
+
+
+def filter_by_indexes(data: SequenceItems, indexes: Iterable[int]) -> Dict[str, ColumnView]:
+    """
+    Return views of data rows at indexes, sharing one index array between columns.
+
+    Example
+    -------
+    >>> filter_by_indexes({'x': [1, 2, 3], 'y': [6, 7, 8]}, [2, 0])
+    {'x': ColumnView([3, 1]), 'y': ColumnView([8, 6])}
+    """
+    shared = _as_indexes(indexes)
+    return {str(col): ColumnView(values, shared) for col, values in data.items()}
+
+
+def filter_by_mask(data: SequenceItems, mask: Sequence[Any]) -> Dict[str, ColumnView]:
+    """
+    Return views of data rows where mask is True.
+
+    Example
+    -------
+    >>> filter_by_mask({'x': [1, 2, 3]}, [True, False, True])
+    {'x': ColumnView([1, 3])}
+    """
+    return filter_by_indexes(data, array('q', compress(range(len(mask)), mask)))
+
+
+def filter_by_columns(data: Any, column_names: Sequence[str]) -> Dict[str, ColumnView]:
+    """
+    Return views of only column_names.
+
+    Example
+    -------
+    >>> filter_by_columns({'x': [1, 2], 'y': [3, 4]}, ['y'])
+    {'y': ColumnView([3, 4])}
+    """
+    return {str(col): ColumnView(data[col]) for col in column_names}
+
+
+def materialize(data: SequenceItems) -> Dict[str, Column]:
+    """
+    Return a copy of data with every view copied into its own column.
+
+    Example
+    -------
+    >>> materialize(head({'x': [1, 2, 3]}, 2))
+    {'x': [1, 2]}
+    """
+    return {str(col): arrays_functions.like_column(_root(values), values) for col, values in data.items()}
+
+
+def _root(values: Sequence[Any]) -> Sequence[Any]:
+    """Return the column whose storage type a view copy should keep."""
+    if isinstance(values, ColumnView):
+        return values.base if values.values is None else values.values
+    return values
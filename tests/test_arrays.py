@@ -0,0 +1,100 @@
+from array import array
+
+import pytest
+
+import tinytim.arrays as arrays_functions
+from tinytim.data import column_values, head, tail
+from tinytim.edit import divide_column, drop_row, edit_column, multiply_column
+from tinytim.filter import filter_by_column_gt, filter_by_columns, filter_by_indexes
+from tinytim.isna import isnull
+from tinytim.join import inner_join
+
+DATA = {'x': [1, 2, 3, 4], 'y': [1.5, 2.5, 3.5, 4.5], 'b': [True, False, True, True], 'z': ['a', 'b', 'c', 'd']}
+
+
+def test_column_typecode():
+    assert arrays_functions.column_typecode([1, 2, 3]) == 'q'
+    assert arrays_functions.column_typecode([1.5, 2.0]) == 'd'
+    assert arrays_functions.column_typecode([True, False]) == 'b'
+    assert arrays_functions.column_typecode([1, 2.0]) is None
+    assert arrays_functions.column_typecode([1, None]) is None
+    assert arrays_functions.column_typecode([2 ** 64]) is None
+    assert arrays_functions.column_typecode([]) is None
+
+
+def test_compact():
+    result = arrays_functions.compact(DATA)
+    assert result['x'] == array('q', [1, 2, 3, 4])
+    assert result['y'] == array('d', [1.5, 2.5, 3.5, 4.5])
+    assert result['b'] == [True, False, True, True]
+    assert not arrays_functions.is_array(result['b'])
+    assert result['z'] == ['a', 'b', 'c', 'd']
+    assert isinstance(DATA['x'], list)
+
+
+def test_expand_round_trip():
+    result = arrays_functions.expand(arrays_functions.compact(DATA))
+    assert result == DATA
+    assert all(type(value) is bool for value in result['b'])
+
+
+def test_compact_bool_columns_read_as_bool(tmp_path):
+    from tinytim.csv import write_csv
+    from tinytim.json import data_to_json
+    from tinytim.rows import itertuples
+    data = arrays_functions.compact({'b': [True, False]})
+    assert list(itertuples(data)) == [(True,), (False,)]
+    assert data_to_json(data) == '[{"b": true}, {"b": false}]'
+    path = tmp_path / 'data.csv'
+    write_csv(data, path)
+    assert path.read_text().split() == ['b', 'True', 'False']
+
+
+def test_head_tail_keep_arrays():
+    data = arrays_functions.compact(DATA)
+    assert head(data, 2)['x'] == array('q', [1, 2])
+    assert tail(data, 2)['y'] == array('d', [3.5, 4.5])
+    assert head(data, 2)['z'] == ['a', 'b']
+    assert column_values(data, 'x') == array('q', [1, 2, 3, 4])
+
+
+def test_filters_keep_arrays():
+    data = arrays_functions.compact(DATA)
+    result = filter_by_indexes(data, [0, 2])
+    assert result['x'] == array('q', [1, 3])
+    assert result['z'] == ['a', 'c']
+    result = filter_by_column_gt(data, 'y', 3.0)
+    assert result['x'] == array('q', [3, 4])
+    result = filter_by_columns(data, ['x'])
+    assert result == {'x': array('q', [1, 2, 3, 4])}
+
+
+def test_edit_keeps_arrays():
+    data = arrays_functions.compact(DATA)
+    result = multiply_column(data, 'x', 2)
+    assert result['x'] == array('q', [2, 4, 6, 8])
+    result = divide_column(data, 'x', 2)
+    assert result['x'] == array('d', [0.5, 1.0, 1.5, 2.0])
+    result = edit_column(data, 'x', ['a', 'b', 'c', 'd'])
+    assert result['x'] == ['a', 'b', 'c', 'd']
+    result = drop_row(data, 0)
+    assert result['x'] == array('q', [2, 3, 4])
+    assert data['x'] == array('q', [1, 2, 3, 4])
+
+
+def test_array_column_rejects_other_types():
+    data = arrays_functions.compact(DATA)
+    with pytest.raises(TypeError):
+        data['x'][0] = None
+
+
+def test_isnull_array_columns():
+    data = arrays_functions.compact({'x': [1, 2]})
+    assert isnull(data) == {'x': [False, False]}
+
+
+def test_join_array_columns():
+    left = arrays_functions.compact({'id': [1, 2, 3], 'x': [1.5, 2.5, 3.5]})
+    right = arrays_functions.compact({'id': [2, 3, 4], 'y': [20, 30, 40]})
+    result = inner_join(left, right, 'id')
+    assert result == {'id': [2, 3], 'x': [2.5, 3.5], 'y': [20, 30]}
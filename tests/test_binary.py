@@ -0,0 +1,114 @@
+from array import array
+
+import pytest
+
+import tinytim.binary as binary_functions
+
+DATA = {
+    'i': [1, -2, 3, None],
+    'f': [1.5, None, 2.5, 3.0],
+    'b': [True, False, None, True],
+    's': ['a', 'é', None, ''],
+    'o': [1, 'two', [3], None],
+    'n': [None, None, None, None],
+}
+
+
+def test_write_read_binary(tmp_path):
+    path = tmp_path / 'data.tim'
+    binary_functions.write_binary(DATA, path)
+    assert binary_functions.read_binary(path) == DATA
+    assert binary_functions.read_binary(path, columns=['s', 'i']) == {'s': DATA['s'], 'i': DATA['i']}
+
+
+def test_open_binary_lazy_columns(tmp_path):
+    path = tmp_path / 'data.tim'
+    binary_functions.write_binary(DATA, path)
+    with binary_functions.open_binary(path) as table:
+        assert table.rows == 4
+        assert list(table) == list(DATA)
+        assert table.column_types() == {'i': 'int', 'f': 'float', 'b': 'bool', 's': 'str', 'o': 'json', 'n': 'str'}
+        for col, values in DATA.items():
+            column = table[col]
+            assert len(column) == 4
+            assert [column[i] for i in range(4)] == values
+            assert column[-1] == values[-1]
+            assert column[1:3] == values[1:3]
+            assert list(column) == values
+            assert column == values
+        with pytest.raises(IndexError):
+            table['i'][4]
+        with pytest.raises(KeyError):
+            table['z']
+    with pytest.raises(ValueError):
+        table['i'][0]
+
+
+def test_binary_arrays_and_empty(tmp_path):
+    path = tmp_path / 'data.tim'
+    data = {'x': array('q', [1, 2]), 'y': array('d', [0.5, 1.5]), 'z': array('b', [1, 0])}
+    binary_functions.write_binary(data, path)
+    assert binary_functions.read_binary(path) == {'x': [1, 2], 'y': [0.5, 1.5], 'z': [True, False]}
+    binary_functions.write_binary({'x': []}, path)
+    assert binary_functions.read_binary(path) == {'x': []}
+    binary_functions.write_binary({}, path)
+    assert binary_functions.read_binary(path) == {}
+
+
+def test_binary_long_columns(tmp_path):
+    path = tmp_path / 'data.tim'
+    data = {
+        'x': [None if i % 7 == 0 else i for i in range(1000)],
+        's': [f'v{i}' if i % 3 else None for i in range(1000)],
+    }
+    binary_functions.write_binary(data, path)
+    with binary_functions.open_binary(path) as table:
+        assert table['x'][999] == 999
+        assert table['x'][994] is None
+        assert table['s'].tolist() == data['s']
+        assert table['x'] == data['x']
+
+
+def test_binary_table_with_tinytim_functions(tmp_path):
+    import tinytim.filter as filter_functions
+    import tinytim.rows as rows_functions
+    path = tmp_path / 'data.tim'
+    binary_functions.write_binary({'x': [1, 2, 3], 'y': ['a', 'b', 'c']}, path)
+    with binary_functions.open_binary(path) as table:
+        assert list(rows_functions.itertuples(table)) == [(1, 'a'), (2, 'b'), (3, 'c')]
+        assert filter_functions.filter_by_indexes(table, [0, 2]) == {'x': [1, 3], 'y': ['a', 'c']}
+
+
+def test_binary_errors(tmp_path):
+    path = tmp_path / 'data.tim'
+    with pytest.raises(ValueError):
+        binary_functions.write_binary({'x': [1, 2], 'y': [1]}, path)
+    path.write_bytes(b'not a tinytim binary file')
+    with pytest.raises(ValueError):
+        binary_functions.open_binary(path)
+    path.write_bytes(b'')
+    with pytest.raises(ValueError):
+        binary_functions.open_binary(path)
+
+
+def test_binary_big_endian_blocks(tmp_path, monkeypatch):
+    # swapping on both write and read must round trip, whatever the host byte order
+    monkeypatch.setattr(binary_functions, '_LITTLE_ENDIAN', not binary_functions._LITTLE_ENDIAN)
+    path = tmp_path / 'data.tim'
+    binary_functions.write_binary(DATA, path)
+    assert binary_functions.read_binary(path) == DATA
+
+
+def test_binary_rejects_values_json_changes(tmp_path):
+    from datetime import date
+    path = tmp_path / 'data.tim'
+    binary_functions.write_binary({'x': [1]}, path)
+    for values in ([(1, 2)], [{1: 2}], [[1, (2,)]], [date(2020, 1, 1)]):
+        with pytest.raises(ValueError):
+            binary_functions.write_binary({'x': [1], 'o': values}, path)
+    # the earlier file is left as it was and no temporary file is left behind
+    assert binary_functions.read_binary(path) == {'x': [1]}
+    assert [file.name for file in tmp_path.iterdir()] == ['data.tim']
+    data = {'o': [{'a': [1, None]}, 'b', 1.5, None]}
+    binary_functions.write_binary(data, path)
+    assert binary_functions.read_binary(path) == data
@@ -0,0 +1,129 @@
+from array import array
+
+import pytest
+
+import tinytim.categorical as categorical_functions
+import tinytim.filter as filter_functions
+import tinytim.group as group_functions
+import tinytim.join as join_functions
+from tinytim.categorical import Categorical
+
+VALUES = ['UK', 'US', 'UK', 'FR', None, 'US']
+
+
+def test_categorical_encoding():
+    column = Categorical(VALUES)
+    assert column.codes == array('i', [0, 1, 0, 2, 3, 1])
+    assert column.categories == ['UK', 'US', 'FR', None]
+    assert len(column) == 6
+    assert list(column) == VALUES
+    assert column == VALUES
+    assert column[-1] == 'US'
+    assert column[1:3] == ['US', 'UK']
+    assert isinstance(column[1:3], Categorical)
+    assert 'FR' in column
+    assert 'DE' not in column
+    assert [1] not in column
+    assert categorical_functions.is_categorical(column)
+    assert not categorical_functions.is_categorical(VALUES)
+
+
+def test_categorical_from_codes():
+    column = Categorical.from_codes([2, 0], ['a', 'b', 'c'])
+    assert column == ['c', 'a']
+    with pytest.raises(ValueError):
+        Categorical.from_codes([3], ['a', 'b', 'c'])
+    with pytest.raises(ValueError):
+        Categorical(categories=['a', 'a'])
+
+
+def test_categorical_edits_do_not_change_shared_categories():
+    column = Categorical(['a', 'b', 'a'])
+    part = column[:2]
+    part.append('c')
+    part[0] = 'd'
+    assert part == ['d', 'b', 'c']
+    assert column.categories == ['a', 'b']
+    assert column == ['a', 'b', 'a']
+    column.extend(['b', 'e'])
+    column.insert(0, 'a')
+    del column[1]
+    column[1:3] = ['z', 'z']
+    assert column == ['a', 'z', 'z', 'b', 'e']
+    assert column.unique() == ['a', 'z', 'b', 'e']
+
+
+def test_categorical_many_categories_mask():
+    values = [f'v{i % 300}' for i in range(900)]
+    column = Categorical(values)
+    assert filter_functions.mask_eq(column, 'v299') == filter_functions.mask_eq(values, 'v299')
+    small = Categorical(values[:10])
+    assert filter_functions.mask_eq(small, 'v3') == filter_functions.mask_eq(values[:10], 'v3')
+
+
+def test_filter_categorical():
+    data = {'country': Categorical(VALUES), 'x': [1, 2, 3, 4, 5, 6]}
+    result = filter_functions.filter_by_column_eq(data, 'country', 'UK')
+    assert result == {'country': ['UK', 'UK'], 'x': [1, 3]}
+    assert isinstance(result['country'], Categorical)
+    assert filter_functions.filter_by_column_isin(data, 'country', ['FR', None])['x'] == [4, 5]
+    assert filter_functions.filter_by_column_notin(data, 'country', Categorical(['UK', 'US']))['x'] == [4, 5]
+    assert filter_functions.filter_by_column_ne(data, 'country', 'US')['x'] == [1, 3, 4, 5]
+    assert filter_functions.filter_by_column_func(data, 'country', lambda value: value is None)['x'] == [5]
+    assert filter_functions.filter_by_indexes(data, [5, 0])['country'] == ['US', 'UK']
+    assert filter_functions.filter_by_columns(data, ['country'])['country'] == VALUES
+
+
+def test_mask_isin_unused_categories():
+    column = Categorical(['a', 'b', 'c'])[2:]
+    assert filter_functions.mask_isin(['a', 'c'], column) == b'\x00\x01'
+
+
+def test_compare_only_used_categories():
+    column = Categorical(['b', 'c', None, 'b'])[:2]
+    assert filter_functions.mask_gt(column, 'a') == b'\x01\x01'
+    assert filter_functions.mask_func(column, lambda value: value.upper() == 'C') == b'\x00\x01'
+    many = Categorical([None] + [f'v{i}' for i in range(300)])[1:]
+    assert filter_functions.mask_ge(many, 'v299') == filter_functions.mask_ge(list(many), 'v299')
+    with pytest.raises(TypeError):
+        filter_functions.mask_gt(Categorical(['b', None]), 'a')
+
+
+def test_groupby_categorical():
+    data = {'country': Categorical(VALUES), 'x': [1, 2, 3, 4, 5, 6]}
+    expected = group_functions.groupby({'country': VALUES, 'x': data['x']}, 'country')
+    assert group_functions.groupby(data, 'country') == expected
+    data['kind'] = Categorical(['a', 'b', 'a', 'a', 'b', 'a'])
+    plain = {col: list(values) for col, values in data.items()}
+    assert group_functions.groupby(data, ['country', 'kind']) == group_functions.groupby(plain, ['country', 'kind'])
+    assert group_functions.aggregate(data, 'country', {'x': 'sum'}) == (['UK', 'US', 'FR', None], {'x': [4, 8, 4, 5]})
+
+
+@pytest.mark.parametrize('join', ['inner_join', 'left_join', 'right_join', 'full_join'])
+@pytest.mark.parametrize('encode', [(True, True), (True, False), (False, True)])
+def test_join_categorical(join, encode):
+    left = {'id': ['a', 'c', 'd', 'f', 'a'], 'x': [1, 2, 3, 4, 5]}
+    right = {'id': ['c', 'b', 'a', 'c', 'g'], 'y': [6, 7, 8, 9, 10]}
+    expected = getattr(join_functions, join)(left, right, 'id')
+    left_encoded = categorical_functions.categorize(left, ['id'] if encode[0] else [])
+    right_encoded = categorical_functions.categorize(right, ['id'] if encode[1] else [])
+    assert getattr(join_functions, join)(left_encoded, right_encoded, 'id') == expected
+
+
+def test_semi_anti_join_categorical():
+    left = {'id': Categorical(['a', 'c', 'd', 'f']), 'x': [33, 44, 55, 66]}
+    right = {'id': Categorical(['a', 'b', 'c', 'c']), 'y': [11, 22, 33, 44]}
+    assert join_functions.semi_join(left, right, 'id') == {'id': ['a', 'c'], 'x': [33, 44]}
+    assert join_functions.anti_join(left, right, 'id') == {'id': ['d', 'f'], 'x': [55, 66]}
+
+
+def test_categorical_copies_stay_encoded():
+    import tinytim.copy as copy_functions
+    import tinytim.edit as edit_functions
+    data = {'country': Categorical(VALUES), 'x': [1, 2, 3, 4, 5, 6]}
+    copied = copy_functions.copy_table(data)
+    copied['country'][0] = 'DE'
+    assert isinstance(copied['country'], Categorical)
+    assert data['country'][0] == 'UK'
+    dropped = edit_functions.drop_rows(data, [0, 1])
+    assert dropped['country'] == VALUES[2:]
@@ -1,4 +1,14 @@
-from tinytim.copy import copy_sequence, copy_table, deepcopy_sequence, deepcopy_table
+from array import array
+
+from tinytim.copy import (
+    CopyOnWriteTable,
+    copy_on_write,
+    copy_sequence,
+    copy_table,
+    deepcopy_sequence,
+    deepcopy_table,
+    read_column,
+)
 
 
 # Tests for copy_table
@@ -20,6 +30,70 @@ def test_copy_table_nested_lists():
     assert data['x'][0][0] == 1  # Original unchanged
 
 
+def test_copy_table_of_copy_on_write_table_is_independent():
+    table = copy_on_write({'x': [1, 2, 3]})
+    shared = table.copy()
+    result = copy_table(shared)
+    result['x'][0] = 99
+    assert table == shared == {'x': [1, 2, 3]}
+    assert result.shared_columns() == []
+
+
+def test_copy_on_write_shares_columns_until_looked_up():
+    data = {'x': [1, 2, 3], 'y': [4, 5, 6]}
+    table = copy_on_write(data)
+    assert isinstance(table, CopyOnWriteTable)
+    assert table.shared_columns() == ['x', 'y']
+    assert read_column(table, 'y') is data['y']
+    table['x'][0] = 99
+    assert table.shared_columns() == ['y']
+    assert data == {'x': [1, 2, 3], 'y': [4, 5, 6]}
+    result = copy_on_write(table)
+    assert table.shared_columns() == result.shared_columns() == ['x', 'y']
+    # the source copies its shared columns too before handing them out
+    table['y'].append(7)
+    assert result == {'x': [99, 2, 3], 'y': [4, 5, 6]}
+    assert dict(result)['x'] is not read_column(table, 'x')
+    assert {**result}['y'] is not read_column(table, 'y')
+
+
+def test_copy_table_shares_columns_until_looked_up():
+    data = {f'c{i}': [[i], [i + 1]] for i in range(200)}
+    result = copy_table(data)
+    assert len(result.shared_columns()) == 200
+    result['c0'][0][0] = 99
+    assert data['c0'] == [[0], [1]]
+    assert len(result.shared_columns()) == 199
+    assert read_column(result, 'c1') is data['c1']
+    # an edit of the copy still deep copies the columns it looks up
+    edited = copy_on_write(result)
+    edited['c1'][0][0] = 99
+    assert data['c1'] == [[1], [2]]
+
+
+def test_copy_on_write_table_dict_methods():
+    table = CopyOnWriteTable({'x': [1, 2], 'y': [3, 4], 'z': [5, 6]})
+    result = table.copy()
+    popped = result.pop('x')
+    popped.append(0)
+    assert table['x'] == [1, 2]
+    assert result.pop('missing', None) is None
+    assert result.popitem() == ('z', [5, 6])
+    result.setdefault('y').append(0)
+    result.update({'w': [7, 8]})
+    assert result == {'y': [3, 4, 0], 'w': [7, 8]}
+    assert result.shared_columns() == []
+    assert table == {'x': [1, 2], 'y': [3, 4], 'z': [5, 6]}
+
+
+def test_copy_on_write_keeps_arrays():
+    data = {'x': array('q', [1, 2])}
+    result = copy_on_write(data)
+    result['x'][0] = 5
+    assert result['x'] == array('q', [5, 2])
+    assert data['x'] == array('q', [1, 2])
+
+
 def test_copy_table_empty():
     data = {}
     result = copy_table(data)
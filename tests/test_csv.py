@@ -0,0 +1,98 @@
+import io
+
+import pytest
+
+import tinytim.csv as csv_functions
+import tinytim.stream as stream_functions
+
+TEXT = 'x,y,z\n1,a,0.5\n2,b,\n\n3,c,1e3\n'
+
+
+def test_read_csv_strings():
+    assert csv_functions.read_csv(io.StringIO(TEXT)) == {'x': ['1', '2', '3'], 'y': ['a', 'b', 'c'], 'z': ['0.5', '', '1e3']}
+
+
+def test_read_csv_infer_types():
+    result = csv_functions.read_csv(io.StringIO(TEXT), infer_types=True, missing_value=-1)
+    assert result == {'x': [1, 2, 3], 'y': ['a', 'b', 'c'], 'z': [0.5, -1, 1000.0]}
+
+
+@pytest.mark.parametrize('value', ['1_000', ' 1', '1 ', 'nan', 'inf', '-Infinity', '\u0661', '"1\n"'])
+def test_read_csv_infer_types_plain_numbers_only(value):
+    result = csv_functions.read_csv(io.StringIO(f'x\n2\n{value}\n'), infer_types=True)
+    assert result['x'][0] == '2'
+    # explicit converters still accept anything they parse
+    if value not in ('\u0661', '"1\n"'):
+        assert isinstance(csv_functions.read_csv(io.StringIO(f'x\n{value}\n'), types={'x': float})['x'][0], float)
+
+
+def test_read_csv_infer_types_number_syntax():
+    text = 'i,f\n+1,1.\n-2,.5\n007,-1.5E-3\n,\n'
+    assert csv_functions.read_csv(io.StringIO(text), infer_types=True) == {
+        'i': [1, -2, 7, None], 'f': [1.0, 0.5, -0.0015, None]
+    }
+    assert csv_functions.read_csv(io.StringIO('x\n\n'), infer_types=True) == {}
+    assert csv_functions.infer_column(['', '']) == (int, [None, None])
+
+
+def test_read_csv_types_and_columns():
+    result = csv_functions.read_csv(io.StringIO(TEXT), columns=['z', 'x'], types={'x': str, 'z': float})
+    assert result == {'z': [0.5, None, 1000.0], 'x': ['1', '2', '3']}
+    assert csv_functions.read_csv(io.StringIO(TEXT), columns=['y']) == {'y': ['a', 'b', 'c']}
+
+
+def test_read_csv_bad_type_raises():
+    with pytest.raises(ValueError):
+        csv_functions.read_csv(io.StringIO(TEXT), types={'y': int})
+
+
+def test_read_csv_missing_column():
+    with pytest.raises(ValueError):
+        csv_functions.read_csv(io.StringIO(TEXT), columns=['w'])
+
+
+def test_read_csv_short_and_long_rows():
+    assert csv_functions.read_csv(io.StringIO('x,y\n1\n2,3\n')) == {'x': ['1', '2'], 'y': ['', '3']}
+    with pytest.raises(ValueError):
+        csv_functions.read_csv(io.StringIO('x,y\n1,2,3\n'))
+
+
+def test_read_csv_empty():
+    assert csv_functions.read_csv(io.StringIO('')) == {}
+    assert list(csv_functions.iter_csv(io.StringIO('x,y\n'))) == []
+
+
+def test_iter_csv_chunks_widen_inferred_types():
+    chunks = list(csv_functions.iter_csv(io.StringIO('x,y\n1,a\n2,3\n2.5,4\n'), 1, infer_types=True))
+    assert chunks == [{'x': [1], 'y': ['a']}, {'x': [2], 'y': ['3']}, {'x': [2.5], 'y': ['4']}]
+
+
+def test_iter_csv_stream():
+    chunks = csv_functions.iter_csv(io.StringIO(TEXT), 2, types={'x': int})
+    chunks = stream_functions.filter_by_column_func(chunks, 'x', lambda x: x > 1)
+    assert stream_functions.concat(chunks) == {'x': [2, 3], 'y': ['b', 'c'], 'z': ['', '1e3']}
+
+
+def test_write_read_round_trip_path(tmp_path):
+    data = {'x': [1, 2, None], 'name': ['a,b', 'c"d', 'e']}
+    path = tmp_path / 'data.csv'
+    csv_functions.write_csv(data, path)
+    assert csv_functions.read_csv(path, infer_types=True) == data
+    assert csv_functions.read_csv(str(path), columns=['name']) == {'name': ['a,b', 'c"d', 'e']}
+
+
+def test_write_csv_options():
+    data = {'x': [1, 2], 'y': [3, 4]}
+    text = csv_functions.data_to_csv(data, columns=['y'], header=False, delimiter=';', lineterminator='\n')
+    assert text == '3\n4\n'
+    assert csv_functions.csv_to_data('x;y\n1;2\n', delimiter=';', infer_types=True) == {'x': [1], 'y': [2]}
+
+
+def test_write_csv_chunks():
+    file = io.StringIO()
+    chunks = [{'x': [1, 2], 'y': ['a', 'b']}, {'x': [3], 'y': ['c']}]
+    csv_functions.write_csv_chunks(iter(chunks), file, lineterminator='\n')
+    assert file.getvalue() == 'x,y\n1,a\n2,b\n3,c\n'
+    file = io.StringIO()
+    csv_functions.write_csv_chunks([], file, columns=['x'], lineterminator='\n')
+    assert file.getvalue() == 'x\n'
@@ -307,3 +307,91 @@ def test_operator_column_empty():
     data = {'x': [], 'y': []}
     result = edit_functions.operator_column(data, 'x', 10, lambda a, b: a + b)
     assert result == {'x': [], 'y': []}
+
+
+def test_chained_edits_copy_only_edited_columns():
+    data = {'x': [1, 2, 3], 'y': [6, 7, 8], 'z': [0, 0, 0]}
+    first = edit_functions.edit_value(data, 'x', 0, 11)
+    assert first['y'] is not data['y']
+    second = edit_functions.add_to_column(first, 'x', 1)
+    assert second.shared_columns() == ['y', 'z']
+    third = edit_functions.drop_column(second, 'z')
+    assert third == {'x': [12, 3, 4], 'y': [6, 7, 8]}
+    assert third.shared_columns() == ['x', 'y']
+    assert first == {'x': [11, 2, 3], 'y': [6, 7, 8], 'z': [0, 0, 0]}
+    assert data == {'x': [1, 2, 3], 'y': [6, 7, 8], 'z': [0, 0, 0]}
+
+
+def test_edit_result_columns_independent():
+    first = edit_functions.edit_column({'x': [1, 2], 'y': [3, 4]}, 'x', 0)
+    second = edit_functions.edit_column(first, 'x', [5, 6])
+    edit_functions.edit_value_inplace(second, 'y', 0, 99)
+    edit_functions.edit_value_inplace(first, 'y', 1, 77)
+    assert first == {'x': [0, 0], 'y': [3, 77]}
+    assert second == {'x': [5, 6], 'y': [99, 4]}
+
+
+def test_edit_results_do_not_share_columns():
+    data = {'x': [1, 2], 'y': [3, 4]}
+    first = edit_functions.edit_column(data, 'x', [5, 6])
+    second = edit_functions.edit_column(first, 'x', [7, 8])
+    second['y'][0] = 100
+    edit_functions.drop_column(first, 'x')['y'].append(7)
+    assert first == {'x': [5, 6], 'y': [3, 4]}
+    assert second == {'x': [7, 8], 'y': [100, 4]}
+    assert data == {'x': [1, 2], 'y': [3, 4]}
+
+
+def test_drop_rows_inplace_indexes():
+    data = {'x': [1, 2, 3, 4, 5], 'y': [6, 7, 8, 9, 10]}
+    edit_functions.drop_rows_inplace(data, [4, 0, -2, 0])
+    assert data == {'x': [2, 3], 'y': [7, 8]}
+
+
+def test_drop_rows_inplace_mask():
+    from array import array
+    data = {'x': array('q', [1, 2, 3]), 'y': ['a', 'b', 'c']}
+    edit_functions.drop_rows_inplace(data, b'\x01\x00\x01')
+    assert data == {'x': array('q', [2]), 'y': ['b']}
+
+
+def test_drop_rows_inplace_out_of_range():
+    import pytest
+    data = {'x': [1, 2]}
+    with pytest.raises(IndexError):
+        edit_functions.drop_rows_inplace(data, [2])
+    with pytest.raises(ValueError):
+        edit_functions.drop_rows_inplace(data, [True])
+    assert data == {'x': [1, 2]}
+
+
+def test_drop_rows():
+    data = {'x': [1, 2, 3, 4], 'y': [6, 7, 8, 9]}
+    assert edit_functions.drop_rows(data, iter([0, 3])) == {'x': [2, 3], 'y': [7, 8]}
+    assert edit_functions.drop_rows(data, [False, True, False, False]) == {'x': [1, 3, 4], 'y': [6, 8, 9]}
+    result = edit_functions.drop_rows(data, [])
+    assert result == data
+    result['x'].append(5)
+    assert data == {'x': [1, 2, 3, 4], 'y': [6, 7, 8, 9]}
+
+
+def test_drop_labels():
+    labels = ['a', 'b', 'c', 'd']
+    assert edit_functions.drop_labels(labels, {0, 3}) == ['b', 'c']
+    assert edit_functions.drop_labels(None, [0]) is None
+    edit_functions.drop_labels_inplace(labels, [True, False, False, True])
+    assert labels == ['b', 'c']
+
+
+def test_inplace_functions_copy_shared_columns():
+    from tinytim.fillna import fill_with_value_inplace
+    from tinytim.insert import insert_row_inplace
+    first = edit_functions.edit_value({'x': [1, None], 'y': [3, 4]}, 'y', 0, 5)
+    second = edit_functions.drop_column(first, 'y')
+    third = edit_functions.edit_value(first, 'y', 1, 6)
+    fill_with_value_inplace(second, 0)
+    insert_row_inplace(third, {'x': 7, 'y': 8})
+    edit_functions.drop_row_inplace(first, 0)
+    assert first == {'x': [None], 'y': [4]}
+    assert second == {'x': [1, 0]}
+    assert third == {'x': [1, None, 7], 'y': [5, 6, 8]}
@@ -1,4 +1,8 @@
+from array import array
+
 from tinytim.filter import (
+    ValueSet,
+    as_mask,
     column_filter,
     filter_by_column_eq,
     filter_by_column_func,
@@ -13,9 +17,26 @@ from tinytim.filter import (
     filter_by_columns_inplace,
     filter_by_indexes,
     filter_by_indexes_inplace,
+    filter_by_mask,
+    filter_by_multi_isin,
+    filter_by_multi_notin,
     filter_data,
     filter_list_by_indexes,
     indexes_from_filter,
+    indexes_from_mask,
+    mask_and,
+    mask_eq,
+    mask_func,
+    mask_ge,
+    mask_gt,
+    mask_isin,
+    mask_isin_multi,
+    mask_le,
+    mask_lt,
+    mask_ne,
+    mask_not,
+    mask_notin,
+    mask_or,
     only_columns,
     only_columns_inplace,
     sample,
@@ -320,3 +341,102 @@ def test_sample_all_rows():
     result = sample(DATA, 5, random_state=42)
     assert len(result['x']) == 5
 
+
+
+# Tests for masks
+def test_compare_masks():
+    column = [1, 2, 3, 4, 5]
+    assert mask_eq(column, 3) == bytes([0, 0, 1, 0, 0])
+    assert mask_ne(column, 3) == bytes([1, 1, 0, 1, 1])
+    assert mask_gt(column, 3) == bytes([0, 0, 0, 1, 1])
+    assert mask_lt(column, 3) == bytes([1, 1, 0, 0, 0])
+    assert mask_ge(column, 3) == bytes([0, 0, 1, 1, 1])
+    assert mask_le(column, 3) == bytes([1, 1, 1, 0, 0])
+    assert mask_isin(column, [2, 5]) == bytes([0, 1, 0, 0, 1])
+    assert mask_notin(column, [2, 5]) == bytes([1, 0, 1, 1, 0])
+    assert mask_func(column, lambda x: x % 2) == bytes([1, 0, 1, 0, 1])
+
+
+def test_mask_array_column():
+    assert mask_gt(array('q', [1, 5, 3]), 2) == bytes([0, 1, 1])
+
+
+def test_mask_truthy_results():
+    class Weird:
+        def __eq__(self, other):
+            return 'yes'
+    assert mask_eq([Weird(), Weird()], 1) == bytes([1, 1])
+
+
+def test_combine_masks():
+    a = bytes([1, 1, 0, 0])
+    b = [True, False, True, False]
+    assert mask_and(a, b) == bytes([1, 0, 0, 0])
+    assert mask_or(a, b) == bytes([1, 1, 1, 0])
+    assert mask_not(a) == bytes([0, 0, 1, 1])
+    assert mask_and(a) == a
+    assert mask_not(b'') == b''
+
+
+def test_combine_masks_long():
+    column = list(range(1000))
+    mask = mask_and(mask_ge(column, 100), mask_not(mask_lt(column, 900)), mask_ne(column, 950))
+    assert indexes_from_mask(mask).tolist() == [i for i in column if i >= 900 and i != 950]
+
+
+def test_as_mask():
+    assert as_mask([True, False]) == bytes([1, 0])
+    assert as_mask(bytes([0, 1])) == bytes([0, 1])
+
+
+def test_indexes_from_mask():
+    result = indexes_from_mask(bytes([0, 1, 1, 0, 1]))
+    assert result == array('q', [1, 2, 4])
+
+
+def test_filter_by_mask():
+    mask = mask_and(mask_gt(DATA['x'], 1), mask_ne(DATA['z'], 'd'))
+    result = filter_by_mask(DATA, mask)
+    assert result == {'x': [2, 3, 5], 'y': [20, 30, 50], 'z': ['b', 'c', 'e']}
+
+
+def test_filter_by_mask_array_column():
+    data = {'x': array('q', [1, 2, 3]), 'z': ['a', 'b', 'c']}
+    result = filter_by_mask(data, [True, False, True])
+    assert result == {'x': array('q', [1, 3]), 'z': ['a', 'c']}
+
+
+# Tests for hashed membership
+def test_value_set():
+    lookup = ValueSet([1, 'a', [2, 3], {'k': 1}])
+    assert len(lookup) == 4
+    assert 1 in lookup
+    assert 'a' in lookup
+    assert [2, 3] in lookup
+    assert {'k': 1} in lookup
+    assert 2 not in lookup
+    assert [2] not in lookup
+
+
+def test_mask_isin_unhashable_column():
+    column = [[1], 2, [3], 4]
+    assert mask_isin(column, [2, [3]]) == bytes([0, 1, 1, 0])
+    assert mask_isin(column, [2, 4]) == bytes([0, 1, 0, 1])
+
+
+def test_mask_isin_large_lookup():
+    column = list(range(0, 200000, 7))
+    values = list(range(0, 200000, 3))
+    result = mask_isin(column, values)
+    assert indexes_from_mask(result).tolist() == [i for i, x in enumerate(column) if x % 3 == 0]
+
+
+def test_mask_isin_multi():
+    columns = [[1, 1, 2, [2]], ['a', 'b', 'a', 'a']]
+    assert mask_isin_multi(columns, [(1, 'b'), [2, 'a'], ([2], 'a')]) == bytes([0, 1, 1, 1])
+
+
+def test_filter_by_multi_isin():
+    data = {'x': [1, 1, 2], 'y': ['a', 'b', 'a'], 'z': [7, 8, 9]}
+    assert filter_by_multi_isin(data, ['x', 'y'], [(1, 'b'), (2, 'a')]) == {'x': [1, 2], 'y': ['b', 'a'], 'z': [8, 9]}
+    assert filter_by_multi_notin(data, ['x', 'y'], [(1, 'b'), (2, 'a')]) == {'x': [1], 'y': ['a'], 'z': [7]}
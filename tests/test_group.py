@@ -1,8 +1,11 @@
 from tinytim.group import (
+    GroupAggregator,
+    aggregate,
     aggregate_data,
     aggregate_groups,
     count_data,
     count_groups,
+    group_indexes,
     groupby,
     groupbycolumn,
     groupbymulti,
@@ -276,3 +279,94 @@ def test_aggregate_groups_empty_result():
     # Even empty data produces a result (sums to 0), so not filtered
     assert len(labels) == 1
 
+
+# Tests for group_indexes
+def test_group_indexes():
+    assert group_indexes(['a', 'b', 'a', 'c', 'b']) == [('a', [0, 2]), ('b', [1, 4]), ('c', [3])]
+
+
+def test_group_indexes_unhashable():
+    column = [[1], 'a', [1], [2], 'a']
+    assert group_indexes(column) == [([1], [0, 2]), ('a', [1, 4]), ([2], [3])]
+
+
+def test_groupby_first_seen_order():
+    data = {'k': ['b', 'a', 'b', 'c', 'a'], 'v': [1, 2, 3, 4, 5]}
+    groups = groupby(data, 'k')
+    assert groups == [('b', {'k': ['b', 'b'], 'v': [1, 3]}),
+                      ('a', {'k': ['a', 'a'], 'v': [2, 5]}),
+                      ('c', {'k': ['c'], 'v': [4]})]
+
+
+def test_groupbycolumn_unhashable_keys():
+    data = {'k': [[1], [2], [1]], 'v': [1, 2, 3]}
+    groups = groupbycolumn(data, data['k'])
+    assert groups == [([1], {'k': [[1], [1]], 'v': [1, 3]}),
+                      ([2], {'k': [[2]], 'v': [2]})]
+
+
+# Tests for aggregate
+def test_aggregate_matches_groups():
+    labels, result = aggregate(DATA, 'Animal', {'Max Speed': 'sum', 'Color': 'count'})
+    assert labels == ['Falcon', 'Parrot']
+    assert result == {'Max Speed': [750, 50], 'Color': [2, 2]}
+
+
+def test_aggregate_min_max_nunique_mode():
+    data = {'group': ['A', 'B', 'A', 'B', 'A'],
+            'value': [3, 5, 1, 5, 3]}
+    funcs = {'value': 'min'}
+    assert aggregate(data, 'group', funcs) == (['A', 'B'], {'value': [1, 5]})
+    funcs = {'value': 'max'}
+    assert aggregate(data, 'group', funcs) == (['A', 'B'], {'value': [3, 5]})
+    funcs = {'value': 'nunique'}
+    assert aggregate(data, 'group', funcs) == (['A', 'B'], {'value': [2, 1]})
+    funcs = {'value': 'mode'}
+    assert aggregate(data, 'group', funcs) == (['A', 'B'], {'value': [3, 5]})
+
+
+def test_aggregate_mean_stdev_pstdev():
+    data = {'group': ['A', 'A', 'A', 'B', 'B', 'B'],
+            'value': [1, 2, 3, 4, 5, 9]}
+    groups = groupby(data, 'group')
+    for func, groups_func in [('mean', mean_groups), ('stdev', stdev_groups), ('pstdev', pstdev_groups)]:
+        labels, result = aggregate(data, 'group', {'value': func})
+        expected_labels, expected = groups_func(groups)
+        assert labels == expected_labels
+        assert all(abs(a - b) < 1e-9 for a, b in zip(result['value'], expected['value']))
+
+
+def test_aggregate_multiple_columns():
+    labels, result = aggregate(DATA, ['Animal', 'Color'], {'Max Speed': 'max'})
+    assert labels == [('Falcon', 'Brown'), ('Parrot', 'Blue'), ('Parrot', 'Red')]
+    assert result == {'Max Speed': [380, 24, 26]}
+
+
+def test_aggregate_unknown_func():
+    import pytest
+    with pytest.raises(ValueError, match='unknown aggregation'):
+        aggregate(DATA, 'Animal', {'Max Speed': 'median'})
+
+
+def test_aggregate_stdev_single_value():
+    from statistics import StatisticsError
+
+    import pytest
+    data = {'group': ['A'], 'value': [1]}
+    with pytest.raises(StatisticsError):
+        aggregate(data, 'group', {'value': 'stdev'})
+
+
+def test_group_aggregator_chunks():
+    aggregator = GroupAggregator('Animal', {'Max Speed': 'sum'})
+    aggregator.update({'Animal': ['Falcon', 'Parrot'], 'Max Speed': [380, 24]})
+    aggregator.update({'Animal': ['Falcon', 'Parrot'], 'Max Speed': [370, 26]})
+    assert aggregator.result() == (['Falcon', 'Parrot'], {'Max Speed': [750, 50]})
+
+
+def test_accumulator_is_abstract():
+    import pytest
+
+    from tinytim.group import _Accumulator
+    with pytest.raises(TypeError):
+        _Accumulator()
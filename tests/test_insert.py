@@ -1,4 +1,4 @@
-from tinytim.insert import insert_row, insert_row_inplace, insert_rows, insert_rows_inplace
+from tinytim.insert import RowAppender, insert_row, insert_row_inplace, insert_rows, insert_rows_inplace
 
 
 def test_insert_row_basic():
@@ -104,3 +104,70 @@ def test_insert_row_single_column():
     result = insert_row(data, row)
     assert result == {'x': [1, 2, 3, 99]}
 
+
+
+def test_insert_rows_inplace_add_columns():
+    data = {'x': [1]}
+    insert_rows_inplace(data, [{'x': 2, 'y': 'a'}, {'z': 0}], add_columns=True)
+    assert data == {'x': [1, 2, None], 'y': [None, 'a', None], 'z': [None, None, 0]}
+
+
+def test_insert_rows_add_columns_copy():
+    data = {'x': [1]}
+    assert insert_rows(data, [{'y': 2}], missing_value=0, add_columns=True) == {'x': [1, 0], 'y': [0, 2]}
+    assert data == {'x': [1]}
+
+
+def test_row_appender_flush_size():
+    data = {'x': [], 'y': []}
+    appender = RowAppender(data, flush_size=2)
+    appender.extend([(1, 2), {'x': 3, 'y': 4}, (5, 6)])
+    assert len(appender) == 1
+    assert data == {'x': [1, 3], 'y': [2, 4]}
+    appender.flush()
+    assert len(appender) == 0
+    assert data == {'x': [1, 3, 5], 'y': [2, 4, 6]}
+
+
+def test_row_appender_generator_of_rows():
+    data = {'x': [], 'y': []}
+    with RowAppender(data, flush_size=3) as appender:
+        appender.extend({'x': i, 'y': -i} for i in range(10))
+    assert data == {'x': list(range(10)), 'y': [-i for i in range(10)]}
+
+
+def test_row_appender_single_column_arrays():
+    from array import array
+    data = {'x': array('q', [1])}
+    with RowAppender(data) as appender:
+        appender.extend([{'x': 2}, [3]])
+    assert data == {'x': array('q', [1, 2, 3])}
+
+
+def test_row_appender_wrong_sequence_length():
+    import pytest
+    data = {'x': [1], 'y': [2]}
+    appender = RowAppender(data)
+    appender.append((3,))
+    with pytest.raises(ValueError):
+        appender.flush()
+    assert data == {'x': [1], 'y': [2]}
+    with pytest.raises(ValueError):
+        RowAppender(data, flush_size=0)
+
+
+def test_row_appender_failed_flush_keeps_rows_and_columns_aligned():
+    from array import array
+
+    import pytest
+    data = {'x': [1], 'y': array('q', [2])}
+    appender = RowAppender(data, add_columns=True)
+    appender.extend([{'x': 3, 'y': 4, 'z': 5}, {'x': 6}])
+    with pytest.raises(TypeError):
+        appender.flush()
+    assert data == {'x': [1], 'y': array('q', [2])}
+    assert len(appender) == 2
+    data['y'] = [2]
+    appender.flush()
+    assert data == {'x': [1, 3, 6], 'y': [2, 4, None], 'z': [None, 5, None]}
+    assert len(appender) == 0
@@ -1,12 +1,21 @@
+import math
+
+from tinytim.dropna import dropna
+from tinytim.fillna import fillna
 from tinytim.isna import (
+    NA,
+    NAN,
+    MissingValues,
     column_isnull,
     column_isnull_inplace,
+    column_isnull_mask,
     column_notnull,
     column_notnull_inplace,
     is_missing,
     isna,
     isnull,
     isnull_inplace,
+    missing_check,
     notna,
     notnull,
     notnull_inplace,
@@ -258,3 +267,80 @@ def test_row_isnull_empty_row():
     result = row_isnull(row)
     assert result == {}
 
+
+
+# Tests for column_isnull_mask
+def test_column_isnull_mask():
+    assert column_isnull_mask([1, None, 'a', None]) == bytes([0, 1, 0, 1])
+
+
+def test_column_isnull_mask_custom_na_value():
+    assert column_isnull_mask([0, 1, 0.0, False], 0) == bytes([1, 0, 1, 1])
+
+
+def test_column_isnull_mask_custom_eq():
+    class AlwaysEqual:
+        def __eq__(self, other):
+            return True
+    assert column_isnull_mask([AlwaysEqual(), 1]) == bytes([1, 0])
+
+
+# Tests for NaN and MissingValues sentinels
+def test_is_missing_any_nan():
+    assert is_missing(float('nan'), NAN)
+    assert is_missing(math.nan, float('nan'))
+    assert not is_missing(1.0, NAN)
+    assert not is_missing(None, NAN)
+
+
+def test_missing_values_sentinels():
+    na = MissingValues(None, NAN, '', [])
+    assert is_missing(None, na)
+    assert is_missing(float('nan'), na)
+    assert is_missing('', na)
+    assert not is_missing([], na)
+    assert not is_missing(0, na)
+    assert not is_missing('a', na)
+    assert not is_missing({'a': 1}, na)
+
+
+def test_missing_values_identity_sentinel():
+    marker = []
+    na = MissingValues(marker)
+    assert is_missing(marker, na)
+    assert column_isnull_mask([[], marker, 1], na) == bytes([0, 1, 0])
+
+
+def test_missing_check_matches_is_missing():
+    values = [None, 0, 0.0, False, '', float('nan'), 'a', [1], 1]
+    for na_value in [None, 0, '', NAN, NA, MissingValues(0, '')]:
+        check = missing_check(na_value)
+        assert [check(value) for value in values] == [is_missing(value, na_value) for value in values]
+
+
+def test_column_isnull_mask_matches_is_missing():
+    column = [None, 0, 0.0, False, '', float('nan'), 'a', [1], 1]
+    for na_value in [None, 0, '', NAN, NA, MissingValues(0, '')]:
+        expected = bytes(is_missing(value, na_value) for value in column)
+        assert column_isnull_mask(column, na_value) == expected
+
+
+def test_isnull_nan():
+    data = {'x': [1.0, float('nan'), None]}
+    assert isnull(data, NA) == {'x': [False, True, True]}
+    assert isnull(data) == {'x': [False, False, True]}
+
+
+def test_missing_values_mask_after_edit():
+    na = MissingValues(None, NAN)
+    data = {'x': [1, None, 3]}
+    assert dropna(data, na_value=na) == {'x': [1, 3]}
+    data['x'][1] = 2
+    assert dropna(data, na_value=na) == {'x': [1, 2, 3]}
+
+
+def test_dropna_fillna_missing_values():
+    na = MissingValues(None, NAN, '')
+    data = {'x': [1, None, 3, 4], 'y': ['a', 'b', '', float('nan')]}
+    assert dropna(data, na_value=na) == {'x': [1], 'y': ['a']}
+    assert fillna(data, 0, na_value=na) == {'x': [1, 0, 3, 4], 'y': ['a', 'b', 0, 0]}
@@ -1,4 +1,4 @@
-from tinytim.join import full_join, inner_join, left_join, locate, right_join
+from tinytim.join import anti_join, full_join, inner_join, left_join, locate, right_join, semi_join
 from tinytim.rows import records_equal
 
 
@@ -170,3 +170,167 @@ def test_join_with_empty_on_list():
     # Empty list for left_on should raise error
     with pytest.raises((ValueError, IndexError)):
         inner_join(left, right, left_on=[], right_on=[])
+
+
+# Test hash join keeps row order and duplicate matches
+def test_inner_join_duplicate_keys_order():
+    left = {'id': ['a', 'c', 'd', 'f', 'a'], 'x': [1, 2, 3, 4, 5]}
+    right = {'id': ['a', 'b', 'c', 'd', 'c'], 'y': [10, 20, 30, 40, 50]}
+    result = inner_join(left, right, 'id')
+    assert result == {'id': ['a', 'c', 'c', 'd', 'a'],
+                      'x': [1, 2, 2, 3, 5],
+                      'y': [10, 30, 50, 40, 10]}
+
+
+def test_inner_join_smaller_left_order():
+    left = {'id': ['c', 'a'], 'x': [1, 2]}
+    right = {'id': ['a', 'c', 'b', 'c', 'a'], 'y': [10, 20, 30, 40, 50]}
+    result = inner_join(left, right, 'id')
+    assert result == {'id': ['c', 'c', 'a', 'a'],
+                      'x': [1, 1, 2, 2],
+                      'y': [20, 40, 10, 50]}
+
+
+def test_left_join_smaller_left_order():
+    left = {'id': ['c', 'z', 'a'], 'x': [1, 2, 3]}
+    right = {'id': ['a', 'c', 'b', 'c', 'a'], 'y': [10, 20, 30, 40, 50]}
+    result = left_join(left, right, 'id')
+    assert result == {'id': ['c', 'c', 'z', 'a', 'a'],
+                      'x': [1, 1, 2, 3, 3],
+                      'y': [20, 40, None, 10, 50]}
+
+
+def test_right_join_duplicate_keys_order():
+    left = {'id': ['a', 'c', 'd', 'f', 'a'], 'x': [1, 2, 3, 4, 5]}
+    right = {'id': ['a', 'b', 'c'], 'y': [10, 20, 30]}
+    result = right_join(left, right, 'id')
+    assert result == {'id': ['a', 'a', 'b', 'c'],
+                      'x': [1, 5, None, 2],
+                      'y': [10, 10, 20, 30]}
+
+
+def test_full_join_order():
+    left = {'id': ['a', 'c', 'd', 'f', 'g'], 'x': [33, 44, 55, 66, 77]}
+    right = {'id': ['a', 'b', 'c', 'd'], 'y': [11, 22, 33, 44]}
+    result = full_join(left, right, 'id')
+    assert result == {'id': ['a', 'c', 'd', 'f', 'g', 'b'],
+                      'x': [33, 44, 55, 66, 77, None],
+                      'y': [11, 33, 44, None, None, 22]}
+
+
+def test_inner_join_unhashable_keys():
+    left = {'id': [[1], [2], [3]], 'x': [1, 2, 3]}
+    right = {'id': [[2], [3], [4]], 'y': [20, 30, 40]}
+    result = inner_join(left, right, 'id')
+    assert result == {'id': [[2], [3]], 'x': [2, 3], 'y': [20, 30]}
+
+
+# Test sort-merge join strategy
+def test_inner_join_merge_sorted_matches_hash():
+    left = {'id': ['a', 'a', 'c', 'd', 'f'], 'x': [1, 2, 3, 4, 5]}
+    right = {'id': ['a', 'b', 'c', 'c', 'd'], 'y': [10, 20, 30, 40, 50]}
+    assert inner_join(left, right, 'id', strategy='merge') == inner_join(left, right, 'id')
+
+
+def test_left_join_merge_sorted_matches_hash():
+    left = {'id': ['a', 'a', 'c', 'd', 'f'], 'x': [1, 2, 3, 4, 5]}
+    right = {'id': ['a', 'b', 'c', 'c', 'd'], 'y': [10, 20, 30, 40, 50]}
+    assert left_join(left, right, 'id', strategy='merge') == left_join(left, right, 'id')
+
+
+def test_right_join_merge_sorted_matches_hash():
+    left = {'id': ['a', 'a', 'c', 'd', 'f'], 'x': [1, 2, 3, 4, 5]}
+    right = {'id': ['a', 'b', 'c', 'c', 'd'], 'y': [10, 20, 30, 40, 50]}
+    assert right_join(left, right, 'id', strategy='merge') == right_join(left, right, 'id')
+
+
+def test_full_join_merge_key_order():
+    left = {'id': ['a', 'c', 'd', 'f', 'g'], 'x': [33, 44, 55, 66, 77]}
+    right = {'id': ['a', 'b', 'c', 'd'], 'y': [11, 22, 33, 44]}
+    result = full_join(left, right, 'id', strategy='merge')
+    assert result == {'id': ['a', 'b', 'c', 'd', 'f', 'g'],
+                      'x': [33, None, 44, 55, 66, 77],
+                      'y': [11, 22, 33, 44, None, None]}
+
+
+def test_inner_join_merge_unsorted():
+    left = {'id': [3, 1, 2, 1], 'x': ['c', 'a', 'b', 'aa']}
+    right = {'id': [2, 1, 4], 'y': [20, 10, 40]}
+    result = inner_join(left, right, 'id', strategy='merge')
+    assert result == {'id': [1, 1, 2], 'x': ['a', 'aa', 'b'], 'y': [10, 10, 20]}
+
+
+def test_left_join_merge_multiple_columns():
+    left = {'a': [2, 1, 1], 'b': ['x', 'y', 'x'], 'val': [30, 20, 10]}
+    right = {'a': [1, 2, 1], 'b': ['x', 'x', 'z'], 'score': [100, 300, 200]}
+    result = left_join(left, right, left_on=['a', 'b'], right_on=['a', 'b'], strategy='merge')
+    assert result == {'a': [1, 1, 2], 'b': ['x', 'y', 'x'],
+                      'val': [10, 20, 30], 'score': [100, None, 300]}
+
+
+def test_full_join_merge_none_and_nan_keys():
+    nan = float('nan')
+    left = {'id': [1.0, nan, None], 'x': [1, 2, 3]}
+    right = {'id': [None, nan, 1], 'y': [10, 20, 30]}
+    result = full_join(left, right, 'id', strategy='merge')
+    assert result['x'] == [1, 2, 3]
+    assert result['y'] == [30, 20, 10]
+    other_nan = {'id': [float('nan'), 1], 'y': [20, 30]}
+    result = full_join({'id': [1.0, nan], 'x': [1, 2]}, other_nan, 'id', strategy='merge')
+    assert result['x'] == [1, 2, None]
+    assert result['y'] == [30, None, 20]
+
+
+def test_left_join_merge_none_in_tuple_keys():
+    left = {'a': [1, None, 1], 'b': ['x', 'y', None], 'val': [1, 2, 3]}
+    right = {'a': [None, 1], 'b': ['y', 'x'], 'score': [20, 10]}
+    result = left_join(left, right, left_on=['a', 'b'], right_on=['a', 'b'], strategy='merge')
+    assert result == {'a': [1, None, 1], 'b': ['x', 'y', None], 'val': [1, 2, 3], 'score': [10, 20, None]}
+
+
+def test_join_merge_incomparable_keys():
+    import pytest
+    left = {'id': [1, 'a'], 'x': [1, 2]}
+    right = {'id': [1], 'y': [10]}
+    with pytest.raises(ValueError, match='compared'):
+        inner_join(left, right, 'id', strategy='merge')
+
+
+def test_join_invalid_strategy():
+    import pytest
+    left = {'id': [1, 2], 'value': ['a', 'b']}
+    right = {'id': [2, 3], 'score': [10, 20]}
+    with pytest.raises(ValueError, match='strategy'):
+        inner_join(left, right, 'id', strategy='nested')
+
+
+def test_semi_join():
+    left = {'id': ['a', 'c', 'd', 'f'], 'x': [33, 44, 55, 66]}
+    right = {'key': ['a', 'b', 'c', 'c'], 'y': [11, 22, 33, 44]}
+    assert semi_join(left, right, 'id', 'key') == {'id': ['a', 'c'], 'x': [33, 44]}
+
+
+def test_anti_join():
+    left = {'id': ['a', 'c', 'd', 'f'], 'x': [33, 44, 55, 66]}
+    right = {'key': ['a', 'b', 'c', 'c'], 'y': [11, 22, 33, 44]}
+    assert anti_join(left, right, 'id', 'key') == {'id': ['d', 'f'], 'x': [55, 66]}
+
+
+def test_semi_anti_join_multi_column():
+    left = {'a': [1, 1, 2, 2], 'b': ['x', 'y', 'x', 'y'], 'v': [1, 2, 3, 4]}
+    right = {'a': [1, 2], 'b': ['y', 'x']}
+    assert semi_join(left, right, ['a', 'b']) == {'a': [1, 2], 'b': ['y', 'x'], 'v': [2, 3]}
+    assert anti_join(left, right, ['a', 'b']) == {'a': [1, 2], 'b': ['x', 'y'], 'v': [1, 4]}
+
+
+def test_semi_join_unhashable_keys():
+    left = {'id': [[1], [2], [3]], 'x': [1, 2, 3]}
+    right = {'id': [[3], [1]]}
+    assert semi_join(left, right, 'id') == {'id': [[1], [3]], 'x': [1, 3]}
+
+
+def test_semi_join_missing_column():
+    import pytest
+
+    with pytest.raises(ValueError):
+        semi_join({'id': [1]}, {'key': [1]}, ['id', 'z'], ['key', 'z'])
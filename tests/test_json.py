@@ -33,3 +33,122 @@ def test_json_list_to_data():
     result = json_functions.json_list_to_data(json)
     expected = DATA
     assert result == expected
+
+
+def test_data_to_json_columns_round_trip():
+    from array import array
+    data = {'x': array('q', [1, 2, 3]), 'y': ['a', None, 'c']}
+    text = json_functions.data_to_json(data, orient='columns')
+    assert text == '{"x": [1, 2, 3], "y": ["a", null, "c"]}'
+    assert json_functions.json_to_data(text) == {'x': [1, 2, 3], 'y': ['a', None, 'c']}
+
+
+def test_json_orient_errors():
+    import pytest
+    with pytest.raises(ValueError):
+        json_functions.data_to_json(DATA, orient='rows')
+    with pytest.raises(ValueError):
+        json_functions.json_to_data('{"x": [1, 2], "y": [1]}')
+    with pytest.raises(ValueError):
+        json_functions.json_to_data('{"x": 1}')
+
+
+def test_write_read_json_file(tmp_path, monkeypatch):
+    # small blocks make rows cross read boundaries
+    monkeypatch.setattr(json_functions, 'BLOCK_SIZE', 7)
+    data = {'x': list(range(25)), 'name': [f'row "{i}" ]' for i in range(25)]}
+    path = tmp_path / 'data.json'
+    json_functions.write_json(data, path)
+    assert path.read_text() == json_functions.data_to_json(data)
+    assert json_functions.read_json(path) == data
+    json_functions.write_json(data, path, orient='columns')
+    assert json_functions.read_json(path) == data
+
+
+def test_read_json_whitespace_and_missing_keys():
+    import io
+    text = ' \n[ {"x": 1} ,\n {"y": 2}\n ]\n'
+    assert json_functions.read_json(io.StringIO(text), missing_value=0) == {'x': [1, 0], 'y': [0, 2]}
+    assert json_functions.read_json(io.StringIO('[]')) == {}
+
+
+def test_read_json_invalid():
+    import io
+
+    import pytest
+    for text in ['', '3', '[1, 2]', '[{"x": 1} {"x": 2}]', '[{"x": 1}']:
+        with pytest.raises(ValueError):
+            json_functions.read_json(io.StringIO(text))
+
+
+def test_iter_json_chunks():
+    import io
+
+    import tinytim.stream as stream_functions
+    text = json_functions.data_to_json({'x': [1, 2, 3, 4, 5]})
+    chunks = list(json_functions.iter_json(io.StringIO(text), 2))
+    assert chunks == [{'x': [1, 2]}, {'x': [3, 4]}, {'x': [5]}]
+    columns = io.StringIO('{"x": [1, 2, 3]}')
+    assert stream_functions.concat(json_functions.iter_json(columns, 2)) == {'x': [1, 2, 3]}
+
+
+def test_write_json_chunks():
+    import io
+    file = io.StringIO()
+    json_functions.write_json_chunks(iter([{'x': [1]}, {'x': []}, {'x': [2]}]), file)
+    assert file.getvalue() == '[{"x": 1}, {"x": 2}]'
+    file = io.StringIO()
+    json_functions.write_json_chunks([], file)
+    assert file.getvalue() == '[]'
+
+
+NDJSON = '{"x": 1, "y": 6}\n{"x": 2}\n\n{"x": 3, "y": 8, "z": "a"}\n{"z": "b"}\n'
+
+
+def test_iter_ndjson_backfills_new_columns():
+    import io
+    chunks = list(json_functions.iter_ndjson(io.StringIO(NDJSON), 2))
+    assert chunks == [
+        {'x': [1, 2], 'y': [6, None]},
+        {'x': [3, None], 'y': [8, None], 'z': ['a', 'b']}
+    ]
+    expected = {'x': [1, 2, 3, None], 'y': [6, None, 8, None], 'z': [None, None, 'a', 'b']}
+    assert json_functions.read_ndjson(io.StringIO(NDJSON)) == expected
+    assert json_functions.ndjson_to_data(NDJSON) == expected
+
+
+def test_iter_ndjson_columns():
+    import io
+    chunks = list(json_functions.iter_ndjson(io.StringIO(NDJSON), 3, columns=['z', 'x'], missing_value=0))
+    assert chunks == [{'z': [0, 0, 'a'], 'x': [1, 2, 3]}, {'z': ['b'], 'x': [0]}]
+
+
+def test_iter_ndjson_invalid():
+    import io
+
+    import pytest
+    for text in ['[1, 2]\n', '{"x": 1}\n{"x": \n', '{"x": 1}, {"x": 2}\n']:
+        with pytest.raises(ValueError):
+            list(json_functions.iter_ndjson(io.StringIO(text)))
+    with pytest.raises(ValueError):
+        list(json_functions.iter_ndjson(io.StringIO(NDJSON), 0))
+    assert list(json_functions.iter_ndjson(io.StringIO(''))) == []
+
+
+def test_iter_ndjson_processes(tmp_path):
+    path = tmp_path / 'data.ndjson'
+    rows = [{'x': i} if i < 50 else {'x': i, 'y': -i} for i in range(100)]
+    path.write_text(''.join(f'{json_functions.json.dumps(row)}\n' for row in rows))
+    serial = list(json_functions.iter_ndjson(path, 7))
+    assert list(json_functions.iter_ndjson(path, 7, processes=2)) == serial
+    assert json_functions.read_ndjson(path, processes=2) == json_functions.read_ndjson(path)
+
+
+def test_write_ndjson_append(tmp_path):
+    path = tmp_path / 'data.ndjson'
+    json_functions.write_ndjson({'x': [1, 2]}, path)
+    json_functions.write_ndjson_chunks(iter([{'x': [3], 'y': ['a']}, {'x': []}]), path, append=True)
+    assert path.read_text() == '{"x": 1}\n{"x": 2}\n{"x": 3, "y": "a"}\n'
+    assert json_functions.read_ndjson(path) == {'x': [1, 2, 3], 'y': [None, None, 'a']}
+    json_functions.write_ndjson({'x': [4]}, path)
+    assert path.read_text() == json_functions.data_to_ndjson({'x': [4]})
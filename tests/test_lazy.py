@@ -0,0 +1,103 @@
+import tinytim.filter as filter_functions
+import tinytim.join as join_functions
+from tinytim.lazy import Filter, Join, Project, Scan, lazy
+
+LEFT = {'id': [1, 2, 3, 4], 'x': [10, 20, 30, 40], 'unused': ['a', 'b', 'c', 'd']}
+RIGHT = {'id': [2, 3, 5], 'y': [200, 300, 500]}
+
+
+def test_collect_scan_copies():
+    results = lazy(LEFT).collect()
+    assert results == LEFT
+    assert results['x'] is not LEFT['x']
+
+
+def test_filters_fused():
+    plan = lazy(LEFT).filter_by_column_gt('x', 15).filter_by_column_lt('x', 40).optimized_plan()
+    assert isinstance(plan, Filter)
+    assert isinstance(plan.child, Scan)
+    assert len(plan.predicates) == 2
+    results = lazy(LEFT).filter_by_column_gt('x', 15).filter_by_column_lt('x', 40).collect()
+    assert results == {'id': [2, 3], 'x': [20, 30], 'unused': ['b', 'c']}
+
+
+def test_filter_pushed_below_inner_join():
+    query = lazy(LEFT).inner_join(RIGHT, 'id').filter_by_column_gt('x', 15).filter_by_column_eq('y', 300)
+    plan = query.optimized_plan()
+    assert isinstance(plan, Join)
+    assert isinstance(plan.left, Filter)
+    assert isinstance(plan.right, Filter)
+    expected = filter_functions.filter_by_column_eq(
+        filter_functions.filter_by_column_gt(join_functions.inner_join(LEFT, RIGHT, 'id'), 'x', 15), 'y', 300)
+    assert query.collect() == expected
+
+
+def test_key_filter_pushed_to_both_sides():
+    query = lazy(LEFT).full_join(RIGHT, 'id').filter_by_column_isin('id', [1, 5])
+    plan = query.optimized_plan()
+    assert isinstance(plan, Join)
+    assert isinstance(plan.left, Filter)
+    assert isinstance(plan.right, Filter)
+    expected = filter_functions.filter_by_column_isin(join_functions.full_join(LEFT, RIGHT, 'id'), 'id', [1, 5])
+    assert query.collect() == expected
+
+
+def test_filter_kept_above_outer_side():
+    query = lazy(LEFT).right_join(RIGHT, 'id').filter_by_column_func('x', lambda x: x is None or x > 25)
+    plan = query.optimized_plan()
+    assert isinstance(plan, Filter)
+    assert isinstance(plan.child, Join)
+    expected = filter_functions.filter_by_column_func(
+        join_functions.right_join(LEFT, RIGHT, 'id'), 'x', lambda x: x is None or x > 25)
+    assert query.collect() == expected
+
+
+def test_projection_pushed_below_join():
+    query = lazy(LEFT).left_join(RIGHT, 'id').filter_by_columns(['id', 'y'])
+    plan = query.optimized_plan()
+    assert isinstance(plan, Project)
+    assert isinstance(plan.child, Join)
+    assert isinstance(plan.child.left, Project)
+    assert plan.child.left.columns == ('id',)
+    assert query.collect() == {'id': [1, 2, 3, 4], 'y': [None, 200, 300, None]}
+
+
+def test_join_different_key_names():
+    right = {'key': [2, 3, 5], 'y': [200, 300, 500]}
+    query = lazy(LEFT).inner_join(right, 'id', 'key').filter_by_column_ge('key', 3)
+    expected = filter_functions.filter_by_column_ge(join_functions.inner_join(LEFT, right, 'id', 'key'), 'key', 3)
+    assert query.collect() == expected
+
+
+def test_join_lazy_tables():
+    right = lazy(RIGHT).filter_by_column_ne('y', 200)
+    results = lazy(LEFT).inner_join(right, 'id').collect()
+    assert results == {'id': [3], 'x': [30], 'unused': ['c'], 'y': [300]}
+
+
+def test_aggregate():
+    data = {'g': ['a', 'b', 'a', 'b'], 'x': [1, 2, 3, 4], 'z': [0, 0, 0, 0]}
+    labels, results = lazy(data).filter_by_column_gt('x', 1).aggregate('g', {'x': 'sum'})
+    assert labels == ['b', 'a']
+    assert results == {'x': [6, 3]}
+
+
+def test_groupby():
+    data = {'g': ['a', 'b', 'a'], 'x': [1, 2, 3]}
+    groups = lazy(data).filter_by_column_le('x', 2).groupby('g')
+    assert groups == [('a', {'g': ['a'], 'x': [1]}), ('b', {'g': ['b'], 'x': [2]})]
+
+
+def test_explain():
+    text = lazy(LEFT).inner_join(RIGHT, 'id').filter_by_column_gt('x', 15).explain()
+    assert text.splitlines()[0] == "Join inner on 'id' = 'id'"
+    assert '  Filter x > 15' in text
+
+
+def test_filter_on_projected_away_column_raises():
+    import pytest
+    data = {'a': [1, 2, 3], 'x': [4, 5, 6]}
+    with pytest.raises(KeyError):
+        lazy(data).filter_by_columns(['x']).filter_by_column_gt('a', 1).collect()
+    result = lazy(data).filter_by_columns(['x', 'a']).filter_by_column_gt('a', 1).filter_by_columns(['x']).collect()
+    assert result == {'x': [5, 6]}
@@ -453,6 +453,22 @@ def test_fillna_forwardfill_row_with_limit():
     assert result['c'] is None
 
 
+def test_dropna_subset_unknown_column():
+    data = {"A": [None, 1], "B": [2, None]}
+    for kwargs in [{}, {'how': 'all'}, {'thresh': 1}]:
+        with pytest.raises(KeyError):
+            dropna(data, subset=['A', 'Z'], **kwargs)
+
+
+def test_dropna_columns_thresh_nan_na_value():
+    from tinytim.dropna import column_na_thresh
+    nan = float('nan')
+    data = {"A": [float('nan'), 1], "B": [1, 2]}
+    assert dropna(data, thresh=2, axis='columns', na_value=nan) == {"B": [1, 2]}
+    assert not column_na_thresh([float('nan'), 1, None], 3, nan)
+    assert column_na_thresh([float('nan'), 1, None], 2)
+
+
 # Comprehensive dropna column tests
 def test_dropna_columns_thresh_with_subset():
     data = {"A": [None, None, 1], "B": [None, 2, 3], "C": [4, 5, 6], "D": [None, None, None]}
@@ -633,3 +649,55 @@ def test_fillna_with_invalid_axis():
     result = fillna(data, value=0)  # Default axis
     assert result is not None
 
+
+
+def test_fillna_ffill_carries_last_valid_value():
+    data = {'A': [None, 1, None, None, None, 2, None]}
+    result = fillna(data, method="ffill", limit=3)
+    assert result['A'] == [None, 1, 1, 1, 1, 2, None]
+
+
+def test_fillna_ffill_rows():
+    data = {'A': [1, None, None], 'B': [None, 2, None], 'C': [None, None, None]}
+    result = fillna(data, method="ffill", axis=1)
+    assert result == {'A': [1, None, None], 'B': [1, 2, None], 'C': [1, 2, None]}
+
+
+def test_fillna_bfill_rows_limit():
+    data = {'A': [None, None], 'B': [None, 2], 'C': [3, None]}
+    result = fillna(data, method="bfill", axis='columns', limit=1)
+    assert result == {'A': [None, 2], 'B': [3, 2], 'C': [3, None]}
+
+
+def test_fillna_bfill_rows_inplace():
+    data = {'A': [None, 1], 'B': [None, None], 'C': [3, 4]}
+    fillna(data, method="bfill", axis=1, inplace=True)
+    assert data == {'A': [3, 1], 'B': [3, 4], 'C': [3, 4]}
+
+
+def test_row_na_counts():
+    from tinytim.dropna import row_na_counts
+    data = {'a': [1, None, None], 'b': [None, None, 3], 'c': [None, 2, None]}
+    assert row_na_counts(data).tolist() == [2, 2, 2]
+    assert row_na_counts(data, subset=['a', 'c']).tolist() == [1, 1, 2]
+    assert row_na_counts(data, subset=[]).tolist() == [0, 0, 0]
+
+
+def test_row_na_counts_many_columns():
+    from tinytim.dropna import row_na_counts
+    data = {f'c{i}': [None, i, None] for i in range(600)}
+    assert row_na_counts(data).tolist() == [600, 0, 600]
+
+
+def test_dropna_wide_table_thresh():
+    data = {f'c{i}': [None if i < 300 else i, i, None] for i in range(600)}
+    result = dropna(data, thresh=301)
+    assert result == {f'c{i}': [i] for i in range(600)}
+    result = dropna(data, thresh=300)
+    assert result == {f'c{i}': [None if i < 300 else i, i] for i in range(600)}
+
+
+def test_dropna_custom_na_value_subset():
+    data = {'a': [0, 1, 0], 'b': [0, 0, 2], 'c': ['x', 'y', 'z']}
+    result = dropna(data, subset=['a', 'b'], na_value=0, how='all')
+    assert result == {'a': [1, 0], 'b': [0, 2], 'c': ['y', 'z']}
@@ -212,3 +212,82 @@ def test_row_dicts_to_data_multiple_missing_keys():
     assert result['x'] == [1, None, None]
     assert result['y'] == [None, 2, None]
     assert result['z'] == [None, None, 3]
+
+
+def test_iterrows_reverse():
+    assert list(rows_functions.iterrows(DATA, reverse=True)) == [
+        (i, rows_functions.row_dict(DATA, i)) for i in reversed(range(len(DATA['x'])))
+    ]
+
+
+def test_iternamedtuples():
+    data = {'x': [1, 2], 'y': ['a', 'b'], 'not valid': [0, 0]}
+    rows = list(rows_functions.iternamedtuples(data))
+    assert rows == [(1, 'a', 0), (2, 'b', 0)]
+    assert rows[1].y == 'b'
+    assert rows[0]._fields == ('x', 'y', '_2')
+
+
+def test_records_and_values_empty():
+    assert list(rows_functions.records({})) == []
+    assert rows_functions.values({'x': []}) == ()
+
+
+def test_records_equal_multiset():
+    d1 = {'x': [1, 1, 2], 'y': ['a', 'a', 'b']}
+    assert rows_functions.records_equal(d1, {'y': ['b', 'a', 'a'], 'x': [2, 1, 1]})
+    assert not rows_functions.records_equal(d1, {'x': [1, 2, 2], 'y': ['a', 'b', 'b']})
+
+
+def test_records_equal_unhashable_values():
+    d1 = {'x': [[1], [2]]}
+    assert rows_functions.records_equal(d1, {'x': [[2], [1]]})
+    assert not rows_functions.records_equal(d1, {'x': [[2], [2]]})
+
+
+def test_records_diff_without_key():
+    d1 = {'x': [1, 1, 2, 3], 'y': ['a', 'a', 'b', 'c']}
+    d2 = {'y': ['c', 'a', 'd'], 'x': [3, 1, 4]}
+    diff = rows_functions.records_diff(d1, d2)
+    assert diff.removed == {'x': [1, 2], 'y': ['a', 'b']}
+    assert diff.added == {'x': [4], 'y': ['d']}
+    assert diff.changed == []
+    assert not diff.equal
+
+
+def test_records_diff_by_key():
+    d1 = {'a': [1, 1, 2], 'b': ['x', 'y', 'x'], 'v': [10, 20, 30]}
+    d2 = {'a': [2, 1, 1], 'b': ['x', 'y', 'z'], 'v': [30, 21, 5]}
+    diff = rows_functions.records_diff(d1, d2, ['a', 'b'])
+    assert diff.removed == {'a': [1], 'b': ['x'], 'v': [10]}
+    assert diff.added == {'a': [1], 'b': ['z'], 'v': [5]}
+    assert diff.changed == [({'a': 1, 'b': 'y', 'v': 20}, {'a': 1, 'b': 'y', 'v': 21})]
+
+
+def test_records_diff_unhashable_values():
+    d1 = {'id': [[1], [2], [2]], 'v': [{'a': 1}, {'b': 2}, {'b': 2}]}
+    d2 = {'id': [[2], [3]], 'v': [{'b': 2}, {'c': 3}]}
+    diff = rows_functions.records_diff(d1, d2)
+    assert diff.removed == {'id': [[1], [2]], 'v': [{'a': 1}, {'b': 2}]}
+    assert diff.added == {'id': [[3]], 'v': [{'c': 3}]}
+    diff = rows_functions.records_diff({'id': [[1], [2]], 'v': [1, 2]}, {'id': [[2], [3]], 'v': [5, 3]}, 'id')
+    assert diff.removed == {'id': [[1]], 'v': [1]}
+    assert diff.added == {'id': [[3]], 'v': [3]}
+    assert diff.changed == [({'id': [2], 'v': 2}, {'id': [2], 'v': 5})]
+
+
+def test_records_diff_equal():
+    d1 = {'id': [1, 2], 'v': [3, 4]}
+    diff = rows_functions.records_diff(d1, {'id': [2, 1], 'v': [4, 3]}, 'id')
+    assert diff.equal
+    assert diff.removed == {'id': [], 'v': []}
+
+
+def test_records_diff_errors():
+    import pytest
+    with pytest.raises(ValueError):
+        rows_functions.records_diff({'x': [1]}, {'y': [1]})
+    with pytest.raises(ValueError):
+        rows_functions.records_diff({'x': [1]}, {'x': [1]}, 'z')
+    with pytest.raises(ValueError):
+        rows_functions.records_diff({'x': [1, 1]}, {'x': [1]}, 'x')
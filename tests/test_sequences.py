@@ -224,3 +224,59 @@ def test_sequences_empty_should_work():
     result = add_to_sequence(column, 10)
     assert result == []
 
+
+
+# Tests for the optional numpy backend
+def test_operate_on_sequence_numpy_matches_python():
+    pytest.importorskip('numpy')
+    column = list(range(100))
+    assert add_to_sequence(column, 2) == [x + 2 for x in column]
+    assert divide_sequence(column, 4) == [x / 4 for x in column]
+    assert floor_sequence(column, column[::-1][:99] + [1]) == [x // y for x, y in zip(column, column[::-1][:99] + [1])]
+    assert all(type(x) is int for x in multiply_sequence(column, 3))
+
+
+def test_operate_on_sequence_numpy_as_array():
+    numpy = pytest.importorskip('numpy')
+    column = [float(x) for x in range(100)]
+    result = multiply_sequence(column, 2.0, as_array=True)
+    assert isinstance(result, numpy.ndarray)
+    assert result.tolist() == [x * 2.0 for x in column]
+
+
+def test_operate_on_sequence_numpy_zero_division():
+    pytest.importorskip('numpy')
+    with pytest.raises(ZeroDivisionError):
+        divide_sequence(list(range(100)), 0)
+
+
+def test_operate_on_sequence_numpy_int_overflow():
+    pytest.importorskip('numpy')
+    column = [2 ** 62] * 100
+    assert multiply_sequence(column, 4) == [2 ** 64] * 100
+
+
+def test_operate_on_sequence_numpy_int64_edges():
+    pytest.importorskip('numpy')
+    low = [-2 ** 63] * 100
+    high = [2 ** 63 - 1] * 100
+    assert multiply_sequence(low, 2) == [-2 ** 64] * 100
+    assert add_to_sequence(low, -1) == [-2 ** 63 - 1] * 100
+    assert add_to_sequence(high, 1) == [2 ** 63] * 100
+    assert subtract_from_sequence(low, high) == [-2 ** 64 + 1] * 100
+
+
+def test_operate_on_sequence_numpy_int64_min_floor_divide():
+    pytest.importorskip('numpy')
+    column = [-2 ** 63] + [1] * 70
+    assert floor_sequence(column, -1) == [2 ** 63] + [-1] * 70
+    assert mod_sequence(column, -1) == [0] * 71
+
+
+def test_operate_on_sequence_without_numpy(monkeypatch):
+    import tinytim.sequences as sequences_functions
+    monkeypatch.setattr(sequences_functions, 'numpy', None)
+    column = list(range(100))
+    assert add_to_sequence(column, 1) == [x + 1 for x in column]
+    with pytest.raises(ImportError):
+        add_to_sequence(column, 1, as_array=True)
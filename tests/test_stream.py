@@ -0,0 +1,117 @@
+import pytest
+
+import tinytim.edit as edit_functions
+import tinytim.stream as stream_functions
+from tinytim.dropna import dropna
+from tinytim.fillna import fillna
+from tinytim.group import aggregate
+from tinytim.isna import NA, isnull
+
+DATA = {
+    'g': ['a', 'b', 'a', None, 'b', 'a', 'c', 'a', None, 'b'],
+    'x': [None, 1, 2, None, None, 5, None, None, 8, None],
+    'y': [1.5, None, None, 3.0, 4.0, None, 6.0, 7.0, None, None]
+}
+
+SIZES = [1, 2, 3, 4, 10, 20]
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_chunked_concat(size):
+    assert stream_functions.concat(stream_functions.chunked(DATA, size)) == DATA
+
+
+def test_concat_fills_missing_columns():
+    chunks = [{'x': [1]}, {'x': [2], 'y': [7]}, {'y': [8]}]
+    results = stream_functions.concat(iter(chunks), missing_value=0)
+    assert results == {'x': [1, 2, 0], 'y': [0, 7, 8]}
+
+
+def test_chunk_rows():
+    rows = [{'x': 1, 'y': 2}, {'x': 3}, {'x': 5, 'y': 6}]
+    results = list(stream_functions.chunk_rows(rows, 2))
+    assert results == [{'x': [1, 3], 'y': [2, None]}, {'x': [5], 'y': [6]}]
+
+
+def test_chunked_size_error():
+    with pytest.raises(ValueError):
+        list(stream_functions.chunked(DATA, 0))
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_filter_edit_isnull(size):
+    chunks = stream_functions.chunked(DATA, size)
+    chunks = stream_functions.filter_by_column_func(chunks, 'g', lambda g: g is not None)
+    chunks = stream_functions.map_chunks(chunks, edit_functions.edit_column, 'g', 0)
+    results = stream_functions.concat(stream_functions.isnull(chunks))
+    assert results['x'] == [True, False, False, True, False, True, True, True]
+    assert results['g'] == [False] * 8
+
+
+@pytest.mark.parametrize('size', SIZES)
+@pytest.mark.parametrize('kwargs', [{}, {'how': 'all'}, {'thresh': 2}, {'subset': ['x']}])
+def test_dropna(size, kwargs):
+    results = stream_functions.concat(stream_functions.dropna(stream_functions.chunked(DATA, size), **kwargs))
+    assert results == dropna(DATA, **kwargs)
+
+
+@pytest.mark.parametrize('size', SIZES)
+@pytest.mark.parametrize('limit', [None, 1, 2, 3])
+def test_forwardfill(size, limit):
+    chunks = stream_functions.chunked(DATA, size)
+    results = stream_functions.concat(stream_functions.fillna(chunks, method='ffill', limit=limit))
+    assert results == fillna(DATA, method='ffill', limit=limit)
+
+
+@pytest.mark.parametrize('size', [1, 2, 3])
+def test_forwardfill_leading_missing_with_missing_values(size):
+    data = {'a': [None, None, 1, None], 'b': [None, None, None, None]}
+    chunks = stream_functions.chunked(data, size)
+    results = stream_functions.concat(stream_functions.forwardfill(chunks, na_value=NA))
+    assert results == {'a': [None, None, 1, 1], 'b': [None, None, None, None]}
+    assert results == fillna(data, method='ffill', na_value=NA)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_backfill(size):
+    chunks = stream_functions.chunked(DATA, size)
+    results = stream_functions.concat(stream_functions.fillna(chunks, method='bfill'))
+    assert results == fillna(DATA, method='bfill')
+
+
+def test_backfill_limit_error():
+    with pytest.raises(ValueError):
+        list(stream_functions.backfill(stream_functions.chunked(DATA, 2), limit=1))
+
+
+@pytest.mark.parametrize('size', SIZES)
+@pytest.mark.parametrize('limit', [None, 1, 3])
+@pytest.mark.parametrize('value', [0, {'x': 0}])
+def test_fill_with_value(size, limit, value):
+    chunks = stream_functions.chunked(DATA, size)
+    results = stream_functions.concat(stream_functions.fillna(chunks, value, limit=limit))
+    assert results == fillna(DATA, value, limit=limit)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_fillna_rows_axis(size):
+    chunks = stream_functions.chunked(DATA, size)
+    results = stream_functions.concat(stream_functions.fillna(chunks, method='ffill', axis=1))
+    assert results == fillna(DATA, method='ffill', axis=1)
+
+
+def test_fillna_value_and_method_error():
+    with pytest.raises(ValueError):
+        stream_functions.fillna(stream_functions.chunked(DATA, 2), 0, method='ffill')
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_aggregate(size):
+    data = stream_functions.concat(stream_functions.dropna(stream_functions.chunked(DATA, size), subset=['g']))
+    chunks = stream_functions.dropna(stream_functions.chunked(DATA, size), subset=['g'])
+    results = stream_functions.aggregate(chunks, 'g', {'y': 'count', 'x': 'nunique'})
+    assert results == aggregate(data, 'g', {'y': 'count', 'x': 'nunique'})
+
+
+def test_isnull_matches_eager():
+    assert stream_functions.concat(stream_functions.isnull(stream_functions.chunked(DATA, 3))) == isnull(DATA)
@@ -11,6 +11,44 @@ def test_uniques():
     assert values == [1, 1, 2, 4, 5, 2, 0, 6, 1]
 
 
+def test_uniques_unhashable():
+    values = [[1], 'a', [1], {'x': 1}, 'a', {'x': 1}, [2]]
+    results = utils_functions.uniques(values)
+    assert results == [[1], 'a', {'x': 1}, [2]]
+
+
+def test_nuniques_unhashable():
+    assert utils_functions.nuniques([[1], [1], 2, 2, 3]) == 3
+
+
+def test_value_counts():
+    values = [1, 1, 2, 4, 2, 1]
+    results = utils_functions.value_counts(values)
+    assert results == [(1, 3), (2, 2), (4, 1)]
+
+
+def test_value_counts_unhashable():
+    values = [[1], 'a', [1], [2], 'a', [1]]
+    results = utils_functions.value_counts(values)
+    assert results == [([1], 3), ('a', 2), ([2], 1)]
+
+
+def test_key_index():
+    index = utils_functions.KeyIndex()
+    assert index.add_all(['a', [1], 'a', {'x': 1}, [1]]) == [0, 1, 0, 2, 1]
+    assert index.keys == ['a', [1], {'x': 1}]
+    assert index.find({'x': 1}) == 2
+    assert index.find('b') is None
+    assert len(index) == 3
+
+
+def test_key_index_identity():
+    sentinel = [0]
+    index = utils_functions.KeyIndex([sentinel], identity=True)
+    assert sentinel in index
+    assert [0] not in index
+
+
 def test_row_value_tuples():
     data = {'x': [1, 2, 3], 'y': [6, 7, 8], 'z': [9, 10, 11]}
     results = utils_functions.row_value_tuples(data, ['x', 'z'])
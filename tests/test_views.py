@@ -0,0 +1,102 @@
+from array import array
+
+import tinytim.data as data_functions
+import tinytim.edit as edit_functions
+import tinytim.filter as filter_functions
+import tinytim.group as group_functions
+from tinytim.views import (
+    ColumnView,
+    column_view,
+    filter_by_columns,
+    filter_by_indexes,
+    filter_by_mask,
+    head,
+    materialize,
+    slice_rows,
+    tail,
+)
+
+DATA = {'x': [1, 2, 3, 4, 5], 'y': ['a', 'b', 'c', 'd', 'e']}
+
+
+def test_column_view_reads_base():
+    base = [10, 20, 30, 40]
+    view = column_view(base, [3, 1])
+    assert len(view) == 2
+    assert view[0] == 40
+    assert view[-1] == 20
+    assert list(view) == [40, 20]
+    assert view == [40, 20]
+    assert view.tolist() == [40, 20]
+    assert view.base is base
+
+
+def test_column_view_copies_on_write():
+    base = [1, 2, 3]
+    view = column_view(base, range(1, 3))
+    view[0] = 99
+    view.append(4)
+    del view[1]
+    assert view == [99, 4]
+    assert base == [1, 2, 3]
+
+
+def test_column_view_slice_is_view():
+    base = list(range(10))
+    view = column_view(base, range(2, 8))
+    sliced = view[1:5:2]
+    assert isinstance(sliced, ColumnView)
+    assert sliced.base is base
+    assert sliced.indexes == range(3, 7, 2)
+    assert sliced == [3, 5]
+
+
+def test_view_of_view_reads_root():
+    base = list(range(10))
+    view = ColumnView(ColumnView(base, [9, 5, 1]), [2, 0])
+    assert view.base is base
+    assert view == [1, 9]
+
+
+def test_head_tail():
+    assert head(DATA, 2) == {'x': [1, 2], 'y': ['a', 'b']}
+    assert tail(DATA, 2) == {'x': [4, 5], 'y': ['d', 'e']}
+    assert data_functions.head(DATA, 2, view=True) == data_functions.head(DATA, 2)
+    assert data_functions.tail(DATA, 2, view=True) == data_functions.tail(DATA, 2)
+    assert isinstance(data_functions.head(DATA, 2, view=True)['x'], ColumnView)
+
+
+def test_head_paging_shares_base():
+    page = tail(head(DATA, 4), 2)
+    assert page == {'x': [3, 4], 'y': ['c', 'd']}
+    assert page['x'].base is DATA['x']
+
+
+def test_slice_rows():
+    assert slice_rows(DATA, 0, None, 2) == {'x': [1, 3, 5], 'y': ['a', 'c', 'e']}
+
+
+def test_filter_views():
+    assert filter_by_indexes(DATA, [4, 0]) == {'x': [5, 1], 'y': ['e', 'a']}
+    assert filter_by_mask(DATA, bytes([1, 0, 0, 0, 1])) == {'x': [1, 5], 'y': ['a', 'e']}
+    assert filter_by_columns(DATA, ['y']) == {'y': ['a', 'b', 'c', 'd', 'e']}
+    assert filter_functions.filter_by_indexes(DATA, [1], view=True) == {'x': [2], 'y': ['b']}
+    assert filter_functions.filter_by_mask(DATA, [False, True, False, False, False], view=True) == {'x': [2], 'y': ['b']}
+    assert filter_functions.filter_by_columns(DATA, ['x'], view=True) == {'x': [1, 2, 3, 4, 5]}
+
+
+def test_views_work_with_table_functions():
+    view = head(DATA, 4)
+    assert filter_functions.filter_by_column_gt(view, 'x', 2) == {'x': [3, 4], 'y': ['c', 'd']}
+    assert group_functions.aggregate(view, 'y', {'x': 'sum'})[1] == {'x': [1, 2, 3, 4]}
+    edit_functions.edit_value_inplace(view, 'x', 0, 100)
+    assert view['x'] == [100, 2, 3, 4]
+    assert DATA['x'] == [1, 2, 3, 4, 5]
+
+
+def test_materialize_keeps_arrays():
+    data = {'x': array('q', [1, 2, 3]), 'y': ['a', 'b', 'c']}
+    result = materialize(head(data, 2))
+    assert result == {'x': array('q', [1, 2]), 'y': ['a', 'b']}
+    assert isinstance(result['x'], array)
+    assert isinstance(result['y'], list)